@@ -3,6 +3,7 @@ from django.contrib.auth.models import User
 from django.contrib.auth.admin import UserAdmin
 
 from .models import Livro, Associado, Emprestimo
+from .services.emprestimos import emprestar, devolver
 
 
 
@@ -75,3 +76,26 @@ class EmprestimoAdmin(admin.ModelAdmin):
         "data_devolucao",
     )
     readonly_fields = ("data_emprestimo",)
+
+    def save_model(self, request, obj, form, change):
+        """Empréstimos e devoluções passam por `services.emprestimos`."""
+        gerente = getattr(request.user, "associado", None)
+
+        if not change:
+            obj.quem_emprestou = obj.quem_emprestou or gerente
+            emprestar(obj)
+            return
+
+        data_devolucao = obj.data_devolucao
+        if data_devolucao and form.initial.get("data_devolucao") is None:
+            # salva os demais campos e registra a devolução pelo serviço
+            obj.data_devolucao = None
+            super().save_model(request, obj, form, change)
+            devolver(
+                obj,
+                quem_devolveu=obj.quem_devolveu or gerente,
+                data_devolucao=data_devolucao,
+            )
+            return
+
+        super().save_model(request, obj, form, change)
@@ -6,4 +6,5 @@ class ApiConfig(AppConfig):
     name = 'api'
     
     def ready(self):
-        import api.signals  # Importa os signals
\ No newline at end of file
+        import api.signals  # Importa os signals
+        import api.checks   # Registra as verificações de sistema
\ No newline at end of file
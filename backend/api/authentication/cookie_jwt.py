@@ -1,10 +1,19 @@
 # api/authentication/cookie_jwt.py
 from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
 from django.conf import settings
 
+from .tokens import UsuarioToken, tem_claims_de_usuario, usuario_ativo
+
 
 class CookieJWTAuthentication(JWTAuthentication):
-    """Reads the JWT access token from an HttpOnly cookie instead of the Authorization header."""
+    """
+    Reads the JWT access token from an HttpOnly cookie instead of the Authorization header.
+
+    With `SIMPLE_JWT["AUTH_STATELESS_USER"] = True` the user is rebuilt from the
+    token claims (`UsuarioToken`) instead of being loaded from `auth_user`;
+    tokens without those claims fall back to the database lookup.
+    """
 
     def authenticate(self, request):
         cookie_name = getattr(settings, "SIMPLE_JWT", {}).get("AUTH_COOKIE", "access_token")
@@ -14,4 +23,21 @@ class CookieJWTAuthentication(JWTAuthentication):
             return None  # No cookie → unauthenticated (not an error)
 
         validated_token = self.get_validated_token(raw_token)
-        return self.get_user(validated_token), validated_token
\ No newline at end of file
+
+        if _stateless_user() and tem_claims_de_usuario(validated_token):
+            return self.get_token_user(validated_token), validated_token
+
+        return self.get_user(validated_token), validated_token
+
+    def get_token_user(self, validated_token):
+        user = UsuarioToken(validated_token)
+
+        # a claim congela o estado da emissão; o cache cobre desativações posteriores
+        if not user.is_active or not usuario_ativo(user.id):
+            raise AuthenticationFailed("User is inactive", code="user_inactive")
+
+        return user
+
+
+def _stateless_user() -> bool:
+    return bool(getattr(settings, "SIMPLE_JWT", {}).get("AUTH_STATELESS_USER", False))
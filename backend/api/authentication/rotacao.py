@@ -0,0 +1,210 @@
+# api/authentication/rotacao.py
+"""
+    Rotação do refresh token em uma única transação.
+
+    `rotacionar(raw)` troca o refresh token `raw` por um novo:
+
+        BEGIN
+        SELECT ... FOR UPDATE   trava a linha do token atual
+        SELECT                  se já está na blacklist, o sucessor (se houver)
+                                e o estado atual do usuário (claims do novo token)
+        WITH ... INSERT         blacklist do atual + outstanding do novo +
+                                `RotacaoRefresh` atual -> novo (1 instrução)
+        COMMIT
+
+    O estado é lido em uma instrução separada, depois do lock: em READ
+    COMMITTED cada instrução enxerga o que foi confirmado antes de ela
+    começar, inclusive a rotação feita por quem segurava o lock.
+
+    Coalescência: várias abas da mesma sessão compartilham os cookies e
+    costumam renovar juntas, possivelmente em workers diferentes. O `FOR
+    UPDATE` serializa essas requisições; a primeira rotaciona e registra o
+    sucessor em `RotacaoRefresh`, e as demais, por até
+    `JWT_REFRESH_COALESCENCIA` segundos, recebem esse mesmo sucessor (lido de
+    `OutstandingToken.token`) em vez de um 401 que derrubaria a sessão.
+"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.utils import timezone
+
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+from api.models import Associado, RotacaoRefresh
+
+from .tokens import AssociadoRefreshToken
+
+
+class _TokenEmRotacao(AssociadoRefreshToken):
+    """A blacklist no banco é conferida sob lock em `rotacionar`, não no construtor."""
+
+    def check_blacklist(self):
+        pass
+
+
+def rotacionar(raw: str) -> AssociadoRefreshToken:
+    """
+    Novo refresh token para `raw`. Levanta `TokenError` se `raw` for
+    inválido, expirado ou revogado (fora da janela de coalescência), ou se o
+    usuário não existir mais / estiver inativo.
+    """
+    atual = _TokenEmRotacao(raw)
+
+    with transaction.atomic():
+        estado = _travar(atual)
+        if estado is None:
+            raise TokenError("Token is invalid or expired")
+
+        token_id, revogado, sucessor, claims = estado
+        if not claims["is_active"]:
+            raise TokenError("User is inactive")
+
+        if revogado:
+            if sucessor is None:
+                raise TokenError("Token is blacklisted")
+            # emitido por este servidor há poucos segundos: dispensa nova verificação
+            return AssociadoRefreshToken(sucessor, verify=False)
+
+        novo = AssociadoRefreshToken()
+        novo[jwt_settings.USER_ID_CLAIM] = atual[jwt_settings.USER_ID_CLAIM]
+        for claim, valor in claims.items():
+            novo[claim] = valor
+
+        _revogar_e_emitir(token_id, novo)
+
+    return novo
+
+
+# --------------------------------------------------------------------------- #
+#  Internal helpers                                                            #
+# --------------------------------------------------------------------------- #
+
+def _janela() -> int:
+    return getattr(settings, "JWT_REFRESH_COALESCENCIA", 30)
+
+
+def _travar(token):
+    """
+    `(id do OutstandingToken, já revogado?, sucessor, claims do usuário)`
+    com a linha do token travada até o fim da transação, ou `None` se o
+    usuário não existir. `sucessor` é o texto do token que substituiu este
+    há no máximo `_janela()` segundos, se ainda não revogado; senão `None`.
+    Tokens sem registro (emitidos antes da blacklist) ganham um.
+    """
+    jti = token[jwt_settings.JTI_CLAIM]
+    user_id = token.get(jwt_settings.USER_ID_CLAIM)
+
+    token_id = _travar_linha(jti)
+    if token_id is None:
+        OutstandingToken.objects.get_or_create(
+            jti=jti,
+            defaults={
+                "user_id": user_id,
+                "token": str(token),
+                "created_at": token.current_time,
+                "expires_at": datetime_from_epoch(token["exp"]),
+            },
+        )
+        token_id = _travar_linha(jti)
+
+    linha = _estado(token_id, user_id)
+    if linha is None or linha[4] is None:  # usuário removido
+        return None
+
+    (revogado, rotacionado_em, sucessor, sucessor_revogado,
+     username, is_active, is_staff, associado_id) = linha
+
+    recente = (
+        rotacionado_em is not None
+        and timezone.now() - rotacionado_em <= timedelta(seconds=_janela())
+    )
+    if not recente or sucessor_revogado:
+        sucessor = None
+
+    return token_id, revogado, sucessor, {
+        "username": username,
+        "is_staff": is_staff,
+        "is_active": is_active,
+        "associado_id": associado_id,
+    }
+
+
+def _travar_linha(jti: str):
+    outstanding = OutstandingToken._meta.db_table
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT id FROM {outstanding} WHERE jti = %s FOR UPDATE",
+            [jti],
+        )
+        linha = cursor.fetchone()
+    return linha[0] if linha else None
+
+
+def _estado(token_id: int, user_id):
+    outstanding = OutstandingToken._meta.db_table
+    blacklisted = BlacklistedToken._meta.db_table
+    rotacoes = RotacaoRefresh._meta.db_table
+    usuarios = get_user_model()._meta.db_table
+    associados = Associado._meta.db_table
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            SELECT b.id IS NOT NULL, r.rotacionado_em, s.token, sb.id IS NOT NULL,
+                   u.username, u.is_active, u.is_staff, a.id
+              FROM {outstanding} AS o
+              LEFT JOIN {blacklisted} AS b ON b.token_id = o.id
+              LEFT JOIN {rotacoes} AS r ON r.anterior_id = o.id
+              LEFT JOIN {outstanding} AS s ON s.id = r.sucessor_id
+              LEFT JOIN {blacklisted} AS sb ON sb.token_id = s.id
+              LEFT JOIN {usuarios} AS u ON u.id = %s
+              LEFT JOIN {associados} AS a ON a.user_id = u.id
+             WHERE o.id = %s
+            """,
+            [user_id, token_id],
+        )
+        return cursor.fetchone()
+
+
+def _revogar_e_emitir(token_id: int, novo: AssociadoRefreshToken) -> None:
+    """
+    Blacklist do token atual, outstanding do novo e o registro da rotação
+    em uma única instrução.
+    """
+    outstanding = OutstandingToken._meta.db_table
+    blacklisted = BlacklistedToken._meta.db_table
+    rotacoes = RotacaoRefresh._meta.db_table
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            WITH revogado AS (
+                INSERT INTO {blacklisted} (token_id, blacklisted_at)
+                VALUES (%s, %s)
+            ), emitido AS (
+                INSERT INTO {outstanding} (jti, token, created_at, expires_at, user_id)
+                VALUES (%s, %s, %s, %s, %s)
+                RETURNING id
+            )
+            INSERT INTO {rotacoes} (anterior_id, sucessor_id, rotacionado_em)
+            SELECT %s, id, %s FROM emitido
+            """,
+            [
+                token_id,
+                novo.current_time,
+                novo[jwt_settings.JTI_CLAIM],
+                str(novo),
+                novo.current_time,
+                datetime_from_epoch(novo["exp"]),
+                novo.get(jwt_settings.USER_ID_CLAIM),
+                token_id,
+                novo.current_time,
+            ],
+        )
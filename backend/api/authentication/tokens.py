@@ -0,0 +1,108 @@
+# api/authentication/tokens.py
+"""
+    Tokens JWT com as claims mínimas do usuário e o usuário "sem banco"
+    reconstruído a partir delas.
+
+    Com `SIMPLE_JWT["AUTH_STATELESS_USER"] = True`, `CookieJWTAuthentication`
+    monta `request.user` a partir das claims do access token em vez de ler
+    `auth_user`. O único estado consultado é "o usuário continua ativo?",
+    respondido por um `TTLCache` do processo (ver `usuario_ativo`).
+
+    A blacklist de refresh tokens fica só no banco: no refresh ela é lida na
+    mesma instrução que trava o token (ver `authentication/rotacao.py`), pelo
+    índice único de `jti`.
+"""
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.utils.functional import cached_property
+
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from api.utils import TTLCache
+
+#   claims copiadas do usuário para o token (além de USER_ID_CLAIM)
+CLAIMS_USUARIO = ("username", "is_staff", "is_active", "associado_id")
+
+_ativos = TTLCache(
+    maxsize=getattr(settings, "JWT_USUARIOS_ATIVOS_CACHE_TAMANHO", 4096),
+    ttl=getattr(settings, "JWT_USUARIOS_ATIVOS_CACHE_TTL", 30),
+)
+
+
+class AssociadoRefreshToken(RefreshToken):
+    """`RefreshToken` cujas claims (e as do access token derivado) descrevem o usuário."""
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        for claim, valor in claims_do_usuario(user).items():
+            token[claim] = valor
+        return token
+
+
+class UsuarioToken(TokenUser):
+    """
+    Usuário reconstruído das claims do access token.
+
+    Expõe o que as views usam de `User` (`id`/`pk`, `username`, `is_staff`,
+    `is_active`, `is_authenticated`) e carrega o `Associado` sob demanda.
+    """
+
+    @cached_property
+    def is_active(self) -> bool:
+        return bool(self.token.get("is_active", False))
+
+    @cached_property
+    def associado_id(self):
+        return self.token.get("associado_id")
+
+    @cached_property
+    def associado(self):
+        from api.models import Associado
+
+        if self.associado_id is None:
+            raise Associado.DoesNotExist("Usuário não vinculado a um associado.")
+        return Associado.objects.select_related("user").get(pk=self.associado_id)
+
+
+# --------------------------------------------------------------------------- #
+#  Helpers                                                                     #
+# --------------------------------------------------------------------------- #
+
+def claims_do_usuario(user) -> dict:
+    from api.models import Associado
+
+    try:
+        associado_id = user.associado.pk
+    except Associado.DoesNotExist:
+        associado_id = None
+
+    return {
+        "username": user.username,
+        "is_staff": user.is_staff,
+        "is_active": user.is_active,
+        "associado_id": associado_id,
+    }
+
+
+def tem_claims_de_usuario(token) -> bool:
+    """Tokens emitidos antes das claims (ou por outro fluxo) voltam ao caminho com banco."""
+    return jwt_settings.USER_ID_CLAIM in token and all(c in token for c in CLAIMS_USUARIO)
+
+
+def usuario_ativo(user_id) -> bool:
+    """
+    `User.is_active`, em cache por alguns segundos. Desativações feitas neste
+    processo valem na hora (`esquecer_usuario`); nos demais, em até um TTL.
+    """
+    def _consultar():
+        return get_user_model().objects.filter(pk=user_id, is_active=True).exists()
+
+    return _ativos.get_or_set(user_id, _consultar)
+
+
+def esquecer_usuario(user_id) -> None:
+    _ativos.discard(user_id)
@@ -0,0 +1,34 @@
+"""
+    `backend/api/checks.py`
+
+    Verificações de sistema (`manage.py check`, executadas também por
+    `migrate` no release_command) específicas da aplicação.
+"""
+
+from django.conf import settings
+from django.core.checks import Error, Tags, register
+
+LOCMEM = "django.core.cache.backends.locmem.LocMemCache"
+
+
+@register(Tags.caches)
+def cache_compartilhado(app_configs, **kwargs):
+    """
+    Os contadores de geração dos snapshots (`services/snapshots.py`) vivem no
+    cache `default`. Em memória local cada worker teria os seus, e os demais
+    serviriam snapshots antigos até o timeout.
+    """
+    backend = settings.CACHES.get("default", {}).get("BACKEND")
+    if settings.DEBUG or backend != LOCMEM:
+        return []
+
+    return [
+        Error(
+            "CACHES['default'] usa memória local com DEBUG desligado.",
+            hint=(
+                "Use um cache compartilhado entre os workers: a tabela do "
+                "DatabaseCache (createcachetable) ou DJANGO_CACHE_DIR."
+            ),
+            id="api.E001",
+        )
+    ]
@@ -0,0 +1,101 @@
+"""
+    `backend/api/filters.py`
+
+    Filter backends da API.
+"""
+
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.db.models import F
+
+import django_filters
+from rest_framework import filters
+from rest_framework.settings import api_settings
+
+from .models import AuditLog
+from .utils.busca import documento_busca, termo_busca
+
+
+class UnaccentSearchFilter(filters.SearchFilter):
+    """
+    Substituto de `SearchFilter` para Postgres: mesmo parâmetro `?search=` e
+    mesmos `search_fields` na view, mas
+
+    - sem acentos e sem diferenciar maiúsculas ("cortico" encontra "Cortiço");
+    - `LIKE '%termo%'` sobre um único documento normalizado, servido pelo
+      índice GIN `gin_trgm_ops` do modelo em vez de um ILIKE por coluna;
+    - resultados ordenados por relevância (`word_similarity`), exceto quando
+      a requisição traz `?ordering=` explícito.
+
+    Cada termo precisa aparecer no documento (E lógico, como em `SearchFilter`).
+    Deve vir depois de `OrderingFilter` em `filter_backends`, para que a
+    ordenação padrão fique como desempate da relevância.
+
+    O documento vem de uma destas opções na view:
+
+    - `search_document_field`: coluna já normalizada e indexada no modelo
+      (ex. `Associado.documento_busca`);
+    - `search_fields`: campos concatenados por `documento_busca()`; o modelo
+      precisa de um índice sobre a mesma expressão (ex. `Livro`).
+    """
+
+    documento_alias = "documento_busca"
+    relevancia_annotation = "relevancia"
+
+    def get_documento(self, view, request):
+        """Expressão do documento; deve ser a mesma do índice do modelo."""
+        campo = getattr(view, "search_document_field", None)
+        if campo:
+            return F(campo)
+
+        campos = self.get_search_fields(view, request)
+        return documento_busca(*campos) if campos else None
+
+    def filter_queryset(self, request, queryset, view):
+        termos = self.get_search_terms(request)
+        if not termos:
+            return queryset
+
+        ordenar = api_settings.ORDERING_PARAM not in request.query_params
+        return self.buscar(queryset, termos, view, request, ordenar=ordenar)
+
+    def buscar(self, queryset, termos, view, request, *, ordenar: bool = True):
+        """Aplica os `termos` a `queryset`; usado também por actions de busca."""
+        documento = self.get_documento(view, request)
+        if documento is None:
+            return queryset
+
+        if isinstance(documento, F):
+            nome = documento.name
+        else:
+            nome = self.documento_alias
+            queryset = queryset.alias(**{nome: documento})
+
+        for termo in termos:
+            queryset = queryset.filter(**{f"{nome}__contains": termo_busca(termo)})
+
+        queryset = queryset.annotate(**{
+            self.relevancia_annotation: TrigramWordSimilarity(
+                termo_busca(" ".join(termos)), nome
+            ),
+        })
+
+        if ordenar:
+            queryset = queryset.order_by(
+                f"-{self.relevancia_annotation}", *queryset.query.order_by
+            )
+
+        return queryset
+
+
+class AuditLogFilter(django_filters.FilterSet):
+    """
+    Filtros de `/api/auditoria/`. `desde` / `ate` (ISO 8601) usam o índice
+    BRIN de `created_at`; recurso e autor usam os índices btree.
+    """
+
+    desde = django_filters.IsoDateTimeFilter(field_name="created_at", lookup_expr="gte")
+    ate = django_filters.IsoDateTimeFilter(field_name="created_at", lookup_expr="lt")
+
+    class Meta:
+        model = AuditLog
+        fields = ["action", "resource_type", "resource_id", "actor_id", "success"]
@@ -0,0 +1,300 @@
+"""
+    `backend/api/log_handlers.py`
+
+    Handlers de logging da API.
+
+    `BoundedQueueHandler` tira a escrita dos logs de auditoria da thread da
+    requisição: `emit()` apenas enfileira o registro (fila limitada) e um
+    `QueueListener` em thread própria o repassa a um logger de destino, cujos
+    handlers (console, arquivo rotativo, ...) fazem a escrita de fato.
+    Configuração em `LOGGING`:
+
+        "handlers": {
+            "audit_queue": {
+                "class": "api.log_handlers.BoundedQueueHandler",
+                "target": "api.audit.sink",   # logger com os handlers reais
+                "maxsize": 10000,
+                "overflow": "drop_oldest",    # ou "drop_new"
+            },
+        },
+        "loggers": {
+            "api.audit":      {"handlers": ["audit_queue"], "propagate": False},
+            "api.audit.sink": {"handlers": ["console", "audit_file"], "propagate": False},
+        }
+
+    Com a fila cheia, o registro mais antigo (ou o novo) é descartado e
+    contado em `descartados`; a requisição nunca espera pelo disco. No
+    encerramento do processo a fila é esvaziada antes do `logging.shutdown()`.
+
+    `CompressingRotatingFileHandler` é o `RotatingFileHandler` do
+    `audit.log`, mas grava cada backup comprimido em blocos (`audit.log.1.gz`,
+    ...), ainda consultável por `manage.py audit_query`
+    (ver `api/services/audit_arquivo.py`).
+
+    `ORJSONFormatter` é o `JsonFormatter` do python-json-logger serializando
+    com `orjson` (UTF-8, sem escapes de não-ASCII); sem `orjson`, ou com
+    `json_indent`, usa a serialização original.
+
+    `DatabaseAuditHandler` acumula os registros de auditoria e os grava na
+    tabela `AuditLog` com um único `bulk_create` por lote — quando o buffer
+    enche (`capacity`) ou a cada `intervalo` segundos, o que vier antes.
+    Se o lote for recusado por uma linha inválida, as linhas são regravadas
+    uma a uma, e só as recusadas se perdem (continuam no `audit.log`).
+"""
+
+import atexit
+import ipaddress
+import logging
+import queue
+import sys
+import threading
+import traceback
+from datetime import datetime, timezone
+from logging.handlers import (
+    BufferingHandler,
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+)
+
+from django.db import DatabaseError, InterfaceError, OperationalError, close_old_connections
+from pythonjsonlogger import jsonlogger
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - dependência opcional
+    orjson = None
+
+_encoder_log = jsonlogger.JsonEncoder()
+
+OVERFLOW_POLICIES = ("drop_oldest", "drop_new")
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    Enfileira o registro (fila limitada, política `overflow` quando cheia) e o
+    entrega ao logger `target` na thread de um `QueueListener`.
+    """
+
+    def __init__(self, target: str, maxsize: int = 10000, overflow: str = "drop_oldest"):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow deve ser um de {OVERFLOW_POLICIES}")
+
+        super().__init__(queue.Queue(maxsize=maxsize))
+        self.target = target
+        self.overflow = overflow
+        self.descartados = 0
+
+        self._listener = None
+        self._lock_listener = threading.Lock()
+        atexit.register(self.stop)
+
+    # ---------------------------------------------------------------------- #
+    #  QueueHandler                                                            #
+    # ---------------------------------------------------------------------- #
+
+    def emit(self, record):
+        self._iniciar()
+        super().emit(record)
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self._transbordar(record)
+
+    def close(self):
+        self.stop()
+        super().close()
+
+    # ---------------------------------------------------------------------- #
+    #  Listener                                                                #
+    # ---------------------------------------------------------------------- #
+
+    def stop(self):
+        """Esvazia a fila nos handlers de destino e encerra o listener."""
+        with self._lock_listener:
+            listener, self._listener = self._listener, None
+        if listener is not None:
+            listener.stop()
+
+    def _iniciar(self):
+        if self._listener is not None:
+            return
+        with self._lock_listener:
+            if self._listener is None:
+                self._listener = QueueListener(self.queue, _Encaminhar(self.target))
+                self._listener.start()
+
+    def _transbordar(self, record):
+        self.descartados += 1
+        if self.descartados == 1 or self.descartados % 1000 == 0:
+            sys.stderr.write(
+                f"BoundedQueueHandler: fila cheia, {self.descartados} registro(s) descartado(s)\n"
+            )
+
+        if self.overflow == "drop_new":
+            return
+        try:
+            self.queue.get_nowait()
+            self.queue.put_nowait(record)
+        except (queue.Empty, queue.Full):
+            pass
+
+
+class CompressingRotatingFileHandler(RotatingFileHandler):
+    """`RotatingFileHandler` que grava cada backup comprimido (`.gz`)."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.namer = _nome_comprimido
+        self.rotator = _rotacionar_comprimindo
+
+
+class ORJSONFormatter(jsonlogger.JsonFormatter):
+    """`JsonFormatter` serializando com `orjson`, com os mesmos fallbacks."""
+
+    def jsonify_log_record(self, log_record):
+        if orjson is None or self.json_indent:
+            return super().jsonify_log_record(log_record)
+        try:
+            return orjson.dumps(
+                log_record,
+                default=self._padrao,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+            ).decode()
+        except orjson.JSONEncodeError:
+            return super().jsonify_log_record(log_record)
+
+    def _padrao(self, obj):
+        # datas, tracebacks, exceções e fallback `str(obj)` do python-json-logger
+        return _encoder_log.default(obj)
+
+
+class DatabaseAuditHandler(BufferingHandler):
+    """
+    Grava os registros de auditoria em `AuditLog`, um `bulk_create` por lote
+    (buffer cheio ou a cada `intervalo` segundos, em thread própria).
+    """
+
+    def __init__(self, capacity: int = 500, intervalo: float = 2.0):
+        super().__init__(capacity)
+        self.intervalo = intervalo
+        self._parar = threading.Event()
+        self._thread = None
+
+    def emit(self, record):
+        if self._thread is None:
+            self._iniciar()
+        super().emit(record)
+
+    def flush(self):
+        with self.lock:
+            lote, self.buffer = self.buffer, []
+        if not lote:
+            return
+
+        # import tardio: o LOGGING é configurado antes do registro dos apps
+        from api.models import AuditLog
+
+        # a conexão desta thread pode ter caído (reinício do banco, timeout ocioso)
+        close_old_connections()
+
+        gravaveis, linhas = [], []
+        for record in lote:
+            try:
+                linhas.append(_registro_para_auditlog(AuditLog, record))
+            except Exception:
+                self.handleError(record)
+            else:
+                gravaveis.append(record)
+        if not linhas:
+            return
+
+        try:
+            AuditLog.objects.bulk_create(linhas)
+        except (OperationalError, InterfaceError):
+            # banco indisponível: regravar linha a linha falharia do mesmo jeito
+            self.handleError(gravaveis[-1])
+        except Exception:
+            # uma linha inválida (constraint, `details` não serializável em
+            # JSON, ...) não pode derrubar o lote inteiro
+            for record, linha in zip(gravaveis, linhas):
+                try:
+                    AuditLog.objects.bulk_create([linha])
+                except Exception:
+                    self.handleError(record)
+
+    def close(self):
+        self._parar.set()
+        super().close()  # grava o que restou no buffer
+
+    def _iniciar(self):
+        with self.lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._gravar_periodicamente,
+                    name="audit-db-flush",
+                    daemon=True,
+                )
+                self._thread.start()
+
+    def _gravar_periodicamente(self):
+        while not self._parar.wait(self.intervalo):
+            try:
+                self.flush()
+            except Exception:
+                # ex. `close_old_connections()` falhando: a thread segue viva
+                if logging.raiseExceptions:
+                    traceback.print_exc(file=sys.stderr)
+
+
+def _registro_para_auditlog(modelo, record):
+    resource_id = getattr(record, "resource_id", None)
+    return modelo(
+        created_at=datetime.fromtimestamp(record.created, tz=timezone.utc),
+        action=getattr(record, "action", ""),
+        resource_type=getattr(record, "resource_type", ""),
+        resource_id=None if resource_id is None else str(resource_id),
+        actor_id=getattr(record, "actor_id", None),
+        actor=getattr(record, "actor", "") or "",
+        ip=_ip_valido(getattr(record, "ip", None)),
+        user_agent=getattr(record, "user_agent", "") or "",
+        request_id=getattr(record, "request_id", None) or "",
+        success=getattr(record, "success", True),
+        message=record.getMessage(),
+        diff=getattr(record, "diff", None),
+        details=getattr(record, "details", None),
+    )
+
+
+def _ip_valido(valor):
+    """`valor` normalizado, ou `None` se não for um IP (`GenericIPAddressField`)."""
+    if not valor:
+        return None
+    try:
+        ip = ipaddress.ip_address(str(valor).strip())
+    except ValueError:
+        return None
+    return None if getattr(ip, "scope_id", None) else str(ip)
+
+
+def _nome_comprimido(nome: str) -> str:
+    return f"{nome}.gz"
+
+
+def _rotacionar_comprimindo(origem: str, destino: str):
+    from api.services.audit_arquivo import compactar
+
+    compactar(origem, destino)
+
+
+class _Encaminhar(logging.Handler):
+    """Entrega, na thread do listener, o registro ao logger de destino."""
+
+    def __init__(self, nome_logger: str):
+        super().__init__()
+        self.logger = logging.getLogger(nome_logger)
+
+    def emit(self, record):
+        self.logger.handle(record)
@@ -0,0 +1,163 @@
+"""
+    `backend/api/management/commands/audit_query.py`
+
+    Busca nos arquivos de auditoria (`logs/audit.log` e backups rotacionados,
+    comprimidos ou não) usando os índices de `services.audit_arquivo`.
+
+    Uso:
+        python manage.py audit_query --resource-type emprestimo --resource-id 4512
+        python manage.py audit_query --actor-id 3 --desde 2026-10-01 --ate 2026-10-08
+        python manage.py audit_query --action DELETE --contar
+        python manage.py audit_query --compactar       # comprime backups antigos
+        python manage.py audit_query --replay          # importa para AuditLog
+
+    A saída é um registro JSON por linha, em ordem cronológica.
+
+    `--replay` grava os registros encontrados na tabela `AuditLog`, apenas
+    os anteriores ao registro mais antigo já presente — ou seja, completa o
+    histórico anterior à gravação em banco sem duplicar linhas.
+"""
+
+import json
+from datetime import datetime
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from api.models import AuditLog
+from api.services import audit_arquivo
+
+LOTE_REPLAY = 1000
+
+
+class Command(BaseCommand):
+    help = "Consulta (e reimporta) os registros dos arquivos de auditoria."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--resource-type", help="ex.: livro, emprestimo, associado")
+        parser.add_argument("--resource-id", help="Exige --resource-type.")
+        parser.add_argument("--actor-id", type=int)
+        parser.add_argument("--action", help="ex.: CREATE, DEVOLUCAO")
+        parser.add_argument("--desde", help="Data/hora ISO 8601 (inclusiva).")
+        parser.add_argument("--ate", help="Data/hora ISO 8601 (exclusiva).")
+        parser.add_argument(
+            "--limite",
+            type=int,
+            default=0,
+            help="Número máximo de registros exibidos (0 exibe todos).",
+        )
+        parser.add_argument(
+            "--arquivo",
+            default=settings.LOGGING["handlers"]["audit_file"]["filename"],
+            help="Arquivo de auditoria ativo (padrão: o handler audit_file).",
+        )
+        parser.add_argument(
+            "--contar",
+            action="store_true",
+            help="Exibe apenas o número de registros encontrados.",
+        )
+        parser.add_argument(
+            "--compactar",
+            action="store_true",
+            help="Comprime os backups rotacionados ainda em texto e sai.",
+        )
+        parser.add_argument(
+            "--replay",
+            action="store_true",
+            help="Grava na tabela AuditLog os registros anteriores ao mais antigo dela.",
+        )
+
+    def handle(self, *args, **options):
+        base = Path(options["arquivo"])
+
+        if options["compactar"]:
+            self._compactar(base)
+            return
+
+        try:
+            registros = audit_arquivo.consultar(
+                base,
+                resource_type=options["resource_type"],
+                resource_id=options["resource_id"],
+                actor_id=options["actor_id"],
+                action=options["action"],
+                desde=_asctime(options["desde"]),
+                ate=_asctime(options["ate"]),
+            )
+            if options["replay"]:
+                self._replay(registros)
+                return
+
+            total = 0
+            for registro in registros:
+                total += 1
+                if not options["contar"]:
+                    self.stdout.write(json.dumps(registro, ensure_ascii=False))
+                if options["limite"] and total >= options["limite"]:
+                    break
+        except ValueError as exc:
+            raise CommandError(str(exc))
+
+        if options["contar"]:
+            self.stdout.write(str(total))
+
+    def _compactar(self, base: Path):
+        for caminho in audit_arquivo.segmentos(base):
+            if caminho == base or caminho.suffix == ".gz":
+                continue
+            destino = audit_arquivo.compactar(caminho)
+            self.stdout.write(self.style.SUCCESS(f"{caminho.name} -> {destino.name}"))
+
+    def _replay(self, registros):
+        mais_antigo = (
+            AuditLog.objects.order_by("created_at").values_list("created_at", flat=True).first()
+        )
+
+        lote, total = [], 0
+        for registro in registros:
+            instancia = _auditlog(registro)
+            if mais_antigo and instancia.created_at >= mais_antigo:
+                break
+            lote.append(instancia)
+            if len(lote) >= LOTE_REPLAY:
+                total += len(AuditLog.objects.bulk_create(lote))
+                lote = []
+        if lote:
+            total += len(AuditLog.objects.bulk_create(lote))
+
+        self.stdout.write(self.style.SUCCESS(f"{total} registro(s) gravado(s) em AuditLog."))
+
+
+def _asctime(valor):
+    """ISO 8601 -> `asctime` do arquivo (horário local, como o formatter)."""
+    if not valor:
+        return None
+    try:
+        data = datetime.fromisoformat(valor)
+    except ValueError:
+        raise CommandError(f"Data inválida: {valor!r}")
+    if timezone.is_aware(data):
+        data = timezone.localtime(data).replace(tzinfo=None)
+    return audit_arquivo.asctime(data)
+
+
+def _auditlog(registro: dict) -> AuditLog:
+    criado = datetime.strptime(registro["asctime"], audit_arquivo.FORMATO_ASCTIME)
+    resource_id = registro.get("resource_id")
+    return AuditLog(
+        created_at=timezone.make_aware(criado),
+        action=registro.get("action", ""),
+        resource_type=registro.get("resource_type", ""),
+        resource_id=None if resource_id is None else str(resource_id),
+        actor_id=registro.get("actor_id"),
+        actor=registro.get("actor") or "",
+        ip=registro.get("ip") or None,
+        user_agent=registro.get("user_agent") or "",
+        request_id=registro.get("request_id") or "",
+        success=registro.get("success", True),
+        message=registro.get("message", ""),
+        diff=registro.get("diff"),
+        details=registro.get("details"),
+    )
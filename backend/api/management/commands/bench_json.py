@@ -0,0 +1,141 @@
+"""
+    `backend/api/management/commands/bench_json.py`
+
+    Compara a serialização JSON de uma página de `/api/emprestimos/` com o
+    `JSONRenderer` / `JSONParser` do DRF e com `ORJSONRenderer` /
+    `ORJSONParser` (ver `api/renderers.py`).
+
+    A página é montada como na listagem: `EmprestimoLeituraSerializer` sobre
+    as linhas de `values()` (ver `api/serializers/Leitura.py`), no envelope de
+    `PageNumberPagination`. Com `--sintetico` as linhas são geradas em memória
+    (não precisa de banco).
+
+    Uso:
+        python manage.py bench_json                       # 1000 empréstimos do banco
+        python manage.py bench_json --sintetico --linhas 1000 --repeticoes 200
+
+    Saída: mediana e p95 (ms) de cada etapa e a confirmação de que os dois
+    renderers produzem exatamente os mesmos bytes para esta página (que não
+    tem floats; ver `api/renderers.py`).
+"""
+
+import statistics
+import time
+from datetime import date, timedelta
+from io import BytesIO
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Model
+
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from api.models import Associado, Emprestimo, Livro
+from api.parsers import ORJSONParser
+from api.renderers import ORJSONRenderer
+from api.serializers import EmprestimoLeituraSerializer, EmprestimoSerializer
+from api.views.Emprestimo import EmprestimoViewSet
+
+
+class Command(BaseCommand):
+    help = "Benchmark de JSONRenderer/JSONParser vs. orjson em uma página de empréstimos."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--linhas", type=int, default=1000, help="Empréstimos na página.")
+        parser.add_argument("--repeticoes", type=int, default=100, help="Amostras por etapa.")
+        parser.add_argument(
+            "--sintetico",
+            action="store_true",
+            help="Gera os empréstimos em memória em vez de lê-los do banco.",
+        )
+
+    def handle(self, *args, **options):
+        linhas, repeticoes = options["linhas"], options["repeticoes"]
+
+        if options["sintetico"]:
+            emprestimos = [_linha(emprestimo) for emprestimo in _emprestimos_sinteticos(linhas)]
+        else:
+            queryset = EmprestimoLeituraSerializer.preparar(EmprestimoViewSet().get_queryset())
+            emprestimos = list(queryset[:linhas])
+            if not emprestimos:
+                raise CommandError("Nenhum empréstimo no banco; use --sintetico.")
+
+        resultados = EmprestimoLeituraSerializer(emprestimos, many=True).data
+        pagina = {"count": len(resultados), "next": None, "previous": None, "results": resultados}
+
+        padrao, rapido = JSONRenderer(), ORJSONRenderer()
+        corpo = padrao.render(pagina)
+        if rapido.render(pagina) != corpo:
+            raise CommandError("ORJSONRenderer produziu bytes diferentes do JSONRenderer.")
+
+        self.stdout.write(
+            f"{len(resultados)} empréstimos, {len(corpo) / 1024:.1f} KiB, {repeticoes} repetições"
+        )
+        self.stdout.write(f"{'etapa':<30}  {'mediana (ms)':>12}  {'p95 (ms)':>9}")
+
+        etapas = [
+            ("serializer (values -> dict)", lambda: EmprestimoLeituraSerializer(emprestimos, many=True).data),
+            ("JSONRenderer", lambda: padrao.render(pagina)),
+            ("ORJSONRenderer", lambda: rapido.render(pagina)),
+            ("JSONParser", lambda: JSONParser().parse(BytesIO(corpo))),
+            ("ORJSONParser", lambda: ORJSONParser().parse(BytesIO(corpo))),
+        ]
+        for nome, funcao in etapas:
+            tempos = _medir(funcao, repeticoes)
+            p95 = statistics.quantiles(tempos, n=20)[-1] if len(tempos) > 1 else tempos[0]
+            self.stdout.write(f"{nome:<30}  {statistics.median(tempos):>12.2f}  {p95:>9.2f}")
+
+        self.stdout.write(self.style.SUCCESS("Saída idêntica nos dois renderers."))
+
+
+def _medir(funcao, repeticoes) -> list[float]:
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append((time.perf_counter() - inicio) * 1000)
+    return tempos
+
+
+def _emprestimos_sinteticos(quantidade: int) -> list[Emprestimo]:
+    """Empréstimos não salvos, com as relações que o serializer percorre."""
+    gerente = Associado(id=1, user=User(id=1, username="gerente", first_name="Gerente"))
+    hoje = date.today()
+
+    emprestimos = []
+    for i in range(quantidade):
+        associado = Associado(
+            id=i + 2,
+            user=User(id=i + 2, username=f"associado{i}", first_name="Associado", last_name=f"Nº {i}"),
+        )
+        livro = Livro(id=f"L{i:05d}", titulo=f"O Cortiço — volume {i}", autor="Aluísio Azevedo", ano=1890)
+        emprestimo = Emprestimo(
+            id=i + 1,
+            livro=livro,
+            associado=associado,
+            data_emprestimo=hoje - timedelta(days=i % 30),
+            data_prevista=hoje + timedelta(days=14 - i % 30),
+            data_devolucao=hoje if i % 3 == 0 else None,
+            quem_emprestou=gerente,
+            quem_devolveu=gerente if i % 3 == 0 else None,
+        )
+        emprestimos.append(emprestimo)
+    return emprestimos
+
+
+def _linha(emprestimo: Emprestimo) -> dict:
+    """A linha de `values()` que `EmprestimoLeituraSerializer.preparar` leria do banco."""
+    referencia = EmprestimoSerializer()
+    linha = {}
+    for nome, coluna in EmprestimoLeituraSerializer.colunas().items():
+        if not isinstance(coluna, str):
+            # expressão SQL: o mesmo valor do método do serializer de referência
+            linha[nome] = getattr(referencia, f"get_{nome}")(emprestimo)
+            continue
+        valor = emprestimo
+        for parte in coluna.split("__"):
+            valor = None if valor is None else getattr(valor, parte)
+        # chaves estrangeiras chegam do `values()` como a pk
+        linha[nome] = valor.pk if isinstance(valor, Model) else valor
+    return linha
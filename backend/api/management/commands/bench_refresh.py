@@ -0,0 +1,130 @@
+"""
+    `backend/api/management/commands/bench_refresh.py`
+
+    Mede a latência de `POST /api/auth/refresh/` conforme as tabelas de
+    blacklist crescem.
+
+    Em cada marco (ex. 0, 100 mil, 1 milhão de rotações), o comando completa
+    as tabelas com tokens rotacionados sintéticos (bulk insert de
+    `OutstandingToken` + `BlacklistedToken`) e executa `--amostras` refreshes
+    reais pela view. Por padrão tudo roda em uma transação desfeita ao final.
+    Use apenas em um banco de benchmark.
+
+    Uso:
+        python manage.py bench_refresh --username gerente
+        python manage.py bench_refresh --username gerente --marcos 0,1000000,5000000
+
+    Saída: uma linha por marco com mediana e p95 (ms). Com o índice de `jti`
+    (UNIQUE) e `token_id` (UNIQUE), as duas colunas devem ficar estáveis.
+"""
+
+import statistics
+import time
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test import RequestFactory
+from django.utils import timezone
+
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+from api.authentication.tokens import AssociadoRefreshToken
+from api.views.Auth import RefreshView
+
+LOTE_INSERCAO = 10_000
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "Benchmark do refresh de tokens com milhões de rotações na blacklist."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--username", required=True, help="Usuário dono dos tokens.")
+        parser.add_argument(
+            "--marcos",
+            default="0,100000,1000000",
+            help="Totais de rotações sintéticas em que medir, separados por vírgula.",
+        )
+        parser.add_argument("--amostras", type=int, default=200, help="Refreshes por marco.")
+        parser.add_argument(
+            "--manter",
+            action="store_true",
+            help="Confirma a transação (mantém os tokens sintéticos no banco).",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            user = get_user_model().objects.get(username=options["username"])
+        except get_user_model().DoesNotExist:
+            raise CommandError(f"Usuário '{options['username']}' não encontrado.")
+
+        marcos = sorted(int(m) for m in options["marcos"].split(","))
+
+        try:
+            with transaction.atomic():
+                self._executar(user, marcos, options["amostras"])
+                if not options["manter"]:
+                    raise _Rollback
+        except _Rollback:
+            self.stdout.write("Transação desfeita; nenhum token sintético foi mantido.")
+
+    # ---------------------------------------------------------------------- #
+    #  Private helpers                                                         #
+    # ---------------------------------------------------------------------- #
+
+    def _executar(self, user, marcos, amostras):
+        view = RefreshView.as_view()
+        fabrica = RequestFactory()
+        cookie = settings.SIMPLE_JWT.get("AUTH_COOKIE_REFRESH", "refresh_token")
+
+        self.stdout.write(f"{'rotações':>12}  {'mediana (ms)':>12}  {'p95 (ms)':>9}")
+        inseridos = 0
+        for marco in marcos:
+            inseridos += self._preencher(user, marco - inseridos)
+
+            tempos = []
+            token = str(AssociadoRefreshToken.for_user(user))
+            for _ in range(amostras):
+                request = fabrica.post("/api/auth/refresh/")
+                request.COOKIES[cookie] = token
+
+                inicio = time.perf_counter()
+                response = view(request)
+                tempos.append((time.perf_counter() - inicio) * 1000)
+
+                if response.status_code != 200:
+                    raise CommandError(f"Refresh falhou com status {response.status_code}.")
+                token = response.cookies[cookie].value
+
+            p95 = statistics.quantiles(tempos, n=20)[-1] if len(tempos) > 1 else tempos[0]
+            self.stdout.write(f"{marco:>12}  {statistics.median(tempos):>12.2f}  {p95:>9.2f}")
+
+    def _preencher(self, user, quantidade: int) -> int:
+        """Insere `quantidade` rotações sintéticas já na blacklist."""
+        agora = timezone.now()
+        expira = agora + settings.SIMPLE_JWT.get("REFRESH_TOKEN_LIFETIME", timedelta(days=7))
+        feitos = 0
+
+        while feitos < quantidade:
+            n = min(LOTE_INSERCAO, quantidade - feitos)
+            tokens = OutstandingToken.objects.bulk_create(
+                OutstandingToken(
+                    user=user,
+                    jti=uuid.uuid4().hex,
+                    token="bench",
+                    created_at=agora,
+                    expires_at=expira,
+                )
+                for _ in range(n)
+            )
+            BlacklistedToken.objects.bulk_create(BlacklistedToken(token=t) for t in tokens)
+            feitos += n
+
+        return feitos
@@ -0,0 +1,97 @@
+"""
+    `backend/api/management/commands/prune_tokens.py`
+
+    Remove refresh tokens expirados das tabelas de blacklist do simplejwt e
+    as janelas vencidas dos contadores de tentativas de login.
+
+    Uso:
+        python manage.py prune_tokens                  # remove em lotes de 5000
+        python manage.py prune_tokens --dry-run        # apenas conta
+        python manage.py prune_tokens --lote 20000
+        python manage.py prune_tokens --intervalo 86400  # repete a cada 24 h
+
+    Em produção roda no process group `manutencao` do fly.toml, com
+    `--intervalo`. Fora do Fly, agende uma execução diária (cron, systemd
+    timer), ex.:
+        15 3 * * *  cd /app/backend && python manage.py prune_tokens
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connection
+
+from api.services.audit_log import audit_log
+from api.services.tentativas_login import podar_expirados
+from api.services.tokens import LOTE_PADRAO, podar_tokens_expirados
+
+
+class Command(BaseCommand):
+    help = (
+        "Remove OutstandingToken / BlacklistedToken expirados, em lotes, e os "
+        "contadores de login vencidos."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Apenas conta os tokens expirados, sem alterar o banco.",
+        )
+        parser.add_argument(
+            "--lote",
+            type=int,
+            default=LOTE_PADRAO,
+            help="Número de tokens removidos por transação.",
+        )
+        parser.add_argument(
+            "--intervalo",
+            type=int,
+            default=0,
+            help="Repete a poda a cada N segundos, sem terminar (0 executa uma vez).",
+        )
+
+    def handle(self, *args, **options):
+        intervalo = options["intervalo"]
+        if not intervalo or options["dry_run"]:
+            self._podar(options)
+            return
+
+        while True:
+            close_old_connections()
+            try:
+                self._podar(options)
+            except Exception as exc:
+                # uma falha (ex. banco reiniciando) não encerra o agendamento
+                self.stderr.write(self.style.ERROR(f"prune_tokens falhou: {exc}"))
+            finally:
+                # nenhuma conexão ociosa aberta durante a espera
+                connection.close()
+            time.sleep(intervalo)
+
+    def _podar(self, options):
+        dry_run = options["dry_run"]
+        resultado = podar_tokens_expirados(lote=options["lote"], dry_run=dry_run)
+
+        resumo = (
+            f"{resultado['outstanding']} outstanding / "
+            f"{resultado['blacklisted']} blacklisted"
+        )
+
+        if dry_run:
+            self.stdout.write(self.style.WARNING(f"[dry-run] seriam removidos: {resumo}."))
+            return
+
+        contadores = podar_expirados()
+
+        if resultado["outstanding"]:
+            audit_log(
+                action="DELETE",
+                resource_type="token",
+                message=f"prune_tokens removeu {resumo}",
+                details=resultado,
+            )
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Removidos: {resumo}; {contadores} contadores de login."
+        ))
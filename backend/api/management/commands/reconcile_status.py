@@ -0,0 +1,67 @@
+"""
+    `backend/api/management/commands/reconcile_status.py`
+
+    Corrige o `Livro.status` de todo o catálogo a partir dos empréstimos ativos.
+
+    Uso:
+        python manage.py reconcile_status              # aplica as correções
+        python manage.py reconcile_status --dry-run    # apenas lista as divergências
+"""
+
+from django.core.management.base import BaseCommand
+
+from api.services.audit_log import audit_log
+from api.services.consistencia import reconciliar_catalogo
+
+
+class Command(BaseCommand):
+    help = "Reconcilia Livro.status com os empréstimos ativos em um único UPDATE."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Apenas lista as divergências, sem alterar o banco.",
+        )
+        parser.add_argument(
+            "--limite",
+            type=int,
+            default=50,
+            help="Número máximo de alterações exibidas (0 exibe todas).",
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options["dry_run"]
+        limite = options["limite"]
+
+        resultado = reconciliar_catalogo(dry_run=dry_run)
+        alteracoes = resultado["alteracoes"]
+
+        exibidas = alteracoes if limite == 0 else alteracoes[:limite]
+        for alteracao in exibidas:
+            self.stdout.write(
+                f"{alteracao['id']}: {alteracao['status_anterior']} -> {alteracao['status_novo']}"
+            )
+        if len(exibidas) < len(alteracoes):
+            self.stdout.write(f"... e mais {len(alteracoes) - len(exibidas)} livro(s).")
+
+        for transicao, total in sorted(resultado["transicoes"].items()):
+            self.stdout.write(f"{transicao}: {total}")
+
+        if dry_run:
+            self.stdout.write(
+                self.style.WARNING(f"[dry-run] {resultado['corrigidos']} livro(s) seriam corrigidos.")
+            )
+            return
+
+        if resultado["corrigidos"]:
+            audit_log(
+                action="CONSISTENCIA",
+                resource_type="livro",
+                message=f"reconcile_status corrigiu {resultado['corrigidos']} livro(s)",
+                details={"transicoes": resultado["transicoes"]},
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(f"{resultado['corrigidos']} livro(s) corrigidos.")
+        )
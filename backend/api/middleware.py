@@ -0,0 +1,52 @@
+"""
+    `backend/api/middleware.py`
+
+    Middlewares da API.
+"""
+
+from __future__ import annotations
+
+from django.db import models
+from django.utils.functional import SimpleLazyObject
+
+from .models import Associado
+
+
+class AssociadoMiddleware:
+    """
+    Expõe `request.associado`: o `Associado` do usuário autenticado (com
+    `user` em `select_related`), ou `None` — carregado na primeira vez em que
+    for usado e nunca mais de uma vez por requisição.
+
+    A resolução é preguiçosa porque o DRF autentica dentro da view: quando o
+    valor é lido ali, `request.user` já é o usuário do JWT. Endpoints que não
+    usam o associado não pagam a query. Como o valor é um objeto preguiçoso,
+    teste com `if not request.associado`, não com `is None`.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.associado = SimpleLazyObject(lambda: carregar_associado(request.user))
+        return self.get_response(request)
+
+
+def carregar_associado(user) -> Associado | None:
+    """
+    Uma query (`Associado` + `User`). O resultado fica também no cache do
+    acessor `user.associado`, para que nenhum outro ponto repita a busca.
+    """
+    if user is None or not user.is_authenticated:
+        return None
+
+    associado_id = getattr(user, "associado_id", None)  # usuário sem banco (claims do JWT)
+    filtro = {"pk": associado_id} if associado_id is not None else {"user_id": user.pk}
+    associado = Associado.objects.select_related("user").filter(**filtro).first()
+
+    if isinstance(user, models.Model):
+        Associado._meta.get_field("user").remote_field.set_cached_value(user, associado)
+    elif associado is not None:
+        user.__dict__["associado"] = associado  # cached_property de UsuarioToken
+
+    return associado
@@ -0,0 +1,17 @@
+# Generated by Django 6.0.3 on 2026-10-18 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0020_delete_auditlog'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='emprestimo',
+            constraint=models.UniqueConstraint(condition=models.Q(('data_devolucao__isnull', True)), fields=('livro',), name='emprestimo_livro_ativo_unico'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 6.0.3 on 2026-10-18 11:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0021_emprestimo_livro_ativo_unico'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='emprestimo',
+            index=models.Index(fields=['data_emprestimo', 'id'], name='emprestimo_data_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='emprestimo',
+            index=models.Index(condition=models.Q(('data_devolucao__isnull', True)), fields=['data_emprestimo', 'id'], name='emprestimo_ativo_data_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='livro',
+            index=models.Index(fields=['titulo', 'id'], name='livro_titulo_id_idx'),
+        ),
+    ]
@@ -0,0 +1,72 @@
+# Generated by Django 6.0.3 on 2026-10-18 11:40
+#
+# Índices de `api_emprestimo` alinhados às consultas reais.
+#
+# Removidos (duplicados ou sem consulta da aplicação que os use):
+#   api_emprest_data_de_8ab5fe_idx          (data_devolucao)  — baixa seletividade;
+#                                           as consultas de ativos usam os parciais
+#   api_emprest_data_pr_1fe63c_idx          (data_prevista)   — substituído pelo parcial
+#   api_emprest_associa_5ea552_idx          (associado_id)    — duplicava o índice da FK
+#   api_emprestimo_associado_id_ca66299c    (associado_id)    — índice da FK, coberto
+#                                           pelo prefixo de (associado_id, data_emprestimo)
+#   api_emprestimo_livro_id_65e45598        (livro_id)        — duplicava o índice de Meta
+#   api_emprestimo_livro_id_65e45598_like   (livro_id varchar_pattern_ops) — nenhum LIKE
+#
+# Consulta -> índice pensado para ela:
+#
+#   atrasados  WHERE data_devolucao IS NULL AND data_prevista < $1
+#     emprestimo_ativo_prevista_idx
+#   histórico do associado  WHERE associado_id = $1 ORDER BY data_emprestimo DESC
+#     emprestimo_associado_data_idx
+#   ativo do livro  WHERE livro_id = $1 AND data_devolucao IS NULL
+#     emprestimo_livro_ativo_unico (0021)
+#   listagem / ativos  ORDER BY data_emprestimo DESC, id DESC LIMIT n
+#     emprestimo_data_id_idx / emprestimo_ativo_data_id_idx (0022)
+#
+# Os planos não foram medidos: este repositório não tem uma base de
+# benchmark. Para validar, rode `EXPLAIN (ANALYZE, BUFFERS) <consulta>;` com o
+# volume real antes e depois de aplicar esta migração.
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0022_keyset_pagination_indexes'),
+    ]
+
+    operations = [
+        # novos índices antes de remover os antigos
+        migrations.AddIndex(
+            model_name='emprestimo',
+            index=models.Index(fields=['associado', 'data_emprestimo'], name='emprestimo_associado_data_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='emprestimo',
+            index=models.Index(condition=models.Q(('data_devolucao__isnull', True)), fields=['data_prevista'], name='emprestimo_ativo_prevista_idx'),
+        ),
+        migrations.RemoveIndex(
+            model_name='emprestimo',
+            name='api_emprest_data_de_8ab5fe_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='emprestimo',
+            name='api_emprest_data_pr_1fe63c_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='emprestimo',
+            name='api_emprest_associa_5ea552_idx',
+        ),
+        migrations.AlterField(
+            model_name='emprestimo',
+            name='associado',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.PROTECT, related_name='emprestimos', to='api.associado'),
+        ),
+        migrations.AlterField(
+            model_name='emprestimo',
+            name='livro',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.PROTECT, related_name='emprestimos', to='api.livro'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 6.0.3 on 2026-10-18 12:20
+
+import api.utils.busca
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import TrigramExtension, UnaccentExtension
+from django.db import migrations, models
+
+
+#   unaccent() é STABLE e não pode ser usada em índices; o invólucro fixa o
+#   dicionário e é declarado IMMUTABLE (ver `api/utils/busca.py`)
+CREATE_F_UNACCENT = """
+CREATE OR REPLACE FUNCTION public.f_unaccent(text) RETURNS text
+    LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+    AS $$ SELECT public.unaccent('public.unaccent'::regdictionary, $1) $$;
+"""
+
+DROP_F_UNACCENT = "DROP FUNCTION IF EXISTS public.f_unaccent(text);"
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0023_emprestimo_indices_consultas'),
+    ]
+
+    operations = [
+        UnaccentExtension(),
+        TrigramExtension(),
+        migrations.RunSQL(CREATE_F_UNACCENT, reverse_sql=DROP_F_UNACCENT),
+        migrations.AddIndex(
+            model_name='livro',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(api.utils.busca.FUnaccent(django.db.models.functions.text.Lower(django.db.models.functions.text.Concat('titulo', models.Value(' '), 'autor', output_field=models.CharField()))), name='gin_trgm_ops'), name='livro_busca_trgm_idx'),
+        ),
+    ]
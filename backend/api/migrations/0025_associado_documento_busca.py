@@ -0,0 +1,36 @@
+# Generated by Django 6.0.3 on 2026-10-18 13:05
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+#   mesmo documento de `services.busca.atualizar_documento_associados`
+PREENCHER_DOCUMENTO = """
+UPDATE api_associado AS a
+   SET documento_busca = public.f_unaccent(lower(
+           u.username || ' ' || u.email || ' ' || u.first_name || ' ' || u.last_name
+           || ' ' || a.telefone
+       ))
+  FROM auth_user AS u
+ WHERE u.id = a.user_id;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0024_livro_busca_unaccent_trgm'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='associado',
+            name='documento_busca',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.RunSQL(PREENCHER_DOCUMENTO, reverse_sql=migrations.RunSQL.noop),
+        migrations.AddIndex(
+            model_name='associado',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['documento_busca'], name='associado_busca_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+    ]
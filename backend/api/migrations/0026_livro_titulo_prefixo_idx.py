@@ -0,0 +1,20 @@
+# Generated by Django 6.0.3 on 2026-10-18 13:40
+
+import api.utils.busca
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0025_associado_documento_busca'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='livro',
+            index=models.Index(django.contrib.postgres.indexes.OpClass(api.utils.busca.FUnaccent(django.db.models.functions.text.Lower('titulo')), name='text_pattern_ops'), name='livro_titulo_prefixo_idx'),
+        ),
+    ]
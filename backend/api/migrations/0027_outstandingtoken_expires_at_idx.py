@@ -0,0 +1,22 @@
+# Generated by Django 6.0.3 on 2026-10-18 14:30
+#
+# `prune_tokens` apaga tokens por `expires_at < agora` em lotes; sem índice,
+# cada lote seria uma varredura completa de token_blacklist_outstandingtoken.
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0026_livro_titulo_prefixo_idx'),
+        ('token_blacklist', '__latest__'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            "CREATE INDEX IF NOT EXISTS outstandingtoken_expires_at_idx "
+            "ON token_blacklist_outstandingtoken (expires_at);",
+            reverse_sql="DROP INDEX IF EXISTS outstandingtoken_expires_at_idx;",
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 6.0.3 on 2026-10-18 11:55
+#
+# Recria `api_auditlog` (removida em 0020) como tabela append-only, alimentada
+# em lotes por `api.log_handlers.DatabaseAuditHandler`.
+
+import django.contrib.postgres.indexes
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0027_outstandingtoken_expires_at_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AuditLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('action', models.CharField(max_length=50)),
+                ('resource_type', models.CharField(max_length=50)),
+                ('resource_id', models.CharField(blank=True, max_length=64, null=True)),
+                ('actor_id', models.IntegerField(blank=True, null=True)),
+                ('actor', models.CharField(blank=True, default='', max_length=150)),
+                ('ip', models.GenericIPAddressField(blank=True, null=True)),
+                ('user_agent', models.TextField(blank=True, default='')),
+                ('request_id', models.CharField(blank=True, default='', max_length=64)),
+                ('success', models.BooleanField(default=True)),
+                ('message', models.TextField(blank=True, default='')),
+                ('diff', models.JSONField(blank=True, null=True)),
+                ('details', models.JSONField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'Registro de auditoria',
+                'verbose_name_plural': 'Registros de auditoria',
+                'ordering': ['-id'],
+                'indexes': [django.contrib.postgres.indexes.BrinIndex(fields=['created_at'], name='auditlog_created_brin'), models.Index(fields=['resource_type', 'resource_id'], name='auditlog_recurso_idx'), models.Index(fields=['actor_id'], name='auditlog_actor_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 6.0.3 on 2026-10-18 15:10
+#
+# Sucessor de cada refresh token rotacionado, lido pelos refreshes
+# concorrentes do mesmo token (ver `api/authentication/rotacao.py`).
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0028_auditlog_append_only'),
+        ('token_blacklist', '0013_alter_blacklistedtoken_options_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RotacaoRefresh',
+            fields=[
+                ('anterior', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='+', serialize=False, to='token_blacklist.outstandingtoken')),
+                ('rotacionado_em', models.DateTimeField()),
+                ('sucessor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='token_blacklist.outstandingtoken')),
+            ],
+            options={
+                'verbose_name': 'Rotação de refresh token',
+                'verbose_name_plural': 'Rotações de refresh token',
+            },
+        ),
+    ]
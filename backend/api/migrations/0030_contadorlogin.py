@@ -0,0 +1,30 @@
+# Generated by Django 6.0.3 on 2026-10-18 16:20
+#
+# Contadores de tentativas de login com incremento atômico no banco
+# (ver `api/services/tentativas_login.py`).
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0029_rotacaorefresh'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ContadorLogin',
+            fields=[
+                ('chave', models.CharField(max_length=100, primary_key=True, serialize=False)),
+                ('total', models.BigIntegerField(default=0)),
+                ('expira_em', models.DateTimeField(blank=True, null=True)),
+                ('bloqueado_ate', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'Contador de login',
+                'verbose_name_plural': 'Contadores de login',
+                'indexes': [models.Index(fields=['expira_em'], name='contadorlogin_expira_idx')],
+            },
+        ),
+    ]
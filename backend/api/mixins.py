@@ -0,0 +1,195 @@
+"""
+    `backend/api/mixins.py`
+
+    Mixins para os ViewSets da API.
+"""
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Case, IntegerField, Value, When
+
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+
+class CamposEsparsosMixin:
+    """
+    `?fields=id,titulo` / `?omit=autor` em requisições GET.
+
+    Os campos pedidos vão para o contexto do serializer (`context["campos"]`,
+    ver `CamposDinamicosMixin` e `ValuesSerializer`) e também reduzem a
+    consulta: `only()` com as colunas desses campos e `select_related`
+    apenas das relações que eles percorrem. Campos sem coluna direta
+    (`SerializerMethodField`) declaram o que leem em `campos_consulta`.
+
+    Sem os parâmetros — ou em escritas — a resposta é a completa.
+    """
+
+    #   campo de saída -> lookups que ele lê (quando não há `source` direto)
+    campos_consulta = {}
+
+    def campos_pedidos(self) -> list | None:
+        """Campos pedidos, na ordem do serializer, ou `None` (todos)."""
+        if not hasattr(self, "_campos_pedidos"):
+            self._campos_pedidos = self._ler_campos()
+        return self._campos_pedidos
+
+    def campo_pedido(self, nome: str) -> bool:
+        campos = self.campos_pedidos()
+        return campos is None or nome in campos
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        campos = self.campos_pedidos()
+        if campos is not None:
+            context["campos"] = campos
+        return context
+
+    def filter_queryset(self, queryset):
+        return self.planejar_consulta(super().filter_queryset(queryset))
+
+    def planejar_consulta(self, queryset):
+        """`only()` / `select_related` restritos aos campos pedidos."""
+        campos = self.campos_pedidos()
+        if campos is None:
+            return queryset
+
+        disponiveis = self._campos_disponiveis()
+        lookups = []
+        for nome in campos:
+            if nome in self.campos_consulta:
+                lookups.extend(self.campos_consulta[nome])
+            elif disponiveis[nome].source != "*":
+                lookups.append(disponiveis[nome].source.replace(".", "__"))
+
+        # colunas da ordenação: usadas pelo cursor de `KeysetPagination`
+        for item in queryset.query.order_by:
+            if isinstance(item, str):
+                nome = item.lstrip("-")
+                if nome not in queryset.query.annotations and nome != "pk":
+                    lookups.append(nome)
+
+        relacoes = {lookup.rsplit("__", 1)[0] for lookup in lookups if "__" in lookup}
+        return queryset.select_related(None).select_related(*relacoes).only(*lookups)
+
+    def _ler_campos(self):
+        request = getattr(self, "request", None)
+        if request is None or request.method not in ("GET", "HEAD"):
+            return None
+
+        fields = request.query_params.get("fields")
+        omit = request.query_params.get("omit")
+        if not fields and not omit:
+            return None
+
+        disponiveis = self._campos_disponiveis()
+        pedidos = _nomes(fields) if fields else list(disponiveis)
+        omitidos = _nomes(omit)
+
+        desconhecidos = [nome for nome in pedidos + omitidos if nome not in disponiveis]
+        if desconhecidos:
+            raise ValidationError({
+                "fields": f"Campos desconhecidos: {', '.join(desconhecidos)}."
+            })
+
+        return [nome for nome in disponiveis if nome in pedidos and nome not in omitidos]
+
+    def _campos_disponiveis(self) -> dict:
+        campos = self.get_serializer_class()().fields
+        return {nome: campo for nome, campo in campos.items() if not campo.write_only}
+
+
+class LeituraRapidaMixin:
+    """
+    Serve as listagens de `leitura_actions` com `leitura_serializer_class`
+    (um `ValuesSerializer`, ver `api/serializers/Leitura.py`): o queryset
+    vira `values()` e nenhuma instância de modelo é criada. As demais ações
+    usam o serializer normal da view; a saída JSON é a mesma.
+    """
+
+    leitura_serializer_class = None
+    leitura_actions = ("list",)
+
+    def list(self, request, *args, **kwargs):
+        return self._paginated_response(self.filter_queryset(self.get_queryset()))
+
+    def serializar_lista(self, queryset):
+        """Dados de todo o `queryset`, sem paginação, pelo mesmo caminho."""
+        queryset, serializer_class, context = self._preparar_leitura(queryset)
+        return serializer_class(queryset, many=True, context=context).data
+
+    def _paginated_response(self, queryset):
+        queryset, serializer_class, context = self._preparar_leitura(queryset)
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(serializer_class(page, many=True, context=context).data)
+        return Response(serializer_class(queryset, many=True, context=context).data)
+
+    def _preparar_leitura(self, queryset):
+        context = self.get_serializer_context()
+        if self.leitura_serializer_class is not None and self.action in self.leitura_actions:
+            serializer_class = self.leitura_serializer_class
+            queryset = serializer_class.preparar(queryset, context.get("campos"))
+        else:
+            serializer_class = self.get_serializer_class()
+        return queryset, serializer_class, context
+
+
+class LoteIdsMixin:
+    """
+    `GET /api/<recurso>/?ids=001,002,003-A`: vários registros em uma única
+    consulta (`pk IN (...)`), na ordem pedida, sem paginação e com no máximo
+    `ids_limite` ids por chamada.
+
+    Resposta: `{"results": [...], "nao_encontrados": [...]}` — ids
+    inexistentes ou fora do alcance do usuário (mesmo `get_queryset()` e
+    filtros da listagem). Aceita `?fields=` / `?omit=`.
+
+    Deve vir antes de `LeituraRapidaMixin` nas bases da view, de quem usa
+    `serializar_lista()`.
+    """
+
+    ids_param = "ids"
+    ids_limite = 100
+
+    def list(self, request, *args, **kwargs):
+        if self.ids_param in request.query_params:
+            return self.lote(request)
+        return super().list(request, *args, **kwargs)
+
+    def lote(self, request):
+        ids = self._ler_ids(request)
+
+        # ORDER BY CASE pk WHEN id1 THEN 0 WHEN id2 THEN 1 ... : ordem pedida
+        ordem = Case(
+            *[When(pk=valor, then=Value(posicao)) for posicao, valor in enumerate(ids)],
+            output_field=IntegerField(),
+        )
+        queryset = self.filter_queryset(self.get_queryset()).filter(pk__in=ids)
+        dados = self.serializar_lista(queryset.order_by(ordem))
+
+        nao_encontrados = []
+        if len(dados) < len(ids):
+            encontrados = set(queryset.values_list("pk", flat=True))
+            nao_encontrados = [valor for valor in ids if valor not in encontrados]
+
+        return Response({"results": dados, "nao_encontrados": nao_encontrados})
+
+    def _ler_ids(self, request) -> list:
+        ids = list(dict.fromkeys(_nomes(request.query_params.get(self.ids_param))))
+        if not ids:
+            raise ValidationError({self.ids_param: "Informe ao menos um id."})
+        if len(ids) > self.ids_limite:
+            raise ValidationError({
+                self.ids_param: f"No máximo {self.ids_limite} ids por requisição."
+            })
+
+        pk = self.get_queryset().model._meta.pk
+        try:
+            return list(dict.fromkeys(pk.to_python(valor) for valor in ids))
+        except DjangoValidationError:
+            raise ValidationError({self.ids_param: "Id inválido."})
+
+
+def _nomes(valor) -> list:
+    return [nome.strip() for nome in (valor or "").split(",") if nome.strip()]
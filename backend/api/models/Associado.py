@@ -4,8 +4,9 @@
     `Associado` é o perfil estendido de um usuário (`Django.models.User`) da sala de leitura. Armazena informações específicas da sua aplicação que não existem no User padrão.
 
 
-    @version: 2.0
+    @version: 2.1
 """
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from django.conf import settings
 from django.contrib.auth.models import User
@@ -34,10 +35,21 @@ class Associado(models.Model):
         verbose_name="Telefone"
     )
 
+    # documento de busca desnormalizado (username, e-mail, nome, telefone),
+    # minúsculo e sem acentos; mantido por `services.busca`
+    documento_busca = models.TextField(default="", blank=True, editable=False)
+
     class Meta:
         verbose_name = "Associado"
         verbose_name_plural = "Associados"
         ordering = ['user__first_name']
+        indexes = [
+            GinIndex(
+                fields=["documento_busca"],
+                opclasses=["gin_trgm_ops"],
+                name="associado_busca_trgm_idx",
+            ),
+        ]
 
     def save(self, *args, **kwargs):
         super().save(*args, **kwargs)
@@ -1,65 +1,87 @@
 """
     `backend/api/models/AuditLog.py`, log de ações do sistema
-    
-    Logs para auditoria de ações do sistema
+
+    Tabela *append-only* com os eventos do logger `api.audit`, gravados em
+    lotes por `api.log_handlers.DatabaseAuditHandler` (`bulk_create`) e
+    consultados em `/api/auditoria/`.
+
+    Registros nunca são alterados nem removidos pela aplicação: `save()` de
+    uma instância existente, `delete()` e `update()`/`delete()` em querysets
+    levantam `PermissionDenied`.
+
+    @version: 2.0
 """
 
+from django.contrib.postgres.indexes import BrinIndex
+from django.core.exceptions import PermissionDenied
 from django.db import models
-from django.contrib.auth.models import User
+from django.utils import timezone
+
+
+class AuditLogQuerySet(models.QuerySet):
+
+    def update(self, **kwargs):
+        raise PermissionDenied("AuditLog é append-only.")
+
+    def delete(self):
+        raise PermissionDenied("AuditLog é append-only.")
+
 
 class AuditLog(models.Model):
     """
-        Log de ações do sistema
+        Evento de auditoria (uma linha por chamada a `audit_log()`).
     """
-    class Action(models.TextChoices):
-        """
-            Enumeração de ações possíveis para o sistema de auditoria
-        """
-        #   Autenticação de usuário
-        LOGIN = "LOGIN"
-        LOGOUT = "LOGOUT"
-        LOGIN_FAILED = "LOGIN_FAILED"
-
-        #   Transformações sobre objetos
-        CREATE = "CREATE"
-        UPDATE = "UPDATE"
-        DELETE = "DELETE"
-        
-        #   Diagnósticos sobre objetos
-        CONSISTENCIA = "CONSISTENCIA"
-
-        #   Funções sobre objetos `Emprestimo`
-        EMPRESTIMO = "EMPRESTIMO"
-        DEVOLUCAO = "DEVOLUCAO"
-
-    #   usuário que realizou a ação
-    user = models.ForeignKey(
-        User,
-        null=True,
-        blank=True,
-        on_delete=models.SET_NULL
-    )
-
-    #   ação realizada
-    action = models.CharField(max_length=50, choices=Action.choices)
-
-    #   dados da ação
-    resource_type = models.CharField(max_length=50, null=True, blank=True)
-    resource_id = models.PositiveIntegerField(null=True, blank=True)
-
-    ip_address = models.GenericIPAddressField(null=True, blank=True)
-    user_agent = models.TextField(null=True, blank=True)
+    #   momento do evento (do registro de log, não da gravação do lote)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    #   ação realizada: "CREATE", "UPDATE", "EMPRESTIMO", ...
+    action = models.CharField(max_length=50)
+
+    #   recurso afetado; `resource_id` é texto porque `Livro` tem chave textual
+    resource_type = models.CharField(max_length=50)
+    resource_id = models.CharField(max_length=64, null=True, blank=True)
+
+    #   autor da ação; sem FK para não travar inserções nem perder o
+    #   histórico quando o usuário for removido
+    actor_id = models.IntegerField(null=True, blank=True)
+    actor = models.CharField(max_length=150, blank=True, default="")
+
+    #   contexto da requisição
+    ip = models.GenericIPAddressField(null=True, blank=True)
+    user_agent = models.TextField(blank=True, default="")
+    request_id = models.CharField(max_length=64, blank=True, default="")
 
     success = models.BooleanField(default=True)
-    message = models.TextField(null=True, blank=True)
+    message = models.TextField(blank=True, default="")
 
     diff = models.JSONField(null=True, blank=True)
+    details = models.JSONField(null=True, blank=True)
+
+    objects = AuditLogQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = "Registro de auditoria"
+        verbose_name_plural = "Registros de auditoria"
+        ordering = ["-id"]
+        indexes = [
+            # linhas chegam em ordem de `created_at`: BRIN é minúsculo e
+            # atende filtros por intervalo de datas
+            BrinIndex(fields=["created_at"], name="auditlog_created_brin"),
+            models.Index(fields=["resource_type", "resource_id"], name="auditlog_recurso_idx"),
+            models.Index(fields=["actor_id"], name="auditlog_actor_idx"),
+        ]
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            raise PermissionDenied("AuditLog é append-only.")
+        super().save(*args, **kwargs)
 
-    created_at = models.DateTimeField(auto_now_add=True)
+    def delete(self, *args, **kwargs):
+        raise PermissionDenied("AuditLog é append-only.")
 
     def __str__(self):
         """
         Retorna uma representação textual do log, com formato:
         "<timestamp> | <usuário> | <ação>"
         """
-        return f"{self.created_at} | {self.user} | {self.action}"
\ No newline at end of file
+        return f"{self.created_at} | {self.actor or '-'} | {self.action}"
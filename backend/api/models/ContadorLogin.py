@@ -0,0 +1,41 @@
+"""
+    `backend/api/models/ContadorLogin.py`, contadores de tentativas de login
+
+    Uma linha por escopo de backoff (IP ou username, em hash) e por métrica
+    agregada (falhas, bloqueadas, sucessos). Mantida por
+    `services.tentativas_login`, que incrementa `total` com um único
+    `INSERT ... ON CONFLICT DO UPDATE ... RETURNING` — atômico entre workers,
+    ao contrário do `incr` (get + set) dos backends de cache.
+
+    @version: 1.0
+"""
+
+from django.db import models
+
+
+class ContadorLogin(models.Model):
+    """
+        Contador com janela fixa: `total` volta a 1 na primeira falha depois
+        de `expira_em`. Métricas agregadas não expiram (`expira_em` nulo).
+    """
+    #   ex. "falhas:usuario:<sha1>", "metricas:sucessos"
+    chave = models.CharField(max_length=100, primary_key=True)
+
+    total = models.BigIntegerField(default=0)
+
+    #   fim da janela de contagem; nulo = não expira
+    expira_em = models.DateTimeField(null=True, blank=True)
+
+    #   escopo recusado pelo backoff até este instante
+    bloqueado_ate = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "Contador de login"
+        verbose_name_plural = "Contadores de login"
+        indexes = [
+            # poda das janelas vencidas (`podar_expirados`)
+            models.Index(fields=["expira_em"], name="contadorlogin_expira_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.chave} = {self.total}"
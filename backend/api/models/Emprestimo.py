@@ -1,10 +1,11 @@
 """
     `backend/api/models/Emprestimo.py`
 
-    @version: 1.3
+    @version: 1.7
 """
 from datetime import timedelta
 from django.db import models
+from django.db.models import Q
 from django.core.exceptions import ValidationError
 from django.utils.timezone import now
 
@@ -14,22 +15,50 @@ from .Associado import Associado
 
 class Emprestimo(models.Model):
     class Meta:
+        # Índices casados com as consultas reais (ver migração 0023).
+        # `livro_id WHERE data_devolucao IS NULL` já é coberto pelo índice
+        # parcial único `emprestimo_livro_ativo_unico`.
         indexes = [
-            models.Index(fields=["data_devolucao"]),
-            models.Index(fields=["data_prevista"]),
-            models.Index(fields=["livro"]),
-            models.Index(fields=["associado"]),
+            # FK `livro` (histórico do livro, checagem do PROTECT)
+            models.Index(fields=["livro"], name="api_emprest_livro_i_931d17_idx"),
+            # histórico do associado em ordem de data; serve também à FK
+            models.Index(fields=["associado", "data_emprestimo"], name="emprestimo_associado_data_idx"),
+            # atrasados: data_devolucao IS NULL AND data_prevista < hoje
+            models.Index(
+                fields=["data_prevista"],
+                condition=Q(data_devolucao__isnull=True),
+                name="emprestimo_ativo_prevista_idx",
+            ),
+            # ORDER BY -data_emprestimo, -id (listagem e paginação keyset)
+            models.Index(fields=["data_emprestimo", "id"], name="emprestimo_data_id_idx"),
+            # ativos: data_devolucao IS NULL ORDER BY -data_emprestimo, -id
+            models.Index(
+                fields=["data_emprestimo", "id"],
+                condition=Q(data_devolucao__isnull=True),
+                name="emprestimo_ativo_data_id_idx",
+            ),
+        ]
+        constraints = [
+            # no máximo um empréstimo ativo (sem devolução) por livro
+            models.UniqueConstraint(
+                fields=["livro"],
+                condition=Q(data_devolucao__isnull=True),
+                name="emprestimo_livro_ativo_unico",
+            ),
         ]
 
+    #   índices declarados em Meta.indexes (evita os índices duplicados da FK)
     livro = models.ForeignKey(
         Livro,
         on_delete=models.PROTECT,
         related_name="emprestimos",
+        db_index=False,
     )
     associado = models.ForeignKey(
         Associado,
         on_delete=models.PROTECT,
         related_name="emprestimos",
+        db_index=False,
     )
     data_emprestimo = models.DateField(auto_now_add=True)
 
@@ -63,64 +92,23 @@ class Emprestimo(models.Model):
 
     def clean(self):
         """
-        Validação ANTES da criação.
+        Validação ANTES da criação, usada por formulários (ex.: admin).
 
-        usa select_for_update() para travar o livro e evitar
-        race condition entre dois empréstimos simultâneos do mesmo livro.
-        Deve ser chamado dentro de uma transação atômica (o save() garante isso).
+        Não trava o livro: a exclusividade do empréstimo ativo é garantida pelo
+        índice parcial único `emprestimo_livro_ativo_unico` no momento do INSERT.
+        As operações de empréstimo ficam em `api/services/emprestimos.py`.
         """
-        if self._state.adding:
-            from django.db import transaction
-
-            # Trava o registro do livro para leitura exclusiva até o fim da transação
-            livro_locked = (
-                Livro.objects.select_for_update()
+        if self._state.adding and self.livro_id:
+            indisponivel = (
+                Livro.objects
                 .filter(pk=self.livro_id)
-                .first()
+                .exclude(status=Livro.Status.DISPONIVEL)
+                .exists()
             )
-
-            if livro_locked is None:
-                raise ValidationError("Livro não encontrado.")
-
-            # Dupla verificação: status E existência de empréstimo ativo
-            emprestimo_ativo = Emprestimo.objects.filter(
-                livro=livro_locked,
-                data_devolucao__isnull=True,
-            ).exists()
-
-            if emprestimo_ativo or livro_locked.status != Livro.Status.DISPONIVEL:
+            if indisponivel:
                 raise ValidationError(
                     f"O livro [{self.livro_id}] já está emprestado ou indisponível."
                 )
 
-    def save(self, *args, **kwargs):
-        from django.db import transaction
-
-        is_novo = self.pk is None
-
-        # Executa tudo dentro de uma transação para que o select_for_update
-        # no clean() seja efetivo — sem transação, o lock não funciona
-        with transaction.atomic():
-            self.full_clean()
-            super().save(*args, **kwargs)
-
-            if is_novo:
-                # Atualiza status do livro para EMPRESTADO
-                Livro.objects.filter(pk=self.livro_id).update(
-                    status=Livro.Status.EMPRESTADO
-                )
-
-            elif self.data_devolucao:
-                # Se não há mais empréstimos ativos, libera o livro
-                ainda_ativo = Emprestimo.objects.filter(
-                    livro_id=self.livro_id,
-                    data_devolucao__isnull=True,
-                ).exclude(pk=self.pk).exists()
-
-                if not ainda_ativo:
-                    Livro.objects.filter(pk=self.livro_id).update(
-                        status=Livro.Status.DISPONIVEL
-                    )
-
     def __str__(self):
         return f"Empréstimo #{self.id}"
\ No newline at end of file
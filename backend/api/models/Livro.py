@@ -17,18 +17,55 @@
     - `DOADO`, se o livro foi doado; ou
     - `PERDIDO`, se o livro foi perdido
     
-    @version: 1.1
+    @version: 1.5
 """
 
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
-from django.db.models import Q
+from django.db.models import Q, Exists, OuterRef
 from datetime import date
 
+from ..utils.busca import documento_busca, normalizar
+
+
+class LivroQuerySet(models.QuerySet):
+    """
+        QuerySet de `Livro` com anotações calculadas no próprio banco.
+    """
+
+    def com_disponibilidade(self):
+        """
+        Anota cada livro com `tem_emprestimo_ativo`, um subquery `EXISTS` sobre
+        os empréstimos sem devolução. A listagem inteira resolve a disponibilidade
+        em uma única query, em vez de uma query por livro.
+        """
+        from .Emprestimo import Emprestimo
+
+        ativos = Emprestimo.objects.filter(
+            livro=OuterRef("pk"),
+            data_devolucao__isnull=True,
+        )
+        return self.annotate(tem_emprestimo_ativo=Exists(ativos))
+
 
 class Livro(models.Model):
+    objects = LivroQuerySet.as_manager()
+
     class Meta:
         indexes = [
             models.Index(fields=["status"]),
+            # paginação keyset: ORDER BY titulo, id
+            models.Index(fields=["titulo", "id"], name="livro_titulo_id_idx"),
+            # busca sem acentos: `?search=` (ver `api/filters.UnaccentSearchFilter`)
+            GinIndex(
+                OpClass(documento_busca("titulo", "autor"), name="gin_trgm_ops"),
+                name="livro_busca_trgm_idx",
+            ),
+            # autocomplete: prefixo do título sem acentos (LIKE 'x%')
+            models.Index(
+                OpClass(normalizar("titulo"), name="text_pattern_ops"),
+                name="livro_titulo_prefixo_idx",
+            ),
         ]
 
     class Status(models.TextChoices):
@@ -66,27 +103,22 @@ class Livro(models.Model):
     def pode_ser_emprestado(self) -> bool:
         """
         Regra de negócio explícita para determinar se um livro pode ser emprestado.
+
+        Usa a anotação `tem_emprestimo_ativo` (ver `LivroQuerySet.com_disponibilidade`)
+        quando presente; caso contrário, consulta o banco para este único livro.
         """
-        print(f"DEBUG pode_ser_emprestado() - Livro: {self.id}, Status: {self.status}")
-        
-        # Primeiro verifica o status
         if self.status != Livro.Status.DISPONIVEL:
-            print(f"DEBUG pode_ser_emprestado() - Status não é DISPONIVEL")
             return False
-        
-        # Verifica empréstimos ativos
-        from .Emprestimo import Emprestimo
-        emprestimos_ativos = Emprestimo.objects.filter(
-            livro=self,
-            data_devolucao__isnull=True
-        )
-        
-        if emprestimos_ativos.exists():
-            print(f"DEBUG pode_ser_emprestado() - Tem {emprestimos_ativos.count()} empréstimo(s) ativo(s)")
-            return False
-        
-        print(f"✅ DEBUG pode_ser_emprestado() - Pode ser emprestado")
-        return True
+
+        tem_emprestimo_ativo = getattr(self, "tem_emprestimo_ativo", None)
+        if tem_emprestimo_ativo is None:
+            from .Emprestimo import Emprestimo
+            tem_emprestimo_ativo = Emprestimo.objects.filter(
+                livro=self,
+                data_devolucao__isnull=True
+            ).exists()
+
+        return not tem_emprestimo_ativo
     
     def get_emprestimo_ativo(self):
         """
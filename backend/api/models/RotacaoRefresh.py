@@ -0,0 +1,48 @@
+"""
+    `backend/api/models/RotacaoRefresh.py`, sucessores de refresh tokens
+
+    Cada rotação de refresh token (`authentication.rotacao.rotacionar`) grava
+    aqui o par token anterior -> sucessor, na mesma instrução que revoga o
+    anterior. Refreshes concorrentes do mesmo token (várias abas, em qualquer
+    worker) leem o sucessor desta tabela, depois de esperar pelo lock da
+    linha do token anterior, em vez de receberem 401.
+
+    Não guarda o token em si: o texto do sucessor já está em
+    `OutstandingToken.token`. As linhas saem junto com os tokens expirados
+    (`services.tokens.podar_tokens_expirados`).
+
+    @version: 1.0
+"""
+
+from django.db import models
+
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+
+
+class RotacaoRefresh(models.Model):
+    """
+        Rotação de um refresh token: qual token o substituiu e quando.
+    """
+    #   token rotacionado (a linha travada por `SELECT ... FOR UPDATE`)
+    anterior = models.OneToOneField(
+        OutstandingToken,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="+",
+    )
+
+    #   token emitido no lugar do anterior
+    sucessor = models.ForeignKey(
+        OutstandingToken,
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+
+    rotacionado_em = models.DateTimeField()
+
+    class Meta:
+        verbose_name = "Rotação de refresh token"
+        verbose_name_plural = "Rotações de refresh token"
+
+    def __str__(self):
+        return f"{self.anterior_id} -> {self.sucessor_id}"
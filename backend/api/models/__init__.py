@@ -1,3 +1,6 @@
 from .Associado import Associado
 from .Livro import Livro
 from .Emprestimo import Emprestimo
+from .AuditLog import AuditLog
+from .RotacaoRefresh import RotacaoRefresh
+from .ContadorLogin import ContadorLogin
@@ -0,0 +1,198 @@
+"""
+    `backend/api/pagination.py`
+
+    Classes de paginação da API.
+
+    `PageNumberOrKeysetPagination` mantém a paginação por número de página
+    (`?page=`) como padrão e ativa a paginação por cursor (keyset) quando a
+    requisição traz `?cursor=` — vazio na primeira página, e depois o valor
+    devolvido em `next` / `previous`.
+
+    A paginação keyset não executa `COUNT(*)` nem `OFFSET`: cada página é um
+    `WHERE (ordenação) > (última linha vista) ... LIMIT n`, servido pelos
+    índices compostos de `Emprestimo` e `Livro`, de modo que páginas
+    profundas custam o mesmo que a primeira. A ordenação da view (incluindo
+    `?ordering=`) recebe `id` como desempate, o que torna o cursor estável.
+"""
+
+import base64
+import binascii
+import json
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models import Q
+
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+from .serializers.Leitura import CHAVE_PK
+
+
+class KeysetPagination(BasePagination):
+    """
+    Paginação por cursor sobre a ordenação do queryset + desempate por `id`.
+
+    Resposta: `{"next": url | null, "previous": url | null, "results": [...]}`.
+    """
+
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Cursor inválido."
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = api_settings.PAGE_SIZE
+        self.campos = _ordenacao_com_desempate(queryset)
+        self.pk = queryset.model._meta.pk.name
+
+        cursor = self._decodificar_cursor(request)
+        reverso = bool(cursor and cursor["r"])
+        campos = [(nome, not desc) for nome, desc in self.campos] if reverso else self.campos
+
+        queryset = queryset.order_by(*[f"-{nome}" if desc else nome for nome, desc in campos])
+        if cursor:
+            queryset = queryset.filter(_filtro_keyset(campos, cursor["v"]))
+
+        resultados = list(queryset[: self.page_size + 1])
+        tem_mais = len(resultados) > self.page_size
+        resultados = resultados[: self.page_size]
+
+        if reverso:
+            resultados.reverse()
+            self.has_next, self.has_previous = True, tem_mais
+        else:
+            self.has_next, self.has_previous = tem_mais, cursor is not None
+
+        self.page = resultados
+        return resultados
+
+    def get_paginated_response(self, data):
+        return Response({
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        })
+
+    def get_next_link(self):
+        if not (self.has_next and self.page):
+            return None
+        return self._link(self.page[-1], reverso=False)
+
+    def get_previous_link(self):
+        if not (self.has_previous and self.page):
+            return None
+        return self._link(self.page[0], reverso=True)
+
+    # ---------------------------------------------------------------------- #
+    #  Cursor                                                                  #
+    # ---------------------------------------------------------------------- #
+
+    def _link(self, instancia, *, reverso: bool) -> str:
+        cursor = {
+            "o": [f"-{nome}" if desc else nome for nome, desc in self.campos],
+            "v": [_valor(instancia, nome, self.pk) for nome, _ in self.campos],
+            "r": reverso,
+        }
+        codificado = base64.urlsafe_b64encode(
+            json.dumps(cursor, default=str, separators=(",", ":")).encode()
+        ).decode()
+        return replace_query_param(
+            self.request.build_absolute_uri(), self.cursor_query_param, codificado
+        )
+
+    def _decodificar_cursor(self, request):
+        """`None` na primeira página; levanta `NotFound` para cursores inválidos."""
+        bruto = request.query_params.get(self.cursor_query_param)
+        if not bruto:
+            return None
+
+        try:
+            cursor = json.loads(base64.urlsafe_b64decode(bruto.encode()).decode())
+            ordenacao = [f"-{nome}" if desc else nome for nome, desc in self.campos]
+            if cursor["o"] != ordenacao or len(cursor["v"]) != len(self.campos):
+                raise ValueError("ordenação diferente da página anterior")
+            cursor["r"] = bool(cursor.get("r"))
+        except (binascii.Error, UnicodeDecodeError, ValueError, KeyError, TypeError):
+            raise NotFound(self.invalid_cursor_message)
+
+        return cursor
+
+
+class PageNumberOrKeysetPagination(PageNumberPagination):
+    """
+    `PageNumberPagination` por padrão; `KeysetPagination` quando a requisição
+    traz o parâmetro `?cursor=`.
+    """
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = None
+        if KeysetPagination.cursor_query_param in request.query_params:
+            self.keyset = KeysetPagination()
+            return self.keyset.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+
+# --------------------------------------------------------------------------- #
+#  Internal helpers                                                            #
+# --------------------------------------------------------------------------- #
+
+def _ordenacao_com_desempate(queryset) -> list[tuple[str, bool]]:
+    """
+    Lista `(campo, descendente)` da ordenação do queryset, terminando em `id`
+    na mesma direção da última coluna (para aproveitar o mesmo índice).
+    """
+    ordenacao = list(queryset.query.order_by) or list(queryset.model._meta.ordering)
+    pk = queryset.model._meta.pk.name
+
+    campos = []
+    for item in ordenacao:
+        if not isinstance(item, str) or item == "?":
+            raise ImproperlyConfigured(
+                "KeysetPagination só suporta ordenação por nomes de campo."
+            )
+        nome = item.lstrip("-")
+        campos.append((pk if nome == "pk" else nome, item.startswith("-")))
+
+    if not any(nome == pk for nome, _ in campos):
+        campos.append((pk, campos[-1][1] if campos else False))
+
+    return campos
+
+
+def _filtro_keyset(campos: list[tuple[str, bool]], valores: list) -> Q:
+    """
+    `(c1, c2, ...) > (v1, v2, ...)` respeitando a direção de cada coluna,
+    expandido em ORs. O limite redundante sobre a primeira coluna permite ao
+    Postgres iniciar a varredura do índice diretamente no cursor.
+    """
+    filtro = Q()
+    for i, (nome, desc) in enumerate(campos):
+        condicao = Q(**{f"{nome}__{'lt' if desc else 'gt'}": valores[i]})
+        for anterior, valor in zip(campos[:i], valores[:i]):
+            condicao &= Q(**{anterior[0]: valor})
+        filtro |= condicao
+
+    primeiro, desc = campos[0]
+    return Q(**{f"{primeiro}__{'lte' if desc else 'gte'}": valores[0]}) & filtro
+
+
+def _valor(instancia, campo: str, pk: str):
+    """
+    Valor de `campo` (ex.: 'livro__titulo') na instância, seguindo relações,
+    ou na linha de `values()` — onde a pk está em `CHAVE_PK`
+    (ver `ValuesSerializer.preparar`).
+    """
+    if isinstance(instancia, dict):
+        return instancia[CHAVE_PK if campo == pk else campo]
+
+    valor = instancia
+    for parte in campo.split("__"):
+        valor = getattr(valor, parte)
+    return valor
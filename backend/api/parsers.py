@@ -0,0 +1,31 @@
+"""
+    `backend/api/parsers.py`
+
+    Parsers da API.
+
+    `ORJSONParser` substitui o `JSONParser` do DRF usando `orjson.loads`, que
+    lê os bytes do corpo diretamente, sem decodificar para `str` antes. Como
+    o parser padrão com `STRICT_JSON`, rejeita `NaN` e `Infinity`. Sem
+    `orjson` instalado, delega ao `JSONParser` original.
+"""
+
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - dependência opcional
+    orjson = None
+
+
+class ORJSONParser(JSONParser):
+    """`JSONParser` com `orjson.loads`; sem `orjson`, o parser do DRF."""
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if orjson is None:
+            return super().parse(stream, media_type, parser_context)
+
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
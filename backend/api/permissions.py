@@ -24,6 +24,7 @@ class IsOwnerOrStaff(BasePermission):
     owner of the Associado profile, or is a staff member.
 
     Assumes the object being checked has an `user` attribute (i.e. Associado).
+    Compares primary keys, so neither `obj.user` nor `request.associado` is loaded.
     """
     message = "Você não tem permissão para modificar o perfil de outro usuário."
 
@@ -31,4 +32,4 @@ class IsOwnerOrStaff(BasePermission):
         return bool(request.user and request.user.is_authenticated)
 
     def has_object_permission(self, request, view, obj):
-        return request.user.is_staff or obj.user == request.user
+        return request.user.is_staff or obj.user_id == request.user.pk
@@ -0,0 +1,98 @@
+"""
+    `backend/api/renderers.py`
+
+    Renderers da API.
+
+    `ORJSONRenderer` substitui o `JSONRenderer` do DRF usando `orjson`, que
+    serializa dicts, listas, strings e números em C. Tipos que o `orjson` não
+    conhece (Decimal, lazy strings, querysets...) e datas/horas passam pelo
+    mesmo `JSONEncoder.default` do DRF, e U+2028/U+2029 recebem o mesmo
+    escape; sem floats, a saída é idêntica byte a byte à do renderer padrão.
+
+    Floats têm o mesmo valor, mas o expoente pode ser escrito de outra forma
+    (`1e16` em vez de `1e+16`, `1e-7` em vez de `1e-07`). NaN e infinito,
+    que o `orjson` escreveria como `null`, vão para o `JSONRenderer`: com
+    `STRICT_JSON` (padrão) continuam levantando `ValueError`.
+
+    Sem `orjson` instalado, para dados que ele recusa, ou quando a resposta
+    pede indentação
+    (`Accept: application/json; indent=4`, API navegável) ou ASCII
+    (`UNICODE_JSON = False`), o renderer delega ao `JSONRenderer` original.
+"""
+
+import math
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - dependência opcional
+    orjson = None
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    `JSONRenderer` serializando com `orjson`. Recai no renderer do DRF quando
+    a saída poderia divergir: `orjson` ausente, `ensure_ascii`, indentação,
+    inteiros acima de 64 bits ou NaN/infinito (STRICT_JSON).
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        renderer_context = renderer_context or {}
+        if (
+            orjson is None
+            or self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type or "", renderer_context)
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=_padrao, option=OPCOES)
+        except orjson.JSONEncodeError:
+            # ex.: inteiros acima de 64 bits — o json da stdlib aceita
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # NaN/infinito viram `null` no orjson; só há o que procurar se houver `null`
+        if b"null" in ret and _tem_nao_finito(data):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # mesmo escape do JSONRenderer: U+2028/U+2029 quebram JavaScript
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+        return ret
+
+
+if orjson is not None:
+    #   datas passam pelo encoder do DRF (milissegundos, "Z" para UTC)
+    OPCOES = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+
+_encoder = JSONEncoder()
+
+
+def _padrao(obj):
+    return _encoder.default(obj)
+
+
+def _tem_nao_finito(data) -> bool:
+    """Algum float NaN / ±infinito em `data` (dicts, listas e tuplas aninhados)."""
+    pilha = [data]
+    while pilha:
+        valor = pilha.pop()
+        tipo = type(valor)
+        # tipos exatos mais comuns primeiro: isinstance() em cada folha custa caro
+        if tipo is str or tipo is int or valor is None or tipo is bool:
+            continue
+        if isinstance(valor, float):
+            if not math.isfinite(valor):
+                return True
+        elif isinstance(valor, dict):
+            pilha.extend(valor.values())
+        elif isinstance(valor, (list, tuple)):
+            pilha.extend(valor)
+    return False
@@ -4,15 +4,17 @@
     Serializador para `Associado` e que também faz uso de campos em `User`.
     Serializador para criação de novo `Associado`.
     
-    @version: 2.0
+    @version: 2.1
 """
 
 from rest_framework import serializers
 from django.contrib.auth.models import User
 
 from ..models import Associado
+from .Campos import CamposDinamicosMixin
+from .Leitura import ValuesSerializer
 
-class AssociadoSerializer(serializers.ModelSerializer):
+class AssociadoSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
     """Serializer que combina dados do User e do Associado"""
     
     # Campos do User (read/write)
@@ -78,6 +80,11 @@ class AssociadoSerializer(serializers.ModelSerializer):
         
         return instance
 
+class AssociadoLeituraSerializer(ValuesSerializer):
+    """Mesma saída de `AssociadoSerializer` sobre `values()` (JOIN com `auth_user`)."""
+    referencia = AssociadoSerializer
+
+
 class AssociadoCreateSerializer(AssociadoSerializer):
     """Serializer específico para criação com validação de senha"""
     password = serializers.CharField(write_only=True, required=True)
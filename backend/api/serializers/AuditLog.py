@@ -0,0 +1,29 @@
+"""
+    `backend/api/serializers/AuditLog.py`
+
+    Serializer (somente leitura) para entidade `AuditLog`.
+"""
+from rest_framework import serializers
+from ..models import AuditLog
+
+
+class AuditLogSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = AuditLog
+        fields = [
+            "id",
+            "created_at",
+            "action",
+            "resource_type",
+            "resource_id",
+            "actor_id",
+            "actor",
+            "ip",
+            "user_agent",
+            "request_id",
+            "success",
+            "message",
+            "diff",
+            "details",
+        ]
+        read_only_fields = fields
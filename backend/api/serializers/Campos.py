@@ -0,0 +1,21 @@
+"""
+    `backend/api/serializers/Campos.py`
+
+    Seleção de campos (`?fields=` / `?omit=`) nos serializers de modelo.
+"""
+
+
+class CamposDinamicosMixin:
+    """
+    Remove da saída os campos fora de `context["campos"]`, quando presente
+    (preenchido por `api.mixins.CamposEsparsosMixin` em requisições GET).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        campos = self.context.get("campos")
+        if campos is not None:
+            for nome in list(self.fields):
+                if nome not in campos:
+                    self.fields.pop(nome)
@@ -1,13 +1,15 @@
 """
     `backend/api/serializers/Emprestimo.py`
 
-    @version: 1.3
+    @version: 1.4
 """
 from rest_framework import serializers
 from ..models import Emprestimo
+from .Campos import CamposDinamicosMixin
+from .Leitura import ValuesSerializer, nome_usuario
 
 
-class EmprestimoSerializer(serializers.ModelSerializer):
+class EmprestimoSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
     livro_titulo = serializers.CharField(source="livro.titulo", read_only=True)
 
     # ✅ Bug 5 corrigido: Associado não tem campo 'nome'; o nome vem do User relacionado
@@ -54,4 +56,17 @@ class EmprestimoSerializer(serializers.ModelSerializer):
         return self._nome_associado(obj.quem_emprestou)
 
     def get_quem_devolveu_nome(self, obj):
-        return self._nome_associado(obj.quem_devolveu)
\ No newline at end of file
+        return self._nome_associado(obj.quem_devolveu)
+
+
+class EmprestimoLeituraSerializer(ValuesSerializer):
+    """
+    Mesma saída de `EmprestimoSerializer` sobre `values()`: o título vem do
+    JOIN com `api_livro` e os nomes são calculados em SQL sobre `auth_user`.
+    """
+    referencia = EmprestimoSerializer
+    expressoes = {
+        "associado_nome": nome_usuario("associado__user"),
+        "quem_emprestou_nome": nome_usuario("quem_emprestou__user"),
+        "quem_devolveu_nome": nome_usuario("quem_devolveu__user"),
+    }
@@ -0,0 +1,151 @@
+"""
+    `backend/api/serializers/Leitura.py`
+
+    Serializers de leitura sobre `QuerySet.values()`.
+
+    `ValuesSerializer` reproduz a saída de um serializer de modelo
+    (`referencia`) a partir de dicts: cada campo vem da coluna do seu
+    `source` (`user.username` -> `user__username`) ou de uma expressão SQL
+    (`expressoes`), sem instanciar o modelo nem as relações.
+    O valor é formatado pelo próprio campo da `referencia` (datas, fuso,
+    textos), de modo que o JSON resultante é idêntico; campos relacionais e
+    `SerializerMethodField` já chegam prontos do banco.
+
+    Uso na view (ver `api/mixins.py`):
+
+        queryset = EmprestimoLeituraSerializer.preparar(queryset)
+        dados = EmprestimoLeituraSerializer(queryset, many=True).data
+
+    Com `context["campos"]` (`?fields=` / `?omit=`), `preparar(queryset,
+    campos)` seleciona apenas as colunas — e os JOINs — desses campos; a pk
+    vem sempre, em `CHAVE_PK`, para o desempate de `KeysetPagination`.
+"""
+
+from functools import cache, cached_property
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models import CharField, F, Func, Value
+from django.db.models.functions import Coalesce, Concat, NullIf
+
+from rest_framework import serializers
+from rest_framework.relations import ManyRelatedField, RelatedField
+
+
+#   pk de cada linha, fora da saída (desempate do cursor em `api/pagination.py`)
+CHAVE_PK = "_pk"
+
+#   espaços removidos por `str.strip()` em `User.get_full_name()`: todo
+#   caractere com `str.isspace()`, inclusive separadores ASCII e Unicode
+_ESPACOS = (
+    "\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680"
+    "\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a"
+    "\u2028\u2029\u202f\u205f\u3000"
+)
+
+
+def nome_usuario(prefixo: str):
+    """
+    Nome exibido de um usuário em SQL: `get_full_name()` ou, se vazio, o
+    `username` — o mesmo de `EmprestimoSerializer._nome_associado`.
+    `prefixo` leva ao `User` (ex. "associado__user"); NULL se não houver.
+    """
+    completo = Concat(
+        F(f"{prefixo}__first_name"), Value(" "), F(f"{prefixo}__last_name"),
+        output_field=CharField(),
+    )
+    aparado = Func(completo, Value(_ESPACOS), function="BTRIM", output_field=CharField())
+    return Coalesce(NullIf(aparado, Value("")), F(f"{prefixo}__username"))
+
+
+def colunas_nome_usuario(prefixo: str) -> tuple:
+    """Colunas lidas por `nome_usuario(prefixo)` (para `only()`)."""
+    return (f"{prefixo}__first_name", f"{prefixo}__last_name", f"{prefixo}__username")
+
+
+class ValuesSerializer(serializers.BaseSerializer):
+    """
+    Serializer somente leitura para linhas de `values()`.
+
+    Subclasses definem:
+        referencia   serializer de modelo cuja saída é reproduzida
+        expressoes   campo de saída -> lookup (str) ou expressão; obrigatório
+                     para `SerializerMethodField`, opcional para os demais
+                     (padrão: o `source` do campo)
+    """
+
+    referencia = None
+    expressoes = {}
+
+    @classmethod
+    def preparar(cls, queryset, campos=None):
+        """
+        `values()` com os campos da saída (todos ou só `campos`), a pk em
+        `CHAVE_PK` e as colunas da ordenação atual — todas necessárias para o
+        cursor de `KeysetPagination`, mesmo com `?fields=` / `?omit=`.
+        """
+        pk = queryset.model._meta.pk.name
+        posicionais, nomeados = [], {CHAVE_PK: F(pk)}
+        for nome, expressao in cls.colunas().items():
+            if campos is not None and nome not in campos:
+                continue
+            if expressao == nome:
+                posicionais.append(nome)
+            else:
+                nomeados[nome] = F(expressao) if isinstance(expressao, str) else expressao
+
+        ordenacao = queryset.query.order_by or queryset.model._meta.ordering
+        for item in ordenacao:
+            if isinstance(item, str):
+                nome = item.lstrip("-")
+                if nome in ("pk", pk):
+                    continue
+                if nome not in posicionais and nome not in nomeados:
+                    posicionais.append(nome)
+
+        return queryset.values(*posicionais, **nomeados)
+
+    @classmethod
+    def colunas(cls) -> dict:
+        """Campo de saída -> lookup ou expressão, na ordem da `referencia`."""
+        return {nome: coluna for nome, coluna, _ in cls._campos()}
+
+    def to_representation(self, linha):
+        return {
+            nome: None if linha[nome] is None else formatar(linha[nome])
+            for nome, _, formatar in self._selecionados
+        }
+
+    @cached_property
+    def _selecionados(self) -> tuple:
+        campos = self.context.get("campos")
+        if campos is None:
+            return self._campos()
+        return tuple(campo for campo in self._campos() if campo[0] in campos)
+
+    @classmethod
+    @cache
+    def _campos(cls) -> tuple:
+        """`(nome, coluna, formatador)` de cada campo legível da `referencia`."""
+        campos = []
+        for nome, campo in cls.referencia().fields.items():
+            if campo.write_only:
+                continue
+
+            if nome in cls.expressoes:
+                coluna = cls.expressoes[nome]
+            elif campo.source != "*":
+                coluna = campo.source.replace(".", "__")
+            else:
+                raise ImproperlyConfigured(
+                    f"{cls.__name__}.expressoes precisa definir '{nome}'."
+                )
+
+            if isinstance(campo, (RelatedField, ManyRelatedField, serializers.SerializerMethodField)):
+                campos.append((nome, coluna, _identidade))
+            else:
+                campos.append((nome, coluna, campo.to_representation))
+        return tuple(campos)
+
+
+def _identidade(valor):
+    return valor
@@ -4,18 +4,24 @@
     Serializer para entidade `Livro`.
     Exibe todos os campos de um `Livro`.
     
-    @version: 1.1
+    @version: 1.3
 """
 
 from rest_framework import serializers
 
 from ..models import Livro
+from .Campos import CamposDinamicosMixin
 
-class LivroSerializer(serializers.ModelSerializer):
+class LivroSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
     """
     Serializer para entidade `Livro`.
     Exibe todos os campos de um `Livro`.
+
+    `pode_ser_emprestado` é lido da anotação `tem_emprestimo_ativo` quando o
+    queryset vem de `Livro.objects.com_disponibilidade()`.
     """
+    pode_ser_emprestado = serializers.SerializerMethodField()
+
     class Meta:
         model = Livro
         fields = [
@@ -1,4 +1,5 @@
-from .Associado  import AssociadoSerializer, AssociadoCreateSerializer
-from .Emprestimo import EmprestimoSerializer
+from .Associado  import AssociadoSerializer, AssociadoCreateSerializer, AssociadoLeituraSerializer
+from .AuditLog   import AuditLogSerializer
+from .Emprestimo import EmprestimoSerializer, EmprestimoLeituraSerializer
 from .Livro      import LivroSerializer
 from .auth       import LoginSerializer, AssociadoAuthSerializer
\ No newline at end of file
@@ -0,0 +1,351 @@
+"""
+    `backend/api/services/audit_arquivo.py`
+
+    Consulta offline aos arquivos de auditoria: `logs/audit.log` e seus
+    backups rotacionados (`audit.log.1`, ... ou `audit.log.1.gz`, ...),
+    escritos pelo formatter `json` (um objeto JSON por linha).
+
+    Cada segmento é aberto com `mmap` e ganha um índice auxiliar em
+    `logs/.indice/<inode>.json` com a posição de cada linha, o `asctime` e
+    listas de linhas por chave:
+
+        t:<resource_type>                   ex. t:emprestimo
+        r:<resource_type>:<resource_id>     ex. r:emprestimo:4512
+        a:<actor_id>                        ex. a:3
+
+    Uma consulta cruza as listas (e o intervalo de tempo) no índice e só lê
+    e decodifica as linhas que casam. O índice é criado na primeira consulta,
+    estendido incrementalmente enquanto o segmento ativo cresce e refeito
+    quando o arquivo muda (o inode acompanha o arquivo nas renomeações da
+    rotação). Como um inode liberado na rotação costuma ser reaproveitado
+    pelo novo `audit.log`, o índice guarda também um hash dos primeiros bytes
+    do segmento e só é reaproveitado se eles forem os mesmos.
+
+    Segmentos rotacionados são comprimidos em gzip por blocos (`compactar`):
+    vários membros gzip de ~64 KiB, cada um terminando em fim de linha. O
+    arquivo continua legível por `zcat`, e o índice guarda o deslocamento de
+    cada membro, de modo que ler uma linha descomprime apenas o seu bloco.
+"""
+
+import bisect
+import hashlib
+import json
+import mmap
+import os
+import zlib
+from datetime import datetime
+from pathlib import Path
+
+VERSAO_INDICE = 2
+TAMANHO_BLOCO = 64 * 1024
+#   bytes iniciais do segmento cujo hash identifica o conteúdo indexado
+TAMANHO_AMOSTRA = 4096
+DIRETORIO_INDICE = ".indice"
+
+#   `asctime` do formatter `json` — ordenável como texto
+FORMATO_ASCTIME = "%Y-%m-%d %H:%M:%S,%f"
+
+_LEITURA = 256 * 1024
+
+
+# --------------------------------------------------------------------------- #
+#  Public helpers                                                              #
+# --------------------------------------------------------------------------- #
+
+def segmentos(base) -> list[Path]:
+    """Segmentos de `base` do mais antigo (maior número) para o ativo."""
+    base = Path(base)
+    rotacionados = []
+    for caminho in base.parent.glob(f"{base.name}.*"):
+        numero = caminho.name[len(base.name) + 1:].removesuffix(".gz")
+        if numero.isdigit():
+            rotacionados.append((int(numero), caminho.suffix == ".gz", caminho))
+
+    ordem = [caminho for *_, caminho in sorted(rotacionados, reverse=True)]
+    if base.exists():
+        ordem.append(base)
+    return ordem
+
+
+def consultar(
+    base,
+    *,
+    resource_type: str | None = None,
+    resource_id=None,
+    actor_id=None,
+    action: str | None = None,
+    desde: str | None = None,
+    ate: str | None = None,
+):
+    """
+    Gera, em ordem cronológica, os registros (dicts) que casam com os filtros.
+
+    `desde` / `ate` são `asctime` (ver `asctime()`); `ate` é exclusivo.
+    `action` não é indexado: é conferido nas linhas já selecionadas.
+    """
+    if resource_id is not None and not resource_type:
+        raise ValueError("resource_id exige resource_type.")
+
+    chaves = []
+    if resource_type:
+        chaves.append(
+            f"r:{resource_type}:{resource_id}" if resource_id is not None else f"t:{resource_type}"
+        )
+    if actor_id is not None:
+        chaves.append(f"a:{actor_id}")
+
+    base = Path(base)
+    dir_indice = base.parent / DIRETORIO_INDICE
+    caminhos = segmentos(base)
+    _limpar_indices(dir_indice, caminhos)
+
+    for caminho in caminhos:
+        with Segmento(caminho, dir_indice) as segmento:
+            for linha in segmento.buscar(chaves, desde, ate):
+                registro = json.loads(linha)
+                if action and registro.get("action") != action.upper():
+                    continue
+                yield registro
+
+
+def asctime(valor: datetime) -> str:
+    """`datetime` no formato de `asctime` usado pelo índice."""
+    return valor.strftime(FORMATO_ASCTIME)[:-3]
+
+
+def compactar(origem, destino=None) -> Path:
+    """
+    Comprime `origem` em gzip por blocos alinhados a linhas e remove o
+    original. Usado na rotação (`CompressingRotatingFileHandler`) e para
+    converter backups antigos.
+    """
+    origem = Path(origem)
+    destino = Path(destino) if destino else origem.with_name(f"{origem.name}.gz")
+    temporario = destino.with_name(f"{destino.name}.tmp")
+
+    with open(origem, "rb") as entrada, open(temporario, "wb") as saida:
+        pendente = b""
+        for dados in iter(lambda: entrada.read(TAMANHO_BLOCO), b""):
+            pendente += dados
+            corte = pendente.rfind(b"\n") + 1
+            if corte:
+                saida.write(_membro_gzip(pendente[:corte]))
+                pendente = pendente[corte:]
+        if pendente:
+            saida.write(_membro_gzip(pendente))
+
+    os.replace(temporario, destino)
+    os.remove(origem)
+    return destino
+
+
+# --------------------------------------------------------------------------- #
+#  Segmento                                                                    #
+# --------------------------------------------------------------------------- #
+
+class Segmento:
+    """Um arquivo de log mapeado em memória, com seu índice auxiliar."""
+
+    def __init__(self, caminho, dir_indice):
+        self.caminho = Path(caminho)
+        self.comprimido = self.caminho.suffix == ".gz"
+        self.dir_indice = Path(dir_indice)
+        self._bloco_em_cache = (None, b"")
+
+    def __enter__(self):
+        self._arquivo = open(self.caminho, "rb")
+        estado = os.fstat(self._arquivo.fileno())
+        self.inode, self.tamanho = estado.st_ino, estado.st_size
+        self.dados = (
+            mmap.mmap(self._arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+            if self.tamanho else b""
+        )
+        self.indice = self._carregar_indice()
+        return self
+
+    def __exit__(self, *exc):
+        if isinstance(self.dados, mmap.mmap):
+            self.dados.close()
+        self._arquivo.close()
+
+    # ---------------------------------------------------------------------- #
+    #  Consulta                                                                #
+    # ---------------------------------------------------------------------- #
+
+    def buscar(self, chaves, desde=None, ate=None):
+        """Bytes de cada linha que casa com todas as `chaves` e o intervalo."""
+        tempos = self.indice["tempos"]
+
+        if chaves:
+            listas = [self.indice["chaves"].get(chave, []) for chave in chaves]
+            candidatos = sorted(set(min(listas, key=len)).intersection(*listas))
+        else:
+            inicio = bisect.bisect_left(tempos, desde) if desde else 0
+            fim = bisect.bisect_left(tempos, ate) if ate else len(tempos)
+            candidatos = range(inicio, fim)
+
+        for i in candidatos:
+            if (desde and tempos[i] < desde) or (ate and tempos[i] >= ate):
+                continue
+            yield self._linha(i)
+
+    def _linha(self, i) -> bytes:
+        bloco, inicio, tamanho = self.indice["linhas"][i]
+        if bloco < 0:
+            return self.dados[inicio:inicio + tamanho]
+
+        # candidatos vêm em ordem: basta lembrar o último bloco descomprimido
+        atual, conteudo = self._bloco_em_cache
+        if atual != bloco:
+            deslocamento, comprimento = self.indice["blocos"][bloco]
+            conteudo = zlib.decompress(self.dados[deslocamento:deslocamento + comprimento], 31)
+            self._bloco_em_cache = (bloco, conteudo)
+        return conteudo[inicio:inicio + tamanho]
+
+    # ---------------------------------------------------------------------- #
+    #  Índice                                                                  #
+    # ---------------------------------------------------------------------- #
+
+    @property
+    def caminho_indice(self) -> Path:
+        return self.dir_indice / f"{self.inode}.json"
+
+    def _carregar_indice(self) -> dict:
+        indice = None
+        try:
+            indice = json.loads(self.caminho_indice.read_text())
+        except (OSError, ValueError):
+            pass
+
+        valido = (
+            indice is not None
+            and indice.get("versao") == VERSAO_INDICE
+            and indice.get("comprimido") == self.comprimido
+            and indice["tamanho"] <= self.tamanho
+            # mesmo inode, outro arquivo (inode reaproveitado após a rotação)
+            and indice.get("impressao") == self._impressao(indice.get("amostra", 0))
+        )
+        if valido and indice["tamanho"] == self.tamanho:
+            return indice
+
+        if valido and not self.comprimido:
+            # segmento ativo cresceu: indexa apenas o final
+            indice["tamanho"] = self._indexar_texto(indice, indice["tamanho"])
+        else:
+            indice = self._indice_vazio()
+            if self.comprimido:
+                self._indexar_comprimido(indice)
+                indice["tamanho"] = self.tamanho
+            else:
+                indice["tamanho"] = self._indexar_texto(indice, 0)
+
+        indice["amostra"] = min(TAMANHO_AMOSTRA, indice["tamanho"])
+        indice["impressao"] = self._impressao(indice["amostra"])
+        self._gravar_indice(indice)
+        return indice
+
+    def _indice_vazio(self) -> dict:
+        return {
+            "versao": VERSAO_INDICE,
+            "comprimido": self.comprimido,
+            "tamanho": 0,
+            "amostra": 0,
+            "impressao": "",
+            "blocos": [],
+            "linhas": [],
+            "tempos": [],
+            "chaves": {},
+        }
+
+    def _impressao(self, amostra: int):
+        """Hash dos `amostra` primeiros bytes do segmento (`None` se faltarem)."""
+        if amostra > self.tamanho:
+            return None
+        return hashlib.sha1(self.dados[:amostra]).hexdigest()
+
+    def _indexar_texto(self, indice, inicio) -> int:
+        """Indexa linhas completas a partir de `inicio`; devolve onde parou."""
+        return _indexar_linhas(indice, self.dados, -1, inicio)
+
+    def _indexar_comprimido(self, indice):
+        for deslocamento, comprimento, conteudo in _membros_gzip(self.dados):
+            indice["blocos"].append([deslocamento, comprimento])
+            bloco = len(indice["blocos"]) - 1
+            consumido = _indexar_linhas(indice, conteudo, bloco, 0)
+            if consumido < len(conteudo):
+                # última linha sem "\n" no fim do arquivo
+                _indexar_registro(indice, conteudo[consumido:], bloco, consumido)
+
+    def _gravar_indice(self, indice):
+        self.dir_indice.mkdir(parents=True, exist_ok=True)
+        temporario = self.caminho_indice.with_suffix(".tmp")
+        temporario.write_text(json.dumps(indice, separators=(",", ":")))
+        os.replace(temporario, self.caminho_indice)
+
+
+# --------------------------------------------------------------------------- #
+#  Internal helpers                                                            #
+# --------------------------------------------------------------------------- #
+
+def _indexar_linhas(indice, dados, bloco, inicio) -> int:
+    posicao = inicio
+    while True:
+        fim = dados.find(b"\n", posicao)
+        if fim == -1:
+            return posicao
+        if fim > posicao:
+            _indexar_registro(indice, dados[posicao:fim], bloco, posicao)
+        posicao = fim + 1
+
+
+def _indexar_registro(indice, linha: bytes, bloco, posicao):
+    try:
+        registro = json.loads(linha)
+    except ValueError:
+        return
+    if not isinstance(registro, dict):
+        return
+
+    numero = len(indice["linhas"])
+    indice["linhas"].append([bloco, posicao, len(linha)])
+    indice["tempos"].append(registro.get("asctime", ""))
+
+    chaves = indice["chaves"]
+    tipo = registro.get("resource_type")
+    if tipo:
+        chaves.setdefault(f"t:{tipo}", []).append(numero)
+        if registro.get("resource_id") is not None:
+            chaves.setdefault(f"r:{tipo}:{registro['resource_id']}", []).append(numero)
+    if registro.get("actor_id") is not None:
+        chaves.setdefault(f"a:{registro['actor_id']}", []).append(numero)
+
+
+def _membro_gzip(dados: bytes) -> bytes:
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    return compressor.compress(dados) + compressor.flush()
+
+
+def _membros_gzip(dados):
+    """Gera `(deslocamento, comprimento, conteúdo)` de cada membro gzip."""
+    posicao = 0
+    while posicao < len(dados):
+        descompressor = zlib.decompressobj(31)
+        inicio, partes = posicao, []
+        while not descompressor.eof:
+            if posicao >= len(dados):
+                raise ValueError("Arquivo gzip truncado.")
+            pedaco = dados[posicao:posicao + _LEITURA]
+            partes.append(descompressor.decompress(pedaco))
+            posicao += len(pedaco)
+        posicao -= len(descompressor.unused_data)
+        yield inicio, posicao - inicio, b"".join(partes)
+
+
+def _limpar_indices(dir_indice: Path, caminhos):
+    """Remove índices de segmentos que não existem mais."""
+    if not dir_indice.is_dir():
+        return
+    vivos = {f"{os.stat(caminho).st_ino}.json" for caminho in caminhos}
+    for arquivo in dir_indice.glob("*.json"):
+        if arquivo.name not in vivos:
+            arquivo.unlink(missing_ok=True)
@@ -29,6 +29,17 @@
     The `audit_log()` helper below is a drop-in replacement for
     `AuditService.log()`; the signature is intentionally similar so the diff
     in each view is minimal.
+
+    DELIVERY
+    --------
+    Context (IP, user-agent, actor) is captured at call time, but the record
+    is only emitted after the surrounding transaction commits
+    (`transaction.on_commit`; immediately when there is none), so no log I/O
+    happens while row locks are held and rolled-back operations are not
+    logged as successes.  Failures (`success=False`) are emitted right away —
+    they usually come with a rollback.  The `api.audit` logger writes to
+    `api.log_handlers.BoundedQueueHandler`, which only enqueues; file/console
+    writes happen on a background thread.
 """
 
 from __future__ import annotations
@@ -37,6 +48,8 @@ import logging
 import uuid
 from typing import Any
 
+from django.conf import settings
+from django.db import transaction
 from django.http import HttpRequest
 
 logger = logging.getLogger("api.audit")
@@ -91,7 +104,7 @@ def audit_log(
         extra["actor"] = user.username
 
     if request is not None:
-        extra["ip"] = _get_client_ip(request)
+        extra["ip"] = get_client_ip(request)
         extra["user_agent"] = request.META.get("HTTP_USER_AGENT", "")
         extra["request_id"] = getattr(request, "id", None) or str(uuid.uuid4())[:8]
 
@@ -101,16 +114,24 @@ def audit_log(
     if details:
         extra["details"] = details
 
-    level = logging.INFO if success else logging.WARNING
-    logger.log(level, message or action, extra=extra)
-
+    if not success:
+        logger.log(logging.WARNING, message or action, extra=extra)
+    elif transaction.get_connection().in_atomic_block:
+        transaction.on_commit(lambda: logger.log(logging.INFO, message or action, extra=extra))
+    else:
+        logger.log(logging.INFO, message or action, extra=extra)
 
-# --------------------------------------------------------------------------- #
-#  Internal helpers                                                            #
-# --------------------------------------------------------------------------- #
 
-def _get_client_ip(request: HttpRequest) -> str:
-    forwarded = request.META.get("HTTP_X_FORWARDED_FOR")
-    if forwarded:
-        return forwarded.split(",")[0].strip()
+def get_client_ip(request: HttpRequest) -> str:
+    """
+    IP do cliente. `X-Forwarded-For` é enviado pelo próprio cliente e não é
+    usado: atrás de um proxy confiável, `settings.CLIENT_IP_HEADER` nomeia o
+    cabeçalho que ele preenche (no Fly.io, `HTTP_FLY_CLIENT_IP`); sem ele,
+    vale `REMOTE_ADDR`.
+    """
+    cabecalho = getattr(settings, "CLIENT_IP_HEADER", None)
+    if cabecalho:
+        ip = request.META.get(cabecalho, "").strip()
+        if ip:
+            return ip
     return request.META.get("REMOTE_ADDR", "")
@@ -0,0 +1,119 @@
+"""
+    `backend/api/services/autocomplete.py`
+
+    Sugestões por prefixo para os seletores de livro e associado do balcão.
+
+        livro       prefixo do id (`varchar_pattern_ops` de `api_livro.id`),
+                    completado por prefixo do título sem acentos
+                    (`livro_titulo_prefixo_idx`)
+        associado   início de qualquer palavra de username, e-mail, nome ou
+                    telefone (`associado_busca_trgm_idx`)
+
+    Cada resposta tem no máximo `limite` registros mínimos e fica em um
+    `TTLCache` do processo por alguns segundos: quem digita rápido repete os
+    mesmos prefixos, e alguns segundos de defasagem são aceitáveis aqui.
+"""
+
+from __future__ import annotations
+
+from django.conf import settings
+from django.db.models import Q
+
+from ..models import Associado, Livro
+from ..utils import TTLCache
+from ..utils.busca import normalizar, termo_busca
+
+TIPOS = ("livro", "associado")
+LIMITE_PADRAO = 10
+LIMITE_MAXIMO = 25
+
+#   prefixos de título mais curtos que isso casam com boa parte do catálogo
+TAMANHO_MINIMO_TITULO = 2
+
+_cache = TTLCache(
+    maxsize=getattr(settings, "AUTOCOMPLETE_CACHE_TAMANHO", 2048),
+    ttl=getattr(settings, "AUTOCOMPLETE_CACHE_TTL", 15),
+)
+
+
+def sugerir(tipo: str, prefixo: str, *, limite: int = LIMITE_PADRAO, incluir_inativos: bool = False) -> list[dict]:
+    """
+    Até `limite` sugestões para `prefixo`. Levanta `ValueError` para tipos
+    desconhecidos.
+    """
+    if tipo not in TIPOS:
+        raise ValueError(tipo)
+
+    prefixo = prefixo.strip()
+    if not prefixo:
+        return []
+
+    limite = max(1, min(limite, LIMITE_MAXIMO))
+    chave = (tipo, prefixo.lower(), limite, incluir_inativos)
+
+    if tipo == "livro":
+        return _cache.get_or_set(chave, lambda: _sugerir_livros(prefixo, limite))
+    return _cache.get_or_set(
+        chave, lambda: _sugerir_associados(prefixo, limite, incluir_inativos)
+    )
+
+
+def limpar_cache() -> None:
+    _cache.clear()
+
+
+# --------------------------------------------------------------------------- #
+#  Internal helpers                                                            #
+# --------------------------------------------------------------------------- #
+
+def _sugerir_livros(prefixo: str, limite: int) -> list[dict]:
+    campos = ("id", "titulo", "status")
+
+    # ids são digitados em maiúsculas ou não (ex. '003-a'); LIKE 'x%' usa o índice
+    sugestoes = list(
+        Livro.objects
+        .filter(Q(id__startswith=prefixo) | Q(id__startswith=prefixo.upper()))
+        .order_by("id")
+        .values(*campos)[:limite]
+    )
+
+    restante = limite - len(sugestoes)
+    if restante and len(prefixo) >= TAMANHO_MINIMO_TITULO:
+        sugestoes += list(
+            Livro.objects
+            .alias(titulo_normalizado=normalizar("titulo"))
+            .filter(titulo_normalizado__startswith=termo_busca(prefixo))
+            .exclude(id__in=[livro["id"] for livro in sugestoes])
+            .order_by("titulo", "id")
+            .values(*campos)[:restante]
+        )
+
+    return sugestoes
+
+
+def _sugerir_associados(prefixo: str, limite: int, incluir_inativos: bool) -> list[dict]:
+    # início do documento ou de qualquer palavra dele
+    queryset = Associado.objects.filter(
+        Q(documento_busca__startswith=termo_busca(prefixo))
+        | Q(documento_busca__contains=termo_busca(" " + prefixo))
+    )
+    if not incluir_inativos:
+        queryset = queryset.filter(user__is_active=True)
+
+    linhas = (
+        queryset
+        .order_by("user__first_name", "user__last_name", "id")
+        .values("id", "user__username", "user__first_name", "user__last_name")[:limite]
+    )
+
+    return [
+        {
+            "id": linha["id"],
+            "username": linha["user__username"],
+            "nome": (
+                f"{linha['user__first_name']} {linha['user__last_name']}".strip()
+                or linha["user__username"]
+            ),
+        }
+        for linha in linhas
+    ]
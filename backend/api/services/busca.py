@@ -0,0 +1,54 @@
+"""
+    `backend/api/services/busca.py`
+
+    Manutenção dos documentos de busca desnormalizados.
+
+    `Associado.documento_busca` guarda, já minúsculos e sem acentos,
+    username, e-mail, nome, sobrenome e telefone, para que a busca de
+    associados use um único índice GIN trigram em vez de quatro ILIKE sobre
+    `auth_user`. O documento é recalculado pelo próprio Postgres (mesma
+    `f_unaccent()` usada nos termos de busca) em um UPDATE, disparado pelos
+    signals de `Associado` e `User`.
+"""
+
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from django.db.models import CharField, OuterRef, Subquery, Value
+from django.db.models.functions import Concat
+
+from ..models import Associado
+from ..utils.busca import normalizar
+
+#   campos de `User` que compõem o documento (saves que não os alteram são ignorados)
+CAMPOS_USUARIO = ("username", "email", "first_name", "last_name")
+
+
+def atualizar_documento_associados(**filtros) -> int:
+    """
+    Recalcula `documento_busca` dos associados selecionados por `filtros`
+    (ex. `pk=...`, `user_id=...`) em um único UPDATE; retorna as linhas afetadas.
+    """
+    usuario = (
+        get_user_model().objects
+        .filter(pk=OuterRef("user_id"))
+        .values(texto=_concat_com_espaco(*CAMPOS_USUARIO))
+    )
+    documento = normalizar(
+        _concat_com_espaco(Subquery(usuario, output_field=CharField()), "telefone")
+    )
+
+    return Associado.objects.filter(**filtros).update(documento_busca=documento)
+
+
+# --------------------------------------------------------------------------- #
+#  Internal helpers                                                            #
+# --------------------------------------------------------------------------- #
+
+def _concat_com_espaco(*partes):
+    expressoes = []
+    for parte in partes:
+        if expressoes:
+            expressoes.append(Value(" "))
+        expressoes.append(parte)
+    return Concat(*expressoes, output_field=CharField())
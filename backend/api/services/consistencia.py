@@ -0,0 +1,205 @@
+"""
+    `backend/api/services/consistencia.py`
+
+    Reconciliação do `Livro.status` com os empréstimos ativos.
+
+    A regra é a mesma do antigo signal `verificar_consistencia_emprestimo`:
+
+    - livro com empréstimo ativo e status diferente de `EMPRESTADO` → `EMPRESTADO`;
+    - livro `EMPRESTADO` sem empréstimo ativo                       → `DISPONIVEL`.
+
+    Em vez de um `count()` e um `Livro.save()` por empréstimo salvo, os ids dos
+    livros tocados são acumulados durante a transação e reconciliados por um
+    único UPDATE em `transaction.on_commit`.
+
+    `reconciliar_catalogo()` aplica a mesma regra ao catálogo inteiro com um
+    único `UPDATE ... FROM` (usado pelo comando `reconcile_status` e pelo
+    endpoint `POST /api/diagnostico/reconciliar/`).
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import Iterable
+
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.models import Case, Exists, OuterRef, Q, Value, When
+
+from ..models import Emprestimo, Livro
+from .snapshots import invalidar
+
+
+# --------------------------------------------------------------------------- #
+#  Public helpers                                                              #
+# --------------------------------------------------------------------------- #
+
+def reconciliar_status(livro_ids: Iterable[str], *, using: str = DEFAULT_DB_ALIAS) -> int:
+    """
+    Corrige o status dos livros informados com um único UPDATE.
+
+    Retorna o número de livros alterados.
+    """
+    livro_ids = list(livro_ids)
+    if not livro_ids:
+        return 0
+
+    ativo = Exists(
+        Emprestimo.objects.filter(livro=OuterRef("pk"), data_devolucao__isnull=True)
+    )
+
+    alterados = (
+        Livro.objects.using(using)
+        .filter(pk__in=livro_ids)
+        .filter(
+            (ativo & ~Q(status=Livro.Status.EMPRESTADO))
+            | (~ativo & Q(status=Livro.Status.EMPRESTADO))
+        )
+        .update(
+            status=Case(
+                When(ativo, then=Value(Livro.Status.EMPRESTADO)),
+                default=Value(Livro.Status.DISPONIVEL),
+            )
+        )
+    )
+    if alterados:
+        invalidar("livro")
+    return alterados
+
+
+def reconciliar_catalogo(*, dry_run: bool = False, using: str = DEFAULT_DB_ALIAS) -> dict:
+    """
+    Reconcilia o status de todo o catálogo em uma única instrução.
+
+    Com `dry_run=True` executa apenas o SELECT das divergências, sem alterar
+    nada. Retorna um dict com
+
+    - `dry_run`:     bool;
+    - `corrigidos`:  número de livros alterados (ou que seriam alterados);
+    - `transicoes`:  contagem por transição, ex. `{"DISPONIVEL -> EMPRESTADO": 3}`;
+    - `alteracoes`:  lista de `{"id", "status_anterior", "status_novo"}`.
+    """
+    qn = connections[using].ops.quote_name
+    ctes = _sql_divergencias(using)
+
+    if dry_run:
+        sql = ctes + """
+            SELECT id, status_anterior, status_novo FROM divergentes ORDER BY id
+        """
+    else:
+        sql = ctes + f"""
+            UPDATE {qn(Livro._meta.db_table)} AS l
+            SET status = d.status_novo
+            FROM divergentes d
+            WHERE l.id = d.id
+            RETURNING l.id, d.status_anterior, d.status_novo
+        """
+
+    with transaction.atomic(using=using), connections[using].cursor() as cursor:
+        cursor.execute(sql, _parametros_divergencias())
+        linhas = cursor.fetchall()
+
+    if linhas and not dry_run:
+        invalidar("livro")
+
+    alteracoes = [
+        {"id": livro_id, "status_anterior": anterior, "status_novo": novo}
+        for livro_id, anterior, novo in sorted(linhas)
+    ]
+    transicoes = Counter(f"{a['status_anterior']} -> {a['status_novo']}" for a in alteracoes)
+
+    return {
+        "dry_run": dry_run,
+        "corrigidos": len(alteracoes),
+        "transicoes": dict(transicoes),
+        "alteracoes": alteracoes,
+    }
+
+
+def agendar_reconciliacao(livro_id: str, *, using: str | None = None) -> None:
+    """
+    Registra `livro_id` para reconciliação ao final da transação corrente.
+
+    Todos os ids registrados em uma mesma transação são reconciliados juntos,
+    por um único callback `on_commit`. Fora de um bloco atômico a
+    reconciliação roda imediatamente.
+    """
+    using = using or DEFAULT_DB_ALIAS
+    connection = transaction.get_connection(using)
+
+    if not connection.in_atomic_block:
+        reconciliar_status([livro_id], using=using)
+        return
+
+    pendente = _reconciliacao_pendente(connection)
+    if pendente is None:
+        pendente = _ReconciliacaoPendente(using)
+        transaction.on_commit(pendente, using=using)
+
+    pendente.livro_ids.add(livro_id)
+
+
+# --------------------------------------------------------------------------- #
+#  Internal helpers                                                            #
+# --------------------------------------------------------------------------- #
+
+def _sql_divergencias(using: str) -> str:
+    """
+    CTEs com os livros divergentes e o status correto de cada um.
+
+    `ativos` é um hash anti-join sobre os empréstimos sem devolução, de modo que
+    o catálogo inteiro é verificado em uma única varredura de cada tabela.
+    """
+    qn = connections[using].ops.quote_name
+    livro = qn(Livro._meta.db_table)
+    emprestimo = qn(Emprestimo._meta.db_table)
+
+    return f"""
+        WITH ativos AS (
+            SELECT DISTINCT livro_id
+            FROM {emprestimo}
+            WHERE data_devolucao IS NULL
+        ),
+        divergentes AS (
+            SELECT
+                l.id,
+                l.status AS status_anterior,
+                CASE WHEN a.livro_id IS NOT NULL THEN %(emprestado)s
+                     ELSE %(disponivel)s END AS status_novo
+            FROM {livro} l
+            LEFT JOIN ativos a ON a.livro_id = l.id
+            WHERE (a.livro_id IS NOT NULL AND l.status <> %(emprestado)s)
+               OR (a.livro_id IS NULL AND l.status = %(emprestado)s)
+        )
+    """
+
+
+def _parametros_divergencias() -> dict:
+    return {
+        "emprestado": Livro.Status.EMPRESTADO.value,
+        "disponivel": Livro.Status.DISPONIVEL.value,
+    }
+
+
+class _ReconciliacaoPendente:
+    """Callback `on_commit` que acumula os ids tocados em uma transação."""
+
+    def __init__(self, using: str):
+        self.using = using
+        self.livro_ids: set[str] = set()
+
+    def __call__(self):
+        reconciliar_status(self.livro_ids, using=self.using)
+
+
+def _reconciliacao_pendente(connection) -> _ReconciliacaoPendente | None:
+    """
+    Procura o callback já registrado na transação corrente.
+
+    Um rollback descarta os callbacks de `connection.run_on_commit`, então a
+    busca nunca devolve um callback de uma transação anterior.
+    """
+    for entrada in connection.run_on_commit:
+        callback = entrada[1]
+        if isinstance(callback, _ReconciliacaoPendente):
+            return callback
+    return None
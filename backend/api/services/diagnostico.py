@@ -0,0 +1,267 @@
+"""
+    `backend/api/services/diagnostico.py`
+
+    Estatísticas para `/api/diagnostico/`.
+
+    Cada seção do payload é montada por uma única query de agregação
+    condicional sobre a sua tabela (`COUNT(*) FILTER (WHERE ...)`), em vez de
+    um `count()` por estatística. `planejar()` traduz o parâmetro `?tipo=` nas
+    seções necessárias, de modo que apenas as queries pedidas são executadas:
+
+        livros          1 query  (GROUP BY titulo; totais somados em Python)
+        associados      1 query
+        emprestimos     1 query
+        inconsistencias 1 query  (apenas em `tipo=todos`)
+
+    `livros_por_titulo()` / `livros_por_titulo_stream()` montam o mapa `dados`
+    de `/api/diagnostico/livros/` e `/api/livros/diagnostico/` a partir de um
+    único GROUP BY titulo, com os ids e status de cada cópia agregados em
+    arrays pelo próprio Postgres.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Callable, Iterator
+
+from django.contrib.postgres.aggregates import ArrayAgg
+from django.db.models import Count, Exists, OuterRef, Q
+from django.utils import timezone
+
+from ..models import Associado, Emprestimo, Livro
+
+
+# --------------------------------------------------------------------------- #
+#  Seções                                                                      #
+# --------------------------------------------------------------------------- #
+
+def estatisticas_livros() -> dict:
+    """Totais por status e lista por título, a partir de um único GROUP BY titulo."""
+    por_status = {
+        _chave_status(valor): Count("pk", filter=Q(status=valor))
+        for valor in Livro.Status.values
+    }
+    linhas = (
+        Livro.objects
+        .values("titulo")
+        .annotate(total=Count("pk"), **por_status)
+        .order_by("titulo")
+    )
+
+    totais = dict.fromkeys(por_status, 0)
+    count = 0
+    titulos_stats = []
+
+    for linha in linhas:
+        count += linha["total"]
+        for chave in totais:
+            totais[chave] += linha[chave]
+
+        if linha["titulo"]:
+            titulos_stats.append({
+                "titulo": linha["titulo"],
+                "total_copias": linha["total"],
+                "copias_disponiveis": linha[_chave_status(Livro.Status.DISPONIVEL)],
+            })
+
+    stats = {
+        "count": count,
+        "disponiveis": totais.pop(_chave_status(Livro.Status.DISPONIVEL)),
+        "emprestados": totais.pop(_chave_status(Livro.Status.EMPRESTADO)),
+    }
+    # demais status só aparecem quando presentes nos dados
+    stats.update({chave: total for chave, total in totais.items() if total})
+    stats["por_titulo"] = titulos_stats
+
+    return stats
+
+
+def estatisticas_associados() -> dict:
+    """Total, ativos/inativos e associados com empréstimos, em uma query."""
+    com_emprestimos = Exists(Emprestimo.objects.filter(associado=OuterRef("pk")))
+
+    return Associado.objects.aggregate(
+        count=Count("pk"),
+        ativos=Count("pk", filter=Q(user__is_active=True)),
+        inativos=Count("pk", filter=Q(user__is_active=False)),
+        com_emprestimos=Count("pk", filter=com_emprestimos),
+    )
+
+
+def estatisticas_emprestimos() -> dict:
+    """Total, ativos, devolvidos e atrasados, em uma query."""
+    hoje = timezone.now().date()
+
+    return Emprestimo.objects.aggregate(
+        count=Count("pk"),
+        ativos=Count("pk", filter=Q(data_devolucao__isnull=True)),
+        devolvidos=Count("pk", filter=Q(data_devolucao__isnull=False)),
+        atrasados=Count("pk", filter=Q(data_devolucao__isnull=True, data_prevista__lt=hoje)),
+    )
+
+
+def inconsistencias() -> list[dict]:
+    """Livros marcados como EMPRESTADO sem empréstimo ativo (anti-join em uma query)."""
+    ativo = Exists(
+        Emprestimo.objects.filter(livro=OuterRef("pk"), data_devolucao__isnull=True)
+    )
+    livros = (
+        Livro.objects
+        .filter(status=Livro.Status.EMPRESTADO)
+        .filter(~ativo)
+        .values_list("id", "titulo")
+        .order_by("id")
+    )
+
+    return [
+        {
+            "tipo": "status_inconsistente",
+            "descricao": (
+                f"Livro {titulo} ({livro_id}) está marcado como EMPRESTADO "
+                "mas não possui empréstimo ativo"
+            ),
+            "objeto": "livro",
+            "id": livro_id,
+        }
+        for livro_id, titulo in livros
+    ]
+
+
+# --------------------------------------------------------------------------- #
+#  Livros agrupados por título                                                 #
+# --------------------------------------------------------------------------- #
+
+def livros_por_titulo() -> dict:
+    """Payload completo, montado a partir de uma única query."""
+    dados = {}
+    total_copias = 0
+
+    for linha in _linhas_por_titulo():
+        dados[linha["titulo"]] = _entrada_titulo(linha)
+        total_copias += linha["total_copias"]
+
+    return {
+        "status": "success",
+        "total_titulos": len(dados),
+        "total_copias": total_copias,
+        "dados": dados,
+    }
+
+
+def livros_por_titulo_stream(chunk_size: int = 2000) -> Iterator[str]:
+    """
+    Mesmo payload de `livros_por_titulo()`, gerado em pedaços de JSON.
+
+    A query é lida com `.iterator()` (cursor no servidor), então a memória
+    usada não depende do tamanho do catálogo. Os totais só são conhecidos ao
+    final e por isso vêm depois de `dados`.
+    """
+    total_titulos = 0
+    total_copias = 0
+
+    yield '{"status": "success", "dados": {'
+    for linha in _linhas_por_titulo().iterator(chunk_size=chunk_size):
+        separador = ", " if total_titulos else ""
+        yield (
+            separador
+            + json.dumps(linha["titulo"], ensure_ascii=False)
+            + ": "
+            + json.dumps(_entrada_titulo(linha), ensure_ascii=False)
+        )
+        total_titulos += 1
+        total_copias += linha["total_copias"]
+    yield f'}}, "total_titulos": {total_titulos}, "total_copias": {total_copias}}}'
+
+
+# --------------------------------------------------------------------------- #
+#  Planejador                                                                  #
+# --------------------------------------------------------------------------- #
+
+SECOES: dict[str, Callable[[], object]] = {
+    "livros": estatisticas_livros,
+    "associados": estatisticas_associados,
+    "emprestimos": estatisticas_emprestimos,
+    "inconsistencias": inconsistencias,
+}
+
+#   tabelas lidas por cada seção (geração dos snapshots em cache)
+DEPENDENCIAS: dict[str, tuple[str, ...]] = {
+    "livros": ("livro",),
+    "associados": ("associado", "emprestimo"),
+    "emprestimos": ("emprestimo",),
+    "inconsistencias": ("livro", "emprestimo"),
+}
+
+#   seções incluídas por cada valor de `?tipo=`
+TIPOS: dict[str, tuple[str, ...]] = {
+    "todos": ("livros", "associados", "emprestimos", "inconsistencias"),
+    "livros": ("livros",),
+    "associados": ("associados",),
+    "emprestimos": ("emprestimos",),
+}
+
+
+def planejar(tipo: str) -> list[str]:
+    """
+    Traduz `?tipo=` (um valor ou vários separados por vírgula) na lista de
+    seções a calcular, sem repetições e na ordem de `SECOES`.
+
+    Levanta `ValueError` para tipos desconhecidos.
+    """
+    pedidas: set[str] = set()
+    for parte in (tipo or "todos").split(","):
+        parte = parte.strip().lower()
+        if parte not in TIPOS:
+            raise ValueError(parte)
+        pedidas.update(TIPOS[parte])
+
+    return [secao for secao in SECOES if secao in pedidas]
+
+
+def montar_diagnostico(tipo: str = "todos") -> dict:
+    """Executa apenas as queries das seções planejadas para `tipo`."""
+    return montar_secoes(planejar(tipo))
+
+
+def montar_secoes(secoes: list[str]) -> dict:
+    return {secao: SECOES[secao]() for secao in secoes}
+
+
+def dependencias(secoes: list[str]) -> set[str]:
+    """Tabelas de que dependem as seções informadas."""
+    return {tabela for secao in secoes for tabela in DEPENDENCIAS[secao]}
+
+
+# --------------------------------------------------------------------------- #
+#  Internal helpers                                                            #
+# --------------------------------------------------------------------------- #
+
+def _linhas_por_titulo():
+    """GROUP BY titulo com ids e status das cópias agregados em ordem de id."""
+    return (
+        Livro.objects
+        .values("titulo")
+        .annotate(
+            ids=ArrayAgg("id", order_by="id"),
+            statuses=ArrayAgg("status", order_by="id"),
+            total_copias=Count("pk"),
+            copias_disponiveis=Count("pk", filter=Q(status=Livro.Status.DISPONIVEL)),
+        )
+        .order_by("titulo")
+    )
+
+
+def _entrada_titulo(linha: dict) -> dict:
+    return {
+        "total_copias": linha["total_copias"],
+        "copias_disponiveis": linha["copias_disponiveis"],
+        "ides": [
+            {"id": livro_id, "status": livro_status}
+            for livro_id, livro_status in zip(linha["ids"], linha["statuses"])
+        ],
+    }
+
+
+def _chave_status(valor: str) -> str:
+    """Chave do payload para um status, ex. 'PARA_GUARDAR' → 'para_guardar'."""
+    return valor.lower().replace(" ", "_")
@@ -0,0 +1,158 @@
+"""
+    `backend/api/services/emprestimos.py`
+
+    Operações sobre empréstimos: `emprestar`, `devolver` e `renovar`.
+
+    Views, admin e comandos de gerência passam por aqui em vez de manipular
+    `Emprestimo` e `Livro.status` diretamente. Cada operação tem um número
+    máximo de instruções SQL, sem contar o controle de transação
+    (BEGIN / SAVEPOINT / RELEASE):
+
+        emprestar   2   UPDATE condicional do livro + INSERT do empréstimo
+        devolver    2   UPDATE condicional do empréstimo + UPDATE do livro
+        renovar     1   UPDATE condicional do empréstimo
+
+    O orçamento assume que as instâncias recebidas já trazem `livro` carregado
+    (ou que apenas `livro_id` é usado); nenhuma operação relê o `Livro`.
+    Erros de regra de negócio são levantados como
+    `django.core.exceptions.ValidationError`; cabe ao chamador traduzi-los.
+"""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from ..models import Emprestimo, Livro, Associado
+from .snapshots import invalidar
+
+DIAS_RENOVACAO = 7
+
+#   número máximo de instruções SQL por operação (ver docstring do módulo);
+#   conferido por `api/tests/test_emprestimos.py`
+ORCAMENTO_QUERIES = {
+    "emprestar": 2,
+    "devolver": 2,
+    "renovar": 1,
+}
+
+
+# --------------------------------------------------------------------------- #
+#  Operações                                                                   #
+# --------------------------------------------------------------------------- #
+
+def emprestar(emprestimo: Emprestimo) -> Emprestimo:
+    """
+    Registra um empréstimo novo (instância ainda não salva).
+
+    1. UPDATE condicional do livro (`status = DISPONIVEL` → `EMPRESTADO`);
+       se nenhuma linha for afetada o livro não estava disponível;
+    2. INSERT do empréstimo — um segundo empréstimo ativo do mesmo livro
+       viola `emprestimo_livro_ativo_unico` e desfaz também o UPDATE.
+    """
+    if not emprestimo._state.adding:
+        raise ValueError("emprestar() espera um Emprestimo ainda não salvo.")
+
+    if not isinstance(emprestimo.data_prevista, date):
+        emprestimo.data_prevista = Emprestimo.default_data_prevista()
+
+    # o status do livro é ajustado aqui; o signal de consistência não precisa agir
+    emprestimo._livro_sincronizado = True
+
+    try:
+        with transaction.atomic():
+            atualizados = Livro.objects.filter(
+                pk=emprestimo.livro_id,
+                status=Livro.Status.DISPONIVEL,
+            ).update(status=Livro.Status.EMPRESTADO)
+
+            if not atualizados:
+                raise ValidationError(_mensagem_indisponivel(emprestimo.livro_id))
+
+            emprestimo.save()  # signals de snapshot invalidam "emprestimo" e "livro"
+
+    except IntegrityError as exc:
+        emprestimo.pk = None
+        emprestimo._state.adding = True
+        if "emprestimo_livro_ativo_unico" in str(exc):
+            raise ValidationError(_mensagem_indisponivel(emprestimo.livro_id)) from exc
+        raise
+
+    _sincronizar_livro_em_cache(emprestimo, Livro.Status.EMPRESTADO)
+    return emprestimo
+
+
+def devolver(
+    emprestimo: Emprestimo,
+    *,
+    quem_devolveu: Associado | None = None,
+    data_devolucao: date | None = None,
+) -> Emprestimo:
+    """
+    Encerra um empréstimo ativo e libera o livro.
+
+    1. UPDATE do empréstimo restrito a `data_devolucao IS NULL` — se nenhuma
+       linha for afetada o empréstimo já havia sido devolvido;
+    2. UPDATE do livro para `DISPONIVEL`. O índice parcial único garante que
+       não há outro empréstimo ativo do mesmo livro.
+    """
+    data_devolucao = data_devolucao or timezone.now().date()
+
+    with transaction.atomic():
+        atualizados = Emprestimo.objects.filter(
+            pk=emprestimo.pk,
+            data_devolucao__isnull=True,
+        ).update(data_devolucao=data_devolucao, quem_devolveu=quem_devolveu)
+
+        if not atualizados:
+            raise ValidationError("Este empréstimo já foi devolvido.")
+
+        Livro.objects.filter(pk=emprestimo.livro_id).update(
+            status=Livro.Status.DISPONIVEL
+        )
+        invalidar("emprestimo", "livro")
+
+    emprestimo.data_devolucao = data_devolucao
+    emprestimo.quem_devolveu = quem_devolveu
+    _sincronizar_livro_em_cache(emprestimo, Livro.Status.DISPONIVEL)
+    return emprestimo
+
+
+def renovar(emprestimo: Emprestimo, *, dias: int = DIAS_RENOVACAO) -> Emprestimo:
+    """
+    Estende `data_prevista` de um empréstimo ativo em `dias` dias.
+
+    Um único UPDATE restrito a `data_devolucao IS NULL`; não passa por
+    `save()` nem por `full_clean()`.
+    """
+    base = emprestimo.data_prevista or timezone.now().date()
+    nova_data = base + timedelta(days=dias)
+
+    atualizados = Emprestimo.objects.filter(
+        pk=emprestimo.pk,
+        data_devolucao__isnull=True,
+    ).update(data_prevista=nova_data)
+
+    if not atualizados:
+        raise ValidationError("Este empréstimo já foi devolvido e não pode ser renovado.")
+
+    invalidar("emprestimo")
+    emprestimo.data_prevista = nova_data
+    return emprestimo
+
+
+# --------------------------------------------------------------------------- #
+#  Internal helpers                                                            #
+# --------------------------------------------------------------------------- #
+
+def _mensagem_indisponivel(livro_id) -> str:
+    return f"O livro [{livro_id}] já está emprestado ou indisponível."
+
+
+def _sincronizar_livro_em_cache(emprestimo: Emprestimo, livro_status: str) -> None:
+    """Mantém o `Livro` em cache na instância coerente com o banco, sem nova query."""
+    if Emprestimo.livro.is_cached(emprestimo):
+        emprestimo.livro.status = livro_status
@@ -0,0 +1,165 @@
+"""
+    `backend/api/services/snapshots.py`
+
+    Snapshots em cache para os endpoints públicos de diagnóstico.
+
+    Cada modelo de interesse ("livro", "emprestimo", "associado") tem um
+    contador de geração no cache do Django. O contador é o instante
+    (`time.time_ns()`) da última escrita confirmada naquela tabela e é
+    atualizado por `invalidar()`, chamado pelos signals de `api/signals.py` e
+    pelos serviços que escrevem via `QuerySet.update()`.
+
+    Um snapshot é identificado pelo seu nome, pelos parâmetros da requisição e
+    pelas gerações das tabelas de que depende; esse mesmo hash é o ETag da
+    resposta, e a maior geração é o Last-Modified. Requisições condicionais
+    (`If-None-Match` / `If-Modified-Since`) recebem 304 sem tocar o banco.
+
+    Os contadores só valem se todos os workers virem o mesmo cache: fora de
+    DEBUG, `CACHES` usa a tabela `django_cache` (ver `core/settings.py`), e
+    `api/checks.py` recusa memória local.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from typing import Callable, Iterable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.cache import patch_cache_control
+from django.utils.http import http_date, parse_etags, parse_http_date_safe, quote_etag
+
+from rest_framework import status
+from rest_framework.response import Response
+
+PREFIXO_GERACAO = "snapshot:geracao:"
+PREFIXO_SNAPSHOT = "snapshot:dados:"
+
+
+# --------------------------------------------------------------------------- #
+#  Public helpers                                                              #
+# --------------------------------------------------------------------------- #
+
+def invalidar(*modelos: str) -> None:
+    """
+    Avança a geração dos modelos informados quando a transação corrente for
+    confirmada (imediatamente, fora de um bloco atômico).
+
+    Todos os modelos invalidados em uma mesma transação são avançados juntos,
+    por um único callback `on_commit` (um `set_many`), por mais linhas que
+    ela grave.
+    """
+    connection = transaction.get_connection()
+    if not connection.in_atomic_block:
+        _avancar(modelos)
+        return
+
+    pendente = _invalidacao_pendente(connection)
+    if pendente is None:
+        pendente = _InvalidacaoPendente()
+        transaction.on_commit(pendente)
+
+    pendente.modelos.update(modelos)
+
+
+def geracoes(modelos: Iterable[str]) -> dict[str, int]:
+    """Gerações atuais; modelos sem contador (cache frio) começam em 'agora'."""
+    chaves = {PREFIXO_GERACAO + modelo: modelo for modelo in modelos}
+    atuais = cache.get_many(chaves)
+
+    faltando = {chave: time.time_ns() for chave in chaves if chave not in atuais}
+    if faltando:
+        for chave, valor in faltando.items():
+            # add() não sobrescreve um contador gravado por outro processo
+            if not cache.add(chave, valor, timeout=None):
+                faltando[chave] = cache.get(chave, valor)
+        atuais.update(faltando)
+
+    return {chaves[chave]: valor for chave, valor in atuais.items()}
+
+
+def resposta_snapshot(
+    request,
+    nome: str,
+    dependencias: Iterable[str],
+    construir: Callable[[], dict],
+    *,
+    parametros: str = "",
+) -> Response:
+    """
+    Responde `request` com o snapshot `nome`, construído por `construir()`
+    apenas quando não houver cópia em cache para as gerações atuais.
+    """
+    atuais = geracoes(dependencias)
+    versao = ":".join(f"{modelo}={atuais[modelo]}" for modelo in sorted(atuais))
+    digest = hashlib.sha1(f"{nome}|{parametros}|{versao}".encode()).hexdigest()[:20]
+    etag = quote_etag(digest)
+    ultima_modificacao = int(max(atuais.values()) // 1_000_000_000)
+
+    if _nao_modificado(request, etag, ultima_modificacao):
+        return _com_cabecalhos(
+            Response(status=status.HTTP_304_NOT_MODIFIED), etag, ultima_modificacao
+        )
+
+    chave = f"{PREFIXO_SNAPSHOT}{nome}:{digest}"
+    dados = cache.get(chave)
+    if dados is None:
+        dados = construir()
+        cache.set(chave, dados, timeout=_timeout())
+
+    return _com_cabecalhos(Response(dados, status=status.HTTP_200_OK), etag, ultima_modificacao)
+
+
+# --------------------------------------------------------------------------- #
+#  Internal helpers                                                            #
+# --------------------------------------------------------------------------- #
+
+def _avancar(modelos: Iterable[str]) -> None:
+    agora = time.time_ns()
+    cache.set_many({PREFIXO_GERACAO + modelo: agora for modelo in modelos}, timeout=None)
+
+
+class _InvalidacaoPendente:
+    """Callback `on_commit` que acumula os modelos invalidados em uma transação."""
+
+    def __init__(self):
+        self.modelos: set[str] = set()
+
+    def __call__(self):
+        _avancar(self.modelos)
+
+
+def _invalidacao_pendente(connection) -> _InvalidacaoPendente | None:
+    """
+    Procura o callback já registrado na transação corrente (um rollback
+    descarta os callbacks, ver `consistencia._reconciliacao_pendente`).
+    """
+    for entrada in connection.run_on_commit:
+        if isinstance(entrada[1], _InvalidacaoPendente):
+            return entrada[1]
+    return None
+
+
+def _timeout() -> int:
+    return getattr(settings, "DIAGNOSTICO_SNAPSHOT_TIMEOUT", 3600)
+
+
+def _nao_modificado(request, etag: str, ultima_modificacao: int) -> bool:
+    """Avalia If-None-Match (prioritário) e If-Modified-Since."""
+    if_none_match = request.META.get("HTTP_IF_NONE_MATCH")
+    if if_none_match:
+        etags = parse_etags(if_none_match)
+        return "*" in etags or etag in etags
+
+    if_modified_since = parse_http_date_safe(request.META.get("HTTP_IF_MODIFIED_SINCE", ""))
+    return if_modified_since is not None and ultima_modificacao <= if_modified_since
+
+
+def _com_cabecalhos(response: Response, etag: str, ultima_modificacao: int) -> Response:
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(ultima_modificacao)
+    # o cliente pode guardar a resposta, mas deve revalidá-la a cada uso
+    patch_cache_control(response, public=True, no_cache=True)
+    return response
@@ -0,0 +1,182 @@
+"""
+    `backend/api/services/tentativas_login.py`
+
+    Controle de tentativas de login com backoff exponencial.
+
+    Falhas são contadas por IP e por username (normalizado). Passadas as
+    tentativas livres de cada escopo, cada nova falha bloqueia aquele escopo
+    por `BASE * 2^(excedentes - 1)` segundos, até `MAXIMO`. Enquanto houver
+    bloqueio, `LoginBackoffThrottle` recusa a requisição com 429 antes de o
+    serializer chamar `authenticate()` — o hasher (PBKDF2) não é executado.
+
+    Os totais de falhas, bloqueios e logins bem-sucedidos são expostos em
+    `GET /api/diagnostico/autenticacao/`.
+
+    Contadores e bloqueios ficam na tabela `ContadorLogin`, compartilhada por
+    todos os workers. Cada incremento é um único
+    `INSERT ... ON CONFLICT DO UPDATE SET total = total + 1 ... RETURNING`,
+    atômico mesmo com falhas simultâneas — o `incr` dos backends de cache é
+    um get + set que perderia incrementos. A janela de cada escopo é fixa
+    (`expira_em`, contada da primeira falha); `podar_expirados()` remove as
+    janelas vencidas (executado por `prune_tokens`). O IP vem de
+    `get_client_ip` (nunca de X-Forwarded-For).
+"""
+
+from __future__ import annotations
+
+import hashlib
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Max, Q
+from django.utils import timezone
+
+from ..models import ContadorLogin
+
+#   tentativas livres, base e teto do backoff (s), janela de esquecimento das falhas (s)
+POLITICA_PADRAO = {
+    "usuario": {"livres": 5, "base": 2, "maximo": 15 * 60, "janela": 60 * 60},
+    "ip": {"livres": 20, "base": 2, "maximo": 15 * 60, "janela": 60 * 60},
+}
+
+METRICAS = ("falhas", "bloqueadas", "sucessos")
+
+
+# --------------------------------------------------------------------------- #
+#  Public helpers                                                              #
+# --------------------------------------------------------------------------- #
+
+def espera(ip: str, username: str | None) -> int:
+    """Segundos até que `ip` / `username` possam tentar de novo (0 = liberado)."""
+    agora = timezone.now()
+    ate = ContadorLogin.objects.filter(
+        chave__in=[_chave(escopo, valor) for escopo, valor in _escopos(ip, username)],
+        bloqueado_ate__gt=agora,
+    ).aggregate(ate=Max("bloqueado_ate"))["ate"]
+
+    if ate is None:
+        return 0
+    return max(0, int((ate - agora).total_seconds() + 0.999))
+
+
+def registrar_falha(ip: str, username: str | None) -> None:
+    """Conta a falha em cada escopo e aplica o backoff a quem excedeu as livres."""
+    _incrementar_metrica("falhas")
+
+    for escopo, valor in _escopos(ip, username):
+        politica = _politica(escopo)
+        chave = _chave(escopo, valor)
+        agora = timezone.now()
+
+        falhas = _incrementar(chave, agora, agora + timedelta(seconds=politica["janela"]))
+
+        excedentes = falhas - politica["livres"]
+        if excedentes > 0:
+            duracao = min(politica["base"] * 2 ** (excedentes - 1), politica["maximo"])
+            _bloquear(chave, agora + timedelta(seconds=duracao))
+
+
+def registrar_sucesso(ip: str, username: str | None) -> None:
+    """Zera o histórico do username; o do IP só expira com a janela."""
+    _incrementar_metrica("sucessos")
+    if username:
+        ContadorLogin.objects.filter(
+            chave=_chave("usuario", _normalizar(username))
+        ).delete()
+
+
+def registrar_bloqueio() -> None:
+    _incrementar_metrica("bloqueadas")
+
+
+def metricas() -> dict:
+    """Contadores acumulados desde a criação da tabela."""
+    valores = dict(
+        ContadorLogin.objects
+        .filter(chave__in=[_chave_metrica(nome) for nome in METRICAS])
+        .values_list("chave", "total")
+    )
+    return {nome: valores.get(_chave_metrica(nome), 0) for nome in METRICAS}
+
+
+def podar_expirados(agora=None) -> int:
+    """Remove janelas vencidas e sem bloqueio pendente; devolve quantas."""
+    agora = agora or timezone.now()
+    removidos, _ = ContadorLogin.objects.filter(
+        Q(bloqueado_ate__isnull=True) | Q(bloqueado_ate__lte=agora),
+        expira_em__lte=agora,
+    ).delete()
+    return removidos
+
+
+# --------------------------------------------------------------------------- #
+#  Internal helpers                                                            #
+# --------------------------------------------------------------------------- #
+
+def _politica(escopo: str) -> dict:
+    politica = getattr(settings, "LOGIN_BACKOFF", {})
+    return {**POLITICA_PADRAO[escopo], **politica.get(escopo, {})}
+
+
+def _escopos(ip: str, username: str | None):
+    if ip:
+        yield "ip", ip
+    if username:
+        yield "usuario", _normalizar(username)
+
+
+def _normalizar(username: str) -> str:
+    return username.strip().lower()
+
+
+def _chave(escopo: str, valor: str) -> str:
+    # hash: usernames arbitrários viram chaves de tamanho fixo
+    return f"falhas:{escopo}:{hashlib.sha1(valor.encode()).hexdigest()}"
+
+
+def _chave_metrica(nome: str) -> str:
+    return f"metricas:{nome}"
+
+
+def _incrementar(chave: str, agora, expira_em) -> int:
+    """
+    `total + 1` em uma única instrução, recomeçando em 1 (com nova janela)
+    se a janela anterior já venceu. Devolve o novo total.
+    """
+    tabela = connection.ops.quote_name(ContadorLogin._meta.db_table)
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            INSERT INTO {tabela} AS c (chave, total, expira_em, bloqueado_ate)
+            VALUES (%(chave)s, 1, %(expira_em)s, NULL)
+            ON CONFLICT (chave) DO UPDATE SET
+                total = CASE WHEN c.expira_em <= %(agora)s THEN 1 ELSE c.total + 1 END,
+                expira_em = CASE WHEN c.expira_em <= %(agora)s
+                                 THEN EXCLUDED.expira_em ELSE c.expira_em END
+            RETURNING total
+            """,
+            {"chave": chave, "agora": agora, "expira_em": expira_em},
+        )
+        return cursor.fetchone()[0]
+
+
+def _bloquear(chave: str, ate) -> None:
+    # entre falhas simultâneas, prevalece o bloqueio mais longo
+    tabela = connection.ops.quote_name(ContadorLogin._meta.db_table)
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            UPDATE {tabela}
+               SET bloqueado_ate = GREATEST(COALESCE(bloqueado_ate, %(ate)s), %(ate)s)
+             WHERE chave = %(chave)s
+            """,
+            {"chave": chave, "ate": ate},
+        )
+
+
+def _incrementar_metrica(nome: str) -> None:
+    # métricas não expiram: `expira_em` nulo nunca satisfaz `<= agora`
+    _incrementar(_chave_metrica(nome), timezone.now(), None)
@@ -0,0 +1,60 @@
+"""
+    `backend/api/services/tokens.py`
+
+    Manutenção das tabelas de `rest_framework_simplejwt.token_blacklist`.
+
+    Com `ROTATE_REFRESH_TOKENS` e `BLACKLIST_AFTER_ROTATION`, cada refresh
+    grava um `OutstandingToken` e um `BlacklistedToken`. Depois de `expires_at`
+    nenhum dos dois é necessário: o próprio JWT já é recusado pela expiração.
+    `podar_tokens_expirados()` remove essas linhas em lotes curtos (um lote
+    por transação), para não segurar locks longos nem inchar o WAL. Os
+    registros de `RotacaoRefresh` que apontam para esses tokens saem antes.
+"""
+
+from __future__ import annotations
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+from ..models import RotacaoRefresh
+
+LOTE_PADRAO = 5000
+
+
+def podar_tokens_expirados(*, lote: int = LOTE_PADRAO, agora=None, dry_run: bool = False) -> dict:
+    """
+    Remove tokens expirados (e suas entradas de blacklist).
+
+    Retorna `{"outstanding": n, "blacklisted": n}`; em `dry_run` apenas conta.
+    """
+    agora = agora or timezone.now()
+    expirados = OutstandingToken.objects.filter(expires_at__lt=agora)
+
+    if dry_run:
+        return {
+            "outstanding": expirados.count(),
+            "blacklisted": BlacklistedToken.objects.filter(token__expires_at__lt=agora).count(),
+        }
+
+    total = {"outstanding": 0, "blacklisted": 0}
+    while True:
+        with transaction.atomic():
+            ids = list(expirados.order_by("expires_at").values_list("pk", flat=True)[:lote])
+            if not ids:
+                break
+
+            # DELETEs diretos, sem o Collector carregar as linhas em memória
+            RotacaoRefresh.objects.filter(
+                Q(anterior_id__in=ids) | Q(sucessor_id__in=ids)
+            )._raw_delete(RotacaoRefresh.objects.db)
+            total["blacklisted"] += BlacklistedToken.objects.filter(token_id__in=ids)._raw_delete(
+                BlacklistedToken.objects.db
+            )
+            total["outstanding"] += OutstandingToken.objects.filter(pk__in=ids)._raw_delete(
+                OutstandingToken.objects.db
+            )
+
+    return total
@@ -1,27 +1,85 @@
 """
     `backend/api/signals.py`
-    
+
     Sinais para o back-end.
 """
-from django.db.models.signals import post_save
+from django.conf import settings
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from .models import Emprestimo, Livro, Associado
+from .authentication.tokens import esquecer_usuario
+from .services.busca import CAMPOS_USUARIO, atualizar_documento_associados
+from .services.consistencia import agendar_reconciliacao
+from .services.snapshots import invalidar
 
 @receiver(post_save, sender=Emprestimo)
-def verificar_consistencia_emprestimo(sender, instance, created, **kwargs):
+def verificar_consistencia_emprestimo(sender, instance, created, using=None, **kwargs):
     """
     Signal para verificar consistência após salvar um empréstimo.
+
+    Não consulta nem grava nada durante o save: apenas registra o livro para
+    a reconciliação em lote feita em `transaction.on_commit`
+    (ver `services.consistencia`).
+
+    Escritas feitas por `api/services/emprestimos.py` já ajustam o status do
+    livro e marcam a instância com `_livro_sincronizado`; o signal cobre apenas
+    escritas que não passam pelo serviço.
+    """
+    if getattr(instance, "_livro_sincronizado", False):
+        return
+
+    agendar_reconciliacao(instance.livro_id, using=using)
+
+
+@receiver([post_save, post_delete], sender=Livro)
+def invalidar_snapshots_livro(sender, **kwargs):
+    """Escritas em `Livro` invalidam os snapshots de diagnóstico."""
+    invalidar("livro")
+
+
+@receiver([post_save, post_delete], sender=Emprestimo)
+def invalidar_snapshots_emprestimo(sender, **kwargs):
+    """Escritas em `Emprestimo` podem mudar também o status do livro."""
+    invalidar("emprestimo", "livro")
+
+
+@receiver([post_save, post_delete], sender=Associado)
+def invalidar_snapshots_associado(sender, **kwargs):
+    """`Associado` alimenta as estatísticas de associados."""
+    invalidar("associado")
+
+
+@receiver([post_save, post_delete], sender=settings.AUTH_USER_MODEL)
+def invalidar_snapshots_usuario(sender, update_fields=None, **kwargs):
+    """
+    De `User`, as estatísticas de associados só leem `is_active`. Saves
+    parciais sem esse campo (ex. `last_login` a cada login) são ignorados.
     """
-    livro = instance.livro
-    emprestimos_ativos = Emprestimo.objects.filter(
-        livro=livro,
-        data_devolucao__isnull=True
-    ).count()
-    
-    # Atualiza status baseado na realidade
-    if emprestimos_ativos > 0 and livro.status != Livro.Status.EMPRESTADO:
-        livro.status = Livro.Status.EMPRESTADO
-        livro.save()
-    elif emprestimos_ativos == 0 and livro.status == Livro.Status.EMPRESTADO:
-        livro.status = Livro.Status.DISPONIVEL
-        livro.save()
\ No newline at end of file
+    if update_fields is not None and "is_active" not in update_fields:
+        return
+    invalidar("associado")
+
+
+@receiver(post_save, sender=Associado)
+def atualizar_busca_associado(sender, instance, update_fields=None, **kwargs):
+    """Recalcula o documento de busca do associado salvo."""
+    if update_fields is not None and "telefone" not in update_fields:
+        return
+    atualizar_documento_associados(pk=instance.pk)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def atualizar_busca_usuario(sender, instance, update_fields=None, **kwargs):
+    """
+    Username, e-mail e nome vivem em `User`. Saves parciais que não tocam
+    esses campos (ex. `last_login` a cada login) são ignorados.
+    """
+    if update_fields is not None and not set(update_fields) & set(CAMPOS_USUARIO):
+        return
+    atualizar_documento_associados(user_id=instance.pk)
+
+
+@receiver([post_save, post_delete], sender=settings.AUTH_USER_MODEL)
+def esquecer_usuario_ativo(sender, instance, **kwargs):
+    """Desativações valem imediatamente para os tokens sem banco deste processo."""
+    esquecer_usuario(instance.pk)
@@ -0,0 +1,110 @@
+"""
+    `backend/api/tests/test_emprestimos.py`
+
+    Orçamento de instruções SQL das operações de `api/services/emprestimos.py`
+    (ver `ORCAMENTO_QUERIES`). Como na docstring do serviço, o controle de
+    transação (SAVEPOINT / RELEASE) não entra na conta.
+
+    Requer PostgreSQL (índices parciais e extensões das migrações):
+        python manage.py test api.tests.test_emprestimos
+"""
+
+from contextlib import contextmanager
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from api.models import Associado, Emprestimo, Livro
+from api.services import emprestimos
+from api.services.emprestimos import ORCAMENTO_QUERIES
+
+CONTROLE_TRANSACAO = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+
+class OrcamentoQueriesTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create_user("leitora", password="senha-de-teste")
+        cls.associado = Associado.objects.create(user=user, aniversario=date(1990, 1, 1))
+        cls.livro = Livro.objects.create(
+            id="L0001", titulo="Dom Casmurro", autor="Machado de Assis", ano=1899
+        )
+
+    # ---------------------------------------------------------------------- #
+    #  Helpers                                                                 #
+    # ---------------------------------------------------------------------- #
+
+    @contextmanager
+    def assertOrcamento(self, operacao: str):
+        """Como `assertNumQueries(ORCAMENTO_QUERIES[operacao])`, sem os savepoints."""
+        with CaptureQueriesContext(connection) as capturadas:
+            yield
+        instrucoes = [
+            consulta["sql"]
+            for consulta in capturadas.captured_queries
+            if not consulta["sql"].startswith(CONTROLE_TRANSACAO)
+        ]
+        self.assertEqual(
+            len(instrucoes),
+            ORCAMENTO_QUERIES[operacao],
+            f"{operacao} executou {len(instrucoes)} instrução(ões):\n" + "\n".join(instrucoes),
+        )
+
+    def _emprestimo_ativo(self) -> Emprestimo:
+        return emprestimos.emprestar(Emprestimo(livro=self.livro, associado=self.associado))
+
+    # ---------------------------------------------------------------------- #
+    #  Operações                                                               #
+    # ---------------------------------------------------------------------- #
+
+    def test_emprestar(self):
+        emprestimo = Emprestimo(livro=self.livro, associado=self.associado)
+
+        with self.assertOrcamento("emprestar"):
+            emprestimos.emprestar(emprestimo)
+
+        self.assertIsNotNone(emprestimo.pk)
+        self.livro.refresh_from_db()
+        self.assertEqual(self.livro.status, Livro.Status.EMPRESTADO)
+
+    def test_emprestar_livro_indisponivel(self):
+        self._emprestimo_ativo()
+        emprestimo = Emprestimo(livro_id=self.livro.pk, associado=self.associado)
+
+        with self.assertRaises(ValidationError):
+            emprestimos.emprestar(emprestimo)
+        self.assertIsNone(emprestimo.pk)
+
+    def test_devolver(self):
+        emprestimo = self._emprestimo_ativo()
+
+        with self.assertOrcamento("devolver"):
+            emprestimos.devolver(emprestimo, quem_devolveu=self.associado)
+
+        emprestimo.refresh_from_db()
+        self.assertIsNotNone(emprestimo.data_devolucao)
+        self.livro.refresh_from_db()
+        self.assertEqual(self.livro.status, Livro.Status.DISPONIVEL)
+
+    def test_renovar(self):
+        emprestimo = self._emprestimo_ativo()
+        prevista = emprestimo.data_prevista
+
+        with self.assertOrcamento("renovar"):
+            emprestimos.renovar(emprestimo)
+
+        emprestimo.refresh_from_db()
+        self.assertEqual(
+            (emprestimo.data_prevista - prevista).days, emprestimos.DIAS_RENOVACAO
+        )
+
+    def test_renovar_devolvido(self):
+        emprestimo = emprestimos.devolver(self._emprestimo_ativo())
+
+        with self.assertRaises(ValidationError):
+            emprestimos.renovar(emprestimo)
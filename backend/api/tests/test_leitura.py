@@ -0,0 +1,137 @@
+"""
+    `backend/api/tests/test_leitura.py`
+
+    Paridade dos serializers de leitura (`api/serializers/Leitura.py`) com os
+    serializers de modelo que reproduzem: mesmas linhas, mesmo JSON — nomes
+    em branco ou só com espaços Unicode, `quem_devolveu` nulo, datas e fuso.
+
+    Requer PostgreSQL (BTRIM, índices parciais das migrações):
+        python manage.py test api.tests.test_leitura
+"""
+
+from datetime import date, datetime, timezone
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+
+from rest_framework.test import APIClient
+
+from api.models import Associado, Emprestimo, Livro
+from api.serializers import (
+    AssociadoLeituraSerializer,
+    AssociadoSerializer,
+    EmprestimoLeituraSerializer,
+    EmprestimoSerializer,
+)
+from api.serializers.Leitura import CHAVE_PK
+
+#   (first_name, last_name) — o nome exibido cai no username quando vazio
+NOMES = [
+    ("Ana", "Souza"),
+    ("", ""),
+    ("  Bento", ""),
+    ("", "Carvalho\xa0"),
+    ("\u2003", "\u3000"),
+    ("\x1c\x1f", "\x85"),
+    ("\u2028Dora", "Lima\u202f"),
+]
+
+
+class ParidadeLeituraTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.associados = []
+        for i, (first_name, last_name) in enumerate(NOMES):
+            user = User.objects.create_user(
+                f"associado{i}", first_name=first_name, last_name=last_name,
+                email=f"associado{i}@example.com",
+            )
+            User.objects.filter(pk=user.pk).update(
+                date_joined=datetime(2025, 12, 31, 23, 59, 58, 123456, tzinfo=timezone.utc)
+            )
+            cls.associados.append(Associado.objects.create(
+                user=user, aniversario=date(1990, 1, 1 + i), telefone="" if i % 2 else "11 5555-0000",
+            ))
+
+        gerente = cls.associados[0]
+        for i, associado in enumerate(cls.associados):
+            livro = Livro.objects.create(
+                id=f"L{i:04d}", titulo=f"O Ateneu — {i}", autor="Raul Pompeia", ano=1888
+            )
+            devolvido = i % 2 == 0
+            Emprestimo.objects.create(
+                livro=livro,
+                associado=associado,
+                data_prevista=date(2026, 2, 1 + i),
+                data_devolucao=date(2026, 1, 20) if devolvido else None,
+                quem_emprestou=gerente,
+                quem_devolveu=associado if devolvido else None,
+            )
+
+    # ---------------------------------------------------------------------- #
+    #  Helpers                                                                 #
+    # ---------------------------------------------------------------------- #
+
+    def _comparar(self, referencia, leitura, queryset, campos=None):
+        context = {} if campos is None else {"campos": campos}
+        esperado = referencia(queryset, many=True, context=context).data
+        obtido = leitura(leitura.preparar(queryset, campos), many=True, context=context).data
+
+        if campos is not None:
+            esperado = [{k: v for k, v in linha.items() if k in campos} for linha in esperado]
+        self.assertEqual([dict(linha) for linha in obtido], [dict(linha) for linha in esperado])
+
+    # ---------------------------------------------------------------------- #
+    #  Tests                                                                   #
+    # ---------------------------------------------------------------------- #
+
+    def test_emprestimos(self):
+        queryset = Emprestimo.objects.select_related(
+            "livro", "associado__user", "quem_emprestou__user", "quem_devolveu__user"
+        ).order_by("id")
+        self._comparar(EmprestimoSerializer, EmprestimoLeituraSerializer, queryset)
+
+    def test_emprestimos_campos_esparsos(self):
+        queryset = Emprestimo.objects.select_related("associado__user", "quem_devolveu__user").order_by("id")
+        campos = {"associado_nome", "quem_devolveu", "quem_devolveu_nome", "data_devolucao"}
+        self._comparar(EmprestimoSerializer, EmprestimoLeituraSerializer, queryset, campos)
+
+    def test_associados(self):
+        queryset = Associado.objects.select_related("user").order_by("id")
+        self._comparar(AssociadoSerializer, AssociadoLeituraSerializer, queryset)
+
+    def test_nome_so_com_espacos_cai_no_username(self):
+        campos = {"associado_nome"}
+        queryset = EmprestimoLeituraSerializer.preparar(
+            Emprestimo.objects.filter(associado=self.associados[4]), campos
+        )
+        dados = EmprestimoLeituraSerializer(queryset, many=True, context={"campos": campos}).data
+        self.assertEqual(dados[0]["associado_nome"], "associado4")
+
+
+    def test_pk_sempre_selecionada_e_fora_da_saida(self):
+        campos = {"livro_titulo"}
+        linhas = list(EmprestimoLeituraSerializer.preparar(Emprestimo.objects.all(), campos))
+        dados = EmprestimoLeituraSerializer(linhas, many=True, context={"campos": campos}).data
+
+        self.assertTrue(all(CHAVE_PK in linha for linha in linhas))
+        self.assertTrue(all(set(linha) == campos for linha in dados))
+
+    @override_settings(REST_FRAMEWORK={**settings.REST_FRAMEWORK, "PAGE_SIZE": 3})
+    def test_cursor_com_campos_esparsos(self):
+        cliente = APIClient()
+        cliente.force_authenticate(self.associados[0].user)
+
+        for consulta in ("fields=livro_titulo", "omit=id"):
+            vistos = []
+            url = f"/api/emprestimos/?cursor=&{consulta}"
+            while url:
+                resposta = cliente.get(url)
+                self.assertEqual(resposta.status_code, 200, consulta)
+                vistos += resposta.json()["results"]
+                url = resposta.json()["next"]
+
+            self.assertEqual(len(vistos), len(NOMES), consulta)
+            self.assertTrue(all("id" not in linha and CHAVE_PK not in linha for linha in vistos))
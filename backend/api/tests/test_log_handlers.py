@@ -0,0 +1,75 @@
+"""
+    `backend/api/tests/test_log_handlers.py`
+
+    `DatabaseAuditHandler` (ver `api/log_handlers.py`): um registro que não
+    pode ser gravado se perde sozinho, sem levar o lote nem a thread de
+    gravação periódica junto.
+
+    Requer PostgreSQL (extensões das migrações):
+        python manage.py test api.tests.test_log_handlers
+"""
+
+import logging
+from datetime import date
+from unittest import mock
+
+from django.test import TestCase
+
+from api.log_handlers import DatabaseAuditHandler
+from api.models import AuditLog
+
+
+def _registro(mensagem, **extras):
+    return logging.makeLogRecord({
+        "name": "api.audit",
+        "levelno": logging.INFO,
+        "levelname": "INFO",
+        "msg": mensagem,
+        "action": "UPDATE",
+        "resource_type": "livro",
+        **extras,
+    })
+
+
+@mock.patch("logging.raiseExceptions", False)
+class DatabaseAuditHandlerTests(TestCase):
+
+    def setUp(self):
+        # intervalo longo: só os flush() explícitos do teste gravam
+        self.handler = DatabaseAuditHandler(capacity=100, intervalo=3600)
+        self.addCleanup(self.handler.close)
+
+    def test_registro_invalido_nao_descarta_o_lote(self):
+        self.handler.handle(_registro("antes"))
+        self.handler.handle(_registro("data crua", details={"devolucao": date(2026, 1, 5)}))
+        self.handler.handle(_registro("depois"))
+        self.handler.flush()
+
+        self.assertEqual(
+            sorted(AuditLog.objects.values_list("message", flat=True)), ["antes", "depois"]
+        )
+
+    def test_registros_seguintes_continuam_gravados(self):
+        self.handler.handle(_registro("conjunto", diff={"tags": {"a", "b"}}))
+        self.handler.flush()
+
+        self.handler.handle(_registro("seguinte"))
+        self.handler.flush()
+
+        self.assertEqual(list(AuditLog.objects.values_list("message", flat=True)), ["seguinte"])
+
+    def test_thread_periodica_sobrevive_a_um_flush_com_erro(self):
+        handler = DatabaseAuditHandler(intervalo=0.001)
+        chamadas = []
+
+        def flush():
+            chamadas.append(1)
+            if len(chamadas) == 1:
+                raise RuntimeError("banco reiniciando")
+            if len(chamadas) == 3:
+                handler._parar.set()
+
+        with mock.patch.object(handler, "flush", side_effect=flush):
+            handler._gravar_periodicamente()
+
+        self.assertEqual(len(chamadas), 3)
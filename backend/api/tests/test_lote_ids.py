@@ -0,0 +1,118 @@
+"""
+    `backend/api/tests/test_lote_ids.py`
+
+    `GET /api/<recurso>/?ids=...` (`LoteIdsMixin`, ver `api/mixins.py`):
+    ordem pedida, ids repetidos, limite por chamada, ids inválidos, ids fora
+    do alcance do usuário e combinação com `?fields=`.
+
+    Requer PostgreSQL (índices parciais e extensões das migrações):
+        python manage.py test api.tests.test_lote_ids
+"""
+
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from rest_framework.test import APIClient
+
+from api.mixins import LoteIdsMixin
+from api.models import Associado, Emprestimo, Livro
+
+
+class LoteIdsTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.associados = []
+        for i in range(3):
+            user = User.objects.create_user(f"associado{i}", first_name=f"Nome {i}")
+            cls.associados.append(Associado.objects.create(user=user, aniversario=date(1990, 1, 1)))
+
+        inativo = User.objects.create_user("inativo", is_active=False)
+        cls.inativo = Associado.objects.create(user=inativo, aniversario=date(1990, 1, 1))
+
+        cls.livros = [
+            Livro.objects.create(id=f"L{i:04d}", titulo=f"Iracema {i}", autor="José de Alencar", ano=1865)
+            for i in range(3)
+        ]
+        cls.emprestimos = [
+            Emprestimo.objects.create(
+                livro=livro,
+                associado=cls.associados[i],
+                data_prevista=date(2026, 2, 1),
+                quem_emprestou=cls.associados[0],
+            )
+            for i, livro in enumerate(cls.livros)
+        ]
+
+    def setUp(self):
+        self.cliente = APIClient()
+        self.cliente.force_authenticate(self.associados[0].user)
+
+    # ---------------------------------------------------------------------- #
+    #  Helpers                                                                 #
+    # ---------------------------------------------------------------------- #
+
+    def _lote(self, recurso, ids, **params):
+        resposta = self.cliente.get(f"/api/{recurso}/", {"ids": ids, **params})
+        return resposta.status_code, resposta.json()
+
+    # ---------------------------------------------------------------------- #
+    #  Tests                                                                   #
+    # ---------------------------------------------------------------------- #
+
+    def test_preserva_a_ordem_pedida(self):
+        status, corpo = self._lote("livros", "L0002,L0000,L0001")
+
+        self.assertEqual(status, 200)
+        self.assertEqual([livro["id"] for livro in corpo["results"]], ["L0002", "L0000", "L0001"])
+        self.assertEqual(corpo["nao_encontrados"], [])
+
+    def test_ids_repetidos_aparecem_uma_vez(self):
+        ids = [e.pk for e in self.emprestimos]
+        status, corpo = self._lote("emprestimos", f"{ids[1]},{ids[0]},{ids[1]}, 0{ids[0]}")
+
+        self.assertEqual(status, 200)
+        self.assertEqual([e["id"] for e in corpo["results"]], [ids[1], ids[0]])
+
+    def test_limite_de_ids_por_chamada(self):
+        limite = LoteIdsMixin.ids_limite
+        distintos = ",".join(f"L{i:04d}" for i in range(limite + 1))
+
+        status, corpo = self._lote("livros", distintos)
+        self.assertEqual(status, 400)
+        self.assertIn("ids", corpo)
+
+        # repetidos não contam para o limite
+        repetidos = ",".join(["L0000"] * (limite + 50))
+        status, corpo = self._lote("livros", repetidos)
+        self.assertEqual(status, 200)
+        self.assertEqual(len(corpo["results"]), 1)
+
+    def test_ids_nao_inteiros_sao_recusados(self):
+        for recurso in ("associados", "emprestimos"):
+            with self.subTest(recurso=recurso):
+                status, corpo = self._lote(recurso, f"{self.associados[0].pk},abc")
+                self.assertEqual(status, 400)
+                self.assertIn("ids", corpo)
+
+    def test_lista_vazia_e_recusada(self):
+        status, _ = self._lote("livros", " , ")
+        self.assertEqual(status, 400)
+
+    def test_fora_do_alcance_do_usuario_vem_em_nao_encontrados(self):
+        # usuário comum só enxerga associados ativos (`AssociadoViewSet.get_queryset`)
+        ativo, inativo = self.associados[1].pk, self.inativo.pk
+        status, corpo = self._lote("associados", f"{inativo},{ativo},999999")
+
+        self.assertEqual(status, 200)
+        self.assertEqual([a["id"] for a in corpo["results"]], [ativo])
+        self.assertEqual(corpo["nao_encontrados"], [inativo, 999999])
+
+    def test_combinado_com_fields(self):
+        status, corpo = self._lote("livros", "L0001,L9999,L0000", fields="titulo")
+
+        self.assertEqual(status, 200)
+        self.assertEqual(corpo["results"], [{"titulo": "Iracema 1"}, {"titulo": "Iracema 0"}])
+        self.assertEqual(corpo["nao_encontrados"], ["L9999"])
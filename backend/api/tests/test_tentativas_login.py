@@ -0,0 +1,97 @@
+"""
+    `backend/api/tests/test_tentativas_login.py`
+
+    Contadores de `api/services/tentativas_login.py` sob falhas simultâneas:
+    cada thread usa a sua conexão, como workers distintos do gunicorn, e
+    nenhum incremento pode se perder.
+
+    Requer PostgreSQL (`INSERT ... ON CONFLICT ... RETURNING`):
+        python manage.py test api.tests.test_tentativas_login
+"""
+
+import threading
+from datetime import timedelta
+
+from django.db import connection
+from django.test import TransactionTestCase, override_settings
+from django.utils import timezone
+
+from api.models import ContadorLogin
+from api.services import tentativas_login
+from api.services.tentativas_login import _chave
+
+THREADS = 8
+FALHAS_POR_THREAD = 10
+
+
+@override_settings(LOGIN_BACKOFF={})
+class FalhasSimultaneasTests(TransactionTestCase):
+
+    def _em_paralelo(self, alvo):
+        barreira = threading.Barrier(THREADS)
+        erros = []
+
+        def executar():
+            try:
+                barreira.wait()
+                for _ in range(FALHAS_POR_THREAD):
+                    alvo()
+            except Exception as exc:  # pragma: no cover - exibido na falha
+                erros.append(exc)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=executar) for _ in range(THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(erros, [])
+
+    def test_nenhuma_falha_se_perde(self):
+        self._em_paralelo(lambda: tentativas_login.registrar_falha("203.0.113.7", "Leitora"))
+
+        total = THREADS * FALHAS_POR_THREAD
+        ip = ContadorLogin.objects.get(chave=_chave("ip", "203.0.113.7"))
+        usuario = ContadorLogin.objects.get(chave=_chave("usuario", "leitora"))
+
+        self.assertEqual(ip.total, total)
+        self.assertEqual(usuario.total, total)
+        self.assertEqual(tentativas_login.metricas()["falhas"], total)
+
+        # janela fixa de 1 h a partir da primeira falha, com bloqueio ativo
+        self.assertGreater(usuario.expira_em, timezone.now() + timedelta(minutes=55))
+        self.assertGreater(usuario.bloqueado_ate, timezone.now())
+        self.assertGreater(tentativas_login.espera("203.0.113.7", "leitora"), 0)
+
+    def test_janela_vencida_recomeca_a_contagem(self):
+        tentativas_login.registrar_falha("203.0.113.7", None)
+        chave = _chave("ip", "203.0.113.7")
+        ContadorLogin.objects.filter(chave=chave).update(
+            total=50, expira_em=timezone.now() - timedelta(seconds=1)
+        )
+
+        tentativas_login.registrar_falha("203.0.113.7", None)
+
+        self.assertEqual(ContadorLogin.objects.get(chave=chave).total, 1)
+
+    def test_sucesso_zera_apenas_o_usuario(self):
+        tentativas_login.registrar_falha("203.0.113.7", "leitora")
+        tentativas_login.registrar_sucesso("203.0.113.7", " Leitora ")
+
+        self.assertFalse(ContadorLogin.objects.filter(chave=_chave("usuario", "leitora")).exists())
+        self.assertTrue(ContadorLogin.objects.filter(chave=_chave("ip", "203.0.113.7")).exists())
+
+    def test_poda_preserva_metricas_e_bloqueios(self):
+        agora = timezone.now()
+        ContadorLogin.objects.create(chave="falhas:ip:vencida", total=3, expira_em=agora)
+        ContadorLogin.objects.create(
+            chave="falhas:ip:bloqueada", total=30, expira_em=agora,
+            bloqueado_ate=agora + timedelta(minutes=5),
+        )
+        tentativas_login.registrar_bloqueio()
+
+        self.assertEqual(tentativas_login.podar_expirados(agora + timedelta(seconds=1)), 1)
+        self.assertEqual(tentativas_login.metricas()["bloqueadas"], 1)
+        self.assertTrue(ContadorLogin.objects.filter(chave="falhas:ip:bloqueada").exists())
@@ -0,0 +1,30 @@
+"""
+    `backend/api/throttling.py`
+
+    Custom DRF throttle classes for the API.
+"""
+
+from rest_framework.throttling import BaseThrottle
+
+from .services.audit_log import get_client_ip
+from .services import tentativas_login
+
+
+class LoginBackoffThrottle(BaseThrottle):
+    """
+    Rejects login attempts while the client IP or the submitted username is
+    in backoff (see `services.tentativas_login`). DRF runs throttles before
+    the handler, so blocked attempts never reach `authenticate()`.
+    """
+
+    def allow_request(self, request, view):
+        username = request.data.get("username") if hasattr(request.data, "get") else None
+        self.espera = tentativas_login.espera(get_client_ip(request), username)
+
+        if self.espera:
+            tentativas_login.registrar_bloqueio()
+            return False
+        return True
+
+    def wait(self):
+        return self.espera
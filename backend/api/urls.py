@@ -6,13 +6,21 @@ from rest_framework.routers import DefaultRouter
 from api.views.Livro import LivroViewSet
 from api.views.Emprestimo import EmprestimoViewSet
 from api.views.Associado import AssociadoViewSet
-from api.views.Diagnostico import DiagnosticoView, LivrosDiagnosticoView
+from api.views.Auditoria import AuditoriaViewSet
+from api.views.Autocomplete import AutocompleteView
+from api.views.Diagnostico import (
+    DiagnosticoView,
+    LivrosDiagnosticoView,
+    MetricasAutenticacaoView,
+    ReconciliarStatusView,
+)
 
 
 router = DefaultRouter()
 router.register("livros",      LivroViewSet,      basename="livro")
 router.register("emprestimos", EmprestimoViewSet, basename="emprestimo")
 router.register("associados",  AssociadoViewSet,  basename="associado")
+router.register("auditoria",   AuditoriaViewSet,  basename="auditoria")
 
 
 urlpatterns = [
@@ -22,7 +30,12 @@ urlpatterns = [
     # Autenticação (login, logout, refresh, me)
     path("auth/", include("api.urls_auth")),
 
+    # Autocomplete (seletores de livro / associado)
+    path("autocomplete/", AutocompleteView.as_view(), name="autocomplete"),
+
     # Diagnóstico
     path("diagnostico/",        DiagnosticoView.as_view(),       name="diagnostico"),
     path("diagnostico/livros/", LivrosDiagnosticoView.as_view(), name="diagnostico-livros"),
+    path("diagnostico/reconciliar/", ReconciliarStatusView.as_view(), name="diagnostico-reconciliar"),
+    path("diagnostico/autenticacao/", MetricasAutenticacaoView.as_view(), name="diagnostico-autenticacao"),
 ]
\ No newline at end of file
@@ -1,2 +1,3 @@
 # backend/api/utils/__init__.py
 from .diff import generate_diff
+from .ttl_cache import TTLCache
@@ -0,0 +1,50 @@
+"""
+    `backend/api/utils/busca.py`, expressões de busca textual
+
+    A busca do catálogo compara textos normalizados: minúsculos e sem acentos
+    ("Aluísio" e "aluisio" são o mesmo documento). A normalização é feita no
+    próprio Postgres por `f_unaccent()`, um invólucro IMMUTABLE de `unaccent()`
+    criado pela migração 0024 — só funções imutáveis podem aparecer em
+    índices de expressão.
+
+    `documento_busca()` é usada tanto em `Meta.indexes` quanto nos filtros:
+    o SQL gerado precisa ser idêntico nos dois lugares para que o planner
+    use o índice GIN (`gin_trgm_ops`).
+"""
+
+from django.db.models import CharField, Func, Value
+from django.db.models.functions import Concat, Lower
+
+
+class FUnaccent(Func):
+    """`f_unaccent(texto)`: remove acentos (IMMUTABLE, indexável)."""
+
+    function = "f_unaccent"
+    output_field = CharField()
+
+
+def normalizar(expressao):
+    """Expressão minúscula e sem acentos."""
+    return FUnaccent(Lower(expressao))
+
+
+def documento_busca(*campos: str):
+    """
+    Documento de busca de um modelo: os `campos` concatenados com espaço e
+    normalizados, ex. `documento_busca("titulo", "autor")`.
+    """
+    if len(campos) == 1:
+        return normalizar(campos[0])
+
+    partes = []
+    for campo in campos:
+        if partes:
+            partes.append(Value(" "))
+        partes.append(campo)
+
+    return normalizar(Concat(*partes, output_field=CharField()))
+
+
+def termo_busca(termo: str):
+    """Termo digitado pelo usuário, normalizado do mesmo modo que o documento."""
+    return normalizar(Value(termo, output_field=CharField()))
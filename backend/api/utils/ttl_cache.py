@@ -0,0 +1,74 @@
+"""
+    `backend/api/utils/ttl_cache.py`, cache em memória do processo
+
+    `TTLCache` é um dicionário LRU com expiração por entrada, seguro entre
+    threads. Serve para dados quentes e baratos de recalcular (prefixos de
+    autocomplete, estado de usuários, ...), onde ir ao cache do Django ou ao
+    banco custaria mais do que o próprio dado.
+
+    Cada processo (worker) tem a sua cópia: use apenas quando alguns segundos
+    de defasagem entre workers forem aceitáveis.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+_AUSENTE = object()
+
+
+class TTLCache:
+    """
+    Cache LRU com no máximo `maxsize` entradas, cada uma válida por `ttl`
+    segundos (ou pelo `ttl` informado em `set`).
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 30.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._dados: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, chave, default=None):
+        with self._lock:
+            item = self._dados.get(chave, _AUSENTE)
+            if item is _AUSENTE:
+                return default
+
+            expira_em, valor = item
+            if expira_em <= time.monotonic():
+                del self._dados[chave]
+                return default
+
+            self._dados.move_to_end(chave)
+            return valor
+
+    def set(self, chave, valor, ttl: float | None = None) -> None:
+        expira_em = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._dados[chave] = (expira_em, valor)
+            self._dados.move_to_end(chave)
+            while len(self._dados) > self.maxsize:
+                self._dados.popitem(last=False)
+
+    def get_or_set(self, chave, calcular, ttl: float | None = None):
+        """Valor em cache ou `calcular()`, guardado por `ttl` segundos."""
+        valor = self.get(chave, _AUSENTE)
+        if valor is _AUSENTE:
+            valor = calcular()
+            self.set(chave, valor, ttl)
+        return valor
+
+    def __contains__(self, chave) -> bool:
+        return self.get(chave, _AUSENTE) is not _AUSENTE
+
+    def discard(self, chave) -> None:
+        with self._lock:
+            self._dados.pop(chave, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._dados.clear()
+
+    def __len__(self) -> int:
+        return len(self._dados)
@@ -4,7 +4,7 @@
     ViewSet para o modelo `Associado`.
     `Associado` é o perfil estendido de um `User` da aplicação.
 
-    @version: 3.0
+    @version: 3.2
 """
 
 from rest_framework import viewsets, filters, status
@@ -15,12 +15,14 @@ from rest_framework.response import Response
 from django.db import transaction
 from django.core.exceptions import ValidationError
 
+from ..filters import UnaccentSearchFilter
+from ..mixins import CamposEsparsosMixin, LeituraRapidaMixin, LoteIdsMixin
 from ..models import Associado
-from ..serializers import AssociadoSerializer, AssociadoCreateSerializer
+from ..serializers import AssociadoSerializer, AssociadoCreateSerializer, AssociadoLeituraSerializer
 from ..services.audit_log import audit_log
 
 
-class AssociadoViewSet(viewsets.ModelViewSet):
+class AssociadoViewSet(CamposEsparsosMixin, LoteIdsMixin, LeituraRapidaMixin, viewsets.ModelViewSet):
     """
     ViewSet para gerenciar Associados.
 
@@ -36,24 +38,27 @@ class AssociadoViewSet(viewsets.ModelViewSet):
 
     Endpoints personalizados
     ------------------------
+    GET         /api/associados/?ids=1,2,3   (vários por id; ver `api/mixins.py`)
     GET         /api/associados/me/
     PUT/PATCH   /api/associados/me/atualizar/
     POST        /api/associados/{id}/activate/
     POST        /api/associados/{id}/deactivate/
     GET         /api/associados/search/?q=termo
+
+    Listagem e busca usam `AssociadoLeituraSerializer` (`values()` com JOIN
+    em `auth_user`; ver `api/mixins.py`). `?fields=` / `?omit=` reduzem a
+    resposta e a consulta (sem JOIN quando nenhum campo do User é pedido).
     """
 
     queryset = Associado.objects.select_related("user").all()
     serializer_class = AssociadoSerializer
+    leitura_serializer_class = AssociadoLeituraSerializer
+    leitura_actions = ("list", "search_associados")
 
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
-    search_fields = [
-        "user__username",
-        "user__email",
-        "user__first_name",
-        "user__last_name",
-        "telefone",
-    ]
+    filter_backends = [filters.OrderingFilter, UnaccentSearchFilter]
+    # username, e-mail, nome, sobrenome e telefone, normalizados e indexados
+    # (ver `services.busca`)
+    search_document_field = "documento_busca"
     ordering_fields = ["user__username", "user__date_joined", "aniversario", "data_cadastro"]
     ordering = ["user__username"]
 
@@ -320,8 +325,8 @@ class AssociadoViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=["get"], url_path="search")
     def search_associados(self, request):
         """
-        Busca avançada por username, e-mail ou nome.
-        Admins recebem resultados incluindo inativos.
+        Busca por username, e-mail, nome ou telefone, sem acentos e ordenada
+        por relevância. Admins recebem resultados incluindo inativos.
 
         GET /api/associados/search/?q=termo
         """
@@ -333,16 +338,8 @@ class AssociadoViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # Q objects evitam os múltiplos querysets unidos com |, que geram UNIONs
-        # ineficientes e podem duplicar resultados.
-        from django.db.models import Q
-
-        qs = self.get_queryset().filter(
-            Q(user__username__icontains=query)
-            | Q(user__email__icontains=query)
-            | Q(user__first_name__icontains=query)
-            | Q(user__last_name__icontains=query)
-        )
+        # mesmo documento indexado de `?search=`, ordenado por relevância
+        qs = UnaccentSearchFilter().buscar(self.get_queryset(), query.split(), self, request)
 
         # get_queryset() já filtra inativos para não-admins
         return self._paginated_response(qs)
@@ -352,14 +349,9 @@ class AssociadoViewSet(viewsets.ModelViewSet):
     # ---------------------------------------------------------------------- #
 
     def _get_my_associado(self, request) -> Associado:
-        try:
-            return request.user.associado
-        except Associado.DoesNotExist:
+        """`request.associado` (uma query, já com `user`) ou 404."""
+        associado = request.associado
+        if not associado:
             from rest_framework.exceptions import NotFound
             raise NotFound("Perfil de associado não encontrado.")
-
-    def _paginated_response(self, queryset):
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            return self.get_paginated_response(self.get_serializer(page, many=True).data)
-        return Response(self.get_serializer(queryset, many=True).data)
+        return associado
@@ -0,0 +1,39 @@
+"""
+    `backend/api/views/Auditoria.py`
+
+    Consulta aos registros de auditoria gravados em `AuditLog`.
+"""
+
+from rest_framework import viewsets
+from rest_framework.permissions import IsAuthenticated
+
+from django_filters.rest_framework import DjangoFilterBackend
+
+from ..filters import AuditLogFilter
+from ..models import AuditLog
+from ..pagination import KeysetPagination
+from ..permissions import IsStaff
+from ..serializers import AuditLogSerializer
+
+
+class AuditoriaViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    Registros de auditoria, do mais recente para o mais antigo.
+    Restrito a gerentes / administradores.
+
+    GET /api/auditoria/?resource_type=livro&resource_id=L001
+    GET /api/auditoria/?actor_id=3&desde=2026-10-01T00:00:00Z
+    GET /api/auditoria/{id}/
+
+    Paginação sempre por cursor (`next` / `previous`): a tabela só cresce, e
+    `ORDER BY id DESC` com keyset percorre a chave primária sem `COUNT(*)`
+    nem `OFFSET`.
+    """
+
+    queryset = AuditLog.objects.order_by("-id")
+    serializer_class = AuditLogSerializer
+    permission_classes = [IsAuthenticated, IsStaff]
+    pagination_class = KeysetPagination
+
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = AuditLogFilter
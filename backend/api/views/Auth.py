@@ -19,12 +19,19 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework import status
+from rest_framework.exceptions import ValidationError
 
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.exceptions import TokenError, InvalidToken
 
+from api.authentication.rotacao import rotacionar
+from api.authentication.tokens import AssociadoRefreshToken
 from api.serializers.auth import LoginSerializer, AssociadoAuthSerializer
+from api.middleware import carregar_associado
 from api.models import Associado
+from api.services import tentativas_login
+from api.services.audit_log import get_client_ip
+from api.throttling import LoginBackoffThrottle
 
 logger = logging.getLogger("api.auth")
 
@@ -72,13 +79,12 @@ def _delete_auth_cookies(response: Response) -> None:
     response.delete_cookie(jwt_settings.get("AUTH_COOKIE_REFRESH", "refresh_token"))
 
 
-def _get_associado(user) -> Associado:
-    """Retorna o Associado vinculado ao User, ou lança 404."""
-    try:
-        return user.associado
-    except Associado.DoesNotExist:
+def _get_associado(associado) -> Associado:
+    """Retorna o Associado (ex. `request.associado`), ou lança 404."""
+    if not associado:
         from rest_framework.exceptions import NotFound
         raise NotFound("Perfil de associado não encontrado para este usuário.")
+    return associado
 
 
 # ─── Views ────────────────────────────────────────────────────────────────────
@@ -94,20 +100,33 @@ class LoginView(APIView):
 
     Response 200:
         { "user": <Associado> }
+
+    Response 429:
+        IP ou username em backoff após falhas repetidas (ver
+        `services.tentativas_login`); o header Retry-After indica a espera.
     """
 
     permission_classes = [AllowAny]
+    throttle_classes   = [LoginBackoffThrottle]
 
     def post(self, request):
+        ip       = get_client_ip(request)
+        username = request.data.get("username") if hasattr(request.data, "get") else None
+
         serializer = LoginSerializer(
             data=request.data,
             context={"request": request},
         )
-        serializer.is_valid(raise_exception=True)
+        if not serializer.is_valid():
+            tentativas_login.registrar_falha(ip, username)
+            logger.warning("Login recusado", extra={"user": username, "ip": ip})
+            raise ValidationError(serializer.errors)
+
+        tentativas_login.registrar_sucesso(ip, username)
 
         user      = serializer.validated_data["user"]
-        associado = _get_associado(user)
-        refresh   = RefreshToken.for_user(user)
+        associado = _get_associado(carregar_associado(user))
+        refresh   = AssociadoRefreshToken.for_user(user)
 
         response = Response(
             {"user": AssociadoAuthSerializer(associado).data},
@@ -137,7 +156,7 @@ class LogoutView(APIView):
 
         if refresh_token:
             try:
-                token = RefreshToken(refresh_token)
+                token = AssociadoRefreshToken(refresh_token)
                 token.blacklist()
             except (TokenError, InvalidToken):
                 # Token já expirado ou inválido — prossegue com o logout de qualquer forma
@@ -178,11 +197,10 @@ class RefreshView(APIView):
             )
 
         try:
-            refresh  = RefreshToken(refresh_token)
-            # blacklista o token atual e emite um novo (ROTATE_REFRESH_TOKENS)
-            refresh.blacklist()
-            new_refresh = RefreshToken.for_user(refresh.access_token.payload)
-        except (TokenError, InvalidToken) as exc:
+            # blacklista o token atual e emite um novo em uma única transação
+            # (ROTATE_REFRESH_TOKENS); abas concorrentes recebem o mesmo sucessor
+            new_refresh = rotacionar(refresh_token)
+        except (TokenError, InvalidToken):
             return Response(
                 {"detail": "Refresh token inválido ou expirado."},
                 status=status.HTTP_401_UNAUTHORIZED,
@@ -206,5 +224,5 @@ class MeView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        associado = _get_associado(request.user)
+        associado = _get_associado(request.associado)
         return Response(AssociadoAuthSerializer(associado).data)
\ No newline at end of file
@@ -0,0 +1,54 @@
+"""
+    `backend/api/views/Autocomplete.py`
+
+    Sugestões por prefixo para os seletores do frontend.
+"""
+
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from api.services.autocomplete import LIMITE_PADRAO, TIPOS, sugerir
+
+
+class AutocompleteView(APIView):
+    """
+    GET /api/autocomplete/?q=<prefixo>&kind=livro|associado[&limit=N]
+
+    Retorna `{"kind", "q", "results": [...]}` com no máximo `limit`
+    registros (padrão 10, máximo 25):
+
+        livro       {"id", "titulo", "status"}
+        associado   {"id", "username", "nome"}
+
+    Associados inativos só aparecem para gerentes / administradores.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        tipo = request.query_params.get("kind", "livro")
+        prefixo = request.query_params.get("q", "")
+
+        try:
+            limite = int(request.query_params.get("limit", LIMITE_PADRAO))
+        except ValueError:
+            return Response(
+                {"detail": 'Parâmetro "limit" deve ser um inteiro.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            resultados = sugerir(
+                tipo,
+                prefixo,
+                limite=limite,
+                incluir_inativos=request.user.is_staff,
+            )
+        except ValueError:
+            return Response(
+                {"detail": f'Parâmetro "kind" deve ser um de: {", ".join(TIPOS)}.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        return Response({"kind": tipo, "q": prefixo, "results": resultados})
@@ -4,12 +4,23 @@
     Exibe dados sobre os outros modelos do sistema e executa métodos de verificação de consistência dos dados.
 """
 
+from django.http import StreamingHttpResponse
+
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from rest_framework.permissions import AllowAny
-from api.models import Livro, Emprestimo, Associado
-from django.db.models import Count, Q
-from datetime import datetime
+from rest_framework.permissions import AllowAny, IsAuthenticated
+from api.permissions import IsStaff
+from api.services.audit_log import audit_log
+from api.services.consistencia import reconciliar_catalogo
+from api.services.diagnostico import (
+    planejar,
+    montar_secoes,
+    dependencias,
+    livros_por_titulo,
+    livros_por_titulo_stream,
+)
+from api.services.snapshots import resposta_snapshot
+from api.services.tentativas_login import metricas as metricas_login
 from rest_framework import status
 
 
@@ -17,6 +28,11 @@ class DiagnosticoView(APIView):
     """
     View para diagnóstico e análise de dados do sistema.
     Fornece estatísticas e verificações de consistência.
+
+    As estatísticas vêm de `services.diagnostico`: uma query de agregação por
+    tabela, executada apenas para as seções pedidas em `?tipo=`. O payload é
+    servido de um snapshot em cache (ver `services.snapshots`), com ETag e
+    Last-Modified.
     """
     permission_classes = [AllowAny]
     
@@ -26,145 +42,26 @@ class DiagnosticoView(APIView):
         Suporta parâmetros de consulta para filtrar dados específicos.
         
         Parâmetros:
-            - tipo: 'livros', 'associados', 'emprestimos' ou 'todos' (padrão)
+            - tipo: 'livros', 'associados', 'emprestimos' ou 'todos' (padrão);
+                    aceita vários valores separados por vírgula
         """
         tipo = request.query_params.get('tipo', 'todos')
-        
-        response_data = {}
-        
-        if tipo in ['livros', 'todos']:
-            response_data['livros'] = self._get_livros_stats()
-            
-        if tipo in ['associados', 'todos']:
-            response_data['associados'] = self._get_associados_stats()
-            
-        if tipo in ['emprestimos', 'todos']:
-            response_data['emprestimos'] = self._get_emprestimos_stats()
-            
-        # Adiciona verificações de consistência
-        if tipo == 'todos':
-            response_data['inconsistencias'] = self._check_inconsistencias()
-        
-        return Response(response_data, status=status.HTTP_200_OK)
-    
-    def _get_livros_stats(self):
-        """Retorna estatísticas detalhadas sobre livros"""
-        livros = Livro.objects.all()
-        
-        # Estatísticas básicas
-        stats = {
-            'count': livros.count(),
-            'disponiveis': livros.filter(status='DISPONIVEL').count(),
-            'emprestados': livros.filter(status='EMPRESTADO').count(),
-        }
-        
-        # Adiciona outros status se existirem no modelo
-        if livros.exists():
-            # Pega todos os status únicos presentes nos dados
-            status_counts = livros.values('status').annotate(total=Count('status'))
-            for item in status_counts:
-                if item['status'] and item['status'] not in ['DISPONIVEL', 'EMPRESTADO']:
-                    # Converte para minúsculas e substitui espaços por underscore
-                    status_key = item['status'].lower().replace(' ', '_')
-                    stats[status_key] = item['total']
-        
-        # Estatísticas por título
-        titulos_stats = []
-        for titulo_data in livros.values('titulo').annotate(
-            total=Count('id'),
-            disponiveis=Count('id', filter=Q(status='DISPONIVEL'))
-        ).order_by('titulo'):
-            if titulo_data['titulo']:  # Verifica se o título não é nulo
-                titulos_stats.append({
-                    'titulo': titulo_data['titulo'],
-                    'total_copias': titulo_data['total'],
-                    'copias_disponiveis': titulo_data['disponiveis']
-                })
-        
-        stats['por_titulo'] = titulos_stats
-        
-        return stats
-    
-    def _get_associados_stats(self):
-        """Retorna estatísticas detalhadas sobre associados"""
-        associados = Associado.objects.all()
-        
-        stats = {
-            'count': associados.count(),
-        }
-        
-        # Tenta obter campo ativo se existir
-        try:
-            if hasattr(Associado, 'ativo'):
-                stats['ativos'] = associados.filter(ativo=True).count()
-                stats['inativos'] = associados.filter(ativo=False).count()
-        except:
-            pass
-        
-        # CORREÇÃO: Usando o related_name correto 'emprestimos' (plural)
-        try:
-            stats['com_emprestimos'] = Associado.objects.filter(
-                emprestimos__isnull=False
-            ).distinct().count()
-        except:
-            stats['com_emprestimos'] = 0
-        
-        return stats
-    
-    def _get_emprestimos_stats(self):
-        """Retorna estatísticas detalhadas sobre empréstimos"""
-        emprestimos = Emprestimo.objects.all()
-        
-        stats = {
-            'count': emprestimos.count(),
-            'ativos': emprestimos.filter(data_devolucao__isnull=True).count(),
-            'devolvidos': emprestimos.filter(data_devolucao__isnull=False).count(),
-        }
-        
-        # Calcula empréstimos atrasados
-        try:
-            hoje = datetime.now().date()
-            stats['atrasados'] = emprestimos.filter(
-                data_devolucao__isnull=True,
-                data_prevista_devolucao__lt=hoje
-            ).count()
-        except:
-            stats['atrasados'] = 0
-        
-        return stats
-    
-    def _check_inconsistencias(self):
-        """Verifica inconsistências nos dados"""
-        inconsistencias = []
-        
-        # Verifica livros com status EMPRESTADO mas sem empréstimo ativo
+
         try:
-            livros_emprestados = Livro.objects.filter(status='EMPRESTADO')
-            
-            if livros_emprestados.exists():
-                emprestimos_ativos = Emprestimo.objects.filter(
-                    data_devolucao__isnull=True
-                ).values_list('livro_id', flat=True)
-                
-                livros_com_status_inconsistente = livros_emprestados.exclude(
-                    id__in=emprestimos_ativos
-                )
-                
-                for livro in livros_com_status_inconsistente:
-                    inconsistencias.append({
-                        'tipo': 'status_inconsistente',
-                        'descricao': f'Livro {livro.titulo} ({livro.id}) está marcado como EMPRESTADO mas não possui empréstimo ativo',
-                        'objeto': 'livro',
-                        'id': livro.id
-                    })
-        except Exception as e:
-            inconsistencias.append({
-                'tipo': 'erro_verificacao',
-                'descricao': f'Erro ao verificar inconsistências: {str(e)}',
-                'objeto': 'sistema'
-            })
-        
-        return inconsistencias
+            secoes = planejar(tipo)
+        except ValueError as exc:
+            return Response(
+                {'detail': f'Tipo de diagnóstico desconhecido: {exc}'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        return resposta_snapshot(
+            request,
+            'diagnostico',
+            dependencias(secoes),
+            lambda: montar_secoes(secoes),
+            parametros=','.join(secoes),
+        )
 
 
 class LivrosDiagnosticoView(APIView):
@@ -179,36 +76,103 @@ class LivrosDiagnosticoView(APIView):
         Retorna todos os livros agrupados por título.
         Cada título contém uma lista de ides das cópias.
         """
+        return responder_livros_por_titulo(request)
+
+
+def responder_livros_por_titulo(request):
+    """
+    Resposta comum de `/api/diagnostico/livros/` e `/api/livros/diagnostico/`.
+
+    Parâmetros:
+        - stream: '1'/'true' para gerar o JSON em pedaços, sem montar o
+                  payload em memória (não usa o snapshot em cache)
+    """
+    try:
+        if _parametro_bool(request, 'stream'):
+            return StreamingHttpResponse(
+                livros_por_titulo_stream(),
+                content_type='application/json; charset=utf-8',
+            )
+
+        return resposta_snapshot(
+            request, 'livros-por-titulo', ['livro'], livros_por_titulo
+        )
+
+    except Exception as e:
+        return Response({
+            'status': 'error',
+            'message': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class ReconciliarStatusView(APIView):
+    """
+    Corrige o status de todos os livros divergentes dos empréstimos ativos.
+    URL: POST /api/diagnostico/reconciliar/
+
+    Parâmetros (query string ou corpo):
+        - dry_run:  '1'/'true' para apenas listar as divergências
+        - limite:   número máximo de alterações devolvidas (padrão 500;
+                    0 devolve todas, como em `manage.py reconcile_status`)
+    """
+    permission_classes = [IsAuthenticated, IsStaff]
+
+    LIMITE_PADRAO = 500
+
+    def post(self, request):
+        dry_run = _parametro_bool(request, 'dry_run')
+
+        limite = _parametro(request, 'limite')
         try:
-            livros = Livro.objects.all().order_by('titulo', 'id')
-            result = {}
-            
-            for livro in livros:
-                if livro.titulo not in result:
-                    result[livro.titulo] = {
-                        'total_copias': 0,
-                        'copias_disponiveis': 0,
-                        'ides': []
-                    }
-                
-                result[livro.titulo]['ides'].append({
-                    'id': livro.id,
-                    'status': livro.status
-                })
-                result[livro.titulo]['total_copias'] += 1
-                
-                if livro.status == 'DISPONIVEL':
-                    result[livro.titulo]['copias_disponiveis'] += 1
-            
-            return Response({
-                'status': 'success',
-                'total_titulos': len(result),
-                'total_copias': livros.count(),
-                'dados': result
-            }, status=status.HTTP_200_OK)
-            
-        except Exception as e:
-            return Response({
-                'status': 'error',
-                'message': str(e)
-            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
\ No newline at end of file
+            limite = self.LIMITE_PADRAO if limite in (None, '') else int(limite)
+        except (TypeError, ValueError):
+            limite = -1
+        if limite < 0:
+            return Response(
+                {'detail': 'Parâmetro "limite" deve ser um inteiro não negativo.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        resultado = reconciliar_catalogo(dry_run=dry_run)
+
+        if not dry_run and resultado['corrigidos']:
+            audit_log(
+                action='CONSISTENCIA',
+                resource_type='livro',
+                user=request.user,
+                request=request,
+                message=f"Reconciliação de status corrigiu {resultado['corrigidos']} livro(s)",
+                details={'transicoes': resultado['transicoes']},
+            )
+
+        alteracoes = resultado['alteracoes']
+        if limite:
+            resultado['alteracoes'] = alteracoes[:limite]
+        resultado['truncado'] = bool(limite) and len(alteracoes) > limite
+
+        return Response(resultado, status=status.HTTP_200_OK)
+
+
+class MetricasAutenticacaoView(APIView):
+    """
+    Contadores de login: falhas, tentativas bloqueadas pelo backoff e sucessos.
+    URL: GET /api/diagnostico/autenticacao/
+    """
+    permission_classes = [IsAuthenticated, IsStaff]
+
+    def get(self, request):
+        return Response({'login': metricas_login()}, status=status.HTTP_200_OK)
+
+
+def _parametro(request, nome):
+    """Lê `nome` da query string ou, na falta, do corpo da requisição."""
+    if nome in request.query_params:
+        return request.query_params.get(nome)
+    return request.data.get(nome) if hasattr(request.data, 'get') else None
+
+
+def _parametro_bool(request, nome) -> bool:
+    valor = _parametro(request, nome)
+    if isinstance(valor, bool):
+        return valor
+    return str(valor).lower() in ('1', 'true', 'sim', 'yes')
@@ -3,14 +3,13 @@
 
     ViewSet para o modelo `Emprestimo`.
 
-    @version: 2.0
+    @version: 2.1
 """
 
-from datetime import timedelta
-
 from django.db import transaction
 from django.utils import timezone
 from django.core.exceptions import PermissionDenied
+from django.core.exceptions import ValidationError as DjangoValidationError
 
 from rest_framework import viewsets, filters, status
 from rest_framework.decorators import action
@@ -20,41 +19,35 @@ from rest_framework.response import Response
 
 from django_filters.rest_framework import DjangoFilterBackend
 
-from ..models import Emprestimo, Livro, Associado
-from ..serializers import EmprestimoSerializer
+from ..mixins import CamposEsparsosMixin, LeituraRapidaMixin, LoteIdsMixin
+from ..models import Emprestimo, Associado
+from ..pagination import PageNumberOrKeysetPagination
+from ..serializers import EmprestimoSerializer, EmprestimoLeituraSerializer
+from ..serializers.Leitura import colunas_nome_usuario
 from ..services.audit_log import audit_log
-
-DIAS_RENOVACAO = 7
+from ..services.emprestimos import emprestar, devolver, renovar
 
 
 # --------------------------------------------------------------------------- #
 #  Module-level helpers                                                        #
 # --------------------------------------------------------------------------- #
 
-def _get_associado(user) -> Associado:
+def _get_associado(request) -> Associado:
     """
-    Retorna o Associado vinculado ao usuário ou lança ValidationError.
-    Tenta o accessor reverso do OneToOneField antes de fazer uma query extra.
+    Retorna o Associado do usuário autenticado (`request.associado`, resolvido
+    uma única vez por requisição) ou lança ValidationError.
     """
-    try:
-        return user.associado
-    except Associado.DoesNotExist:
+    associado = request.associado
+    if not associado:
         raise ValidationError({"detail": "Usuário não vinculado a um associado."})
-
-
-def _lock_livro(livro_id: int) -> Livro:
-    """SELECT FOR UPDATE no livro, garantindo exclusividade dentro de uma transação."""
-    try:
-        return Livro.objects.select_for_update().get(pk=livro_id)
-    except Livro.DoesNotExist:
-        raise ValidationError({"livro": "Livro não encontrado."})
+    return associado
 
 
 # --------------------------------------------------------------------------- #
 #  ViewSet                                                                     #
 # --------------------------------------------------------------------------- #
 
-class EmprestimoViewSet(viewsets.ModelViewSet):
+class EmprestimoViewSet(CamposEsparsosMixin, LoteIdsMixin, LeituraRapidaMixin, viewsets.ModelViewSet):
     """
     ViewSet para gerenciar Empréstimos.
 
@@ -67,13 +60,38 @@ class EmprestimoViewSet(viewsets.ModelViewSet):
 
     Endpoints personalizados
     ------------------------
+    GET  /api/emprestimos/?ids=1,2,3       Vários empréstimos por id (ver `api/mixins.py`)
     GET  /api/emprestimos/ativos/          Empréstimos sem devolução
     GET  /api/emprestimos/atrasados/       Empréstimos vencidos e não devolvidos
     POST /api/emprestimos/{id}/devolver/   Devolução dedicada
     POST /api/emprestimos/{id}/renovar/    Renovação de prazo
+
+    Paginação
+    ---------
+    `?page=` por padrão; `?cursor=` ativa a paginação keyset, sem COUNT(*)
+    nem OFFSET (listagem, `ativos` e `atrasados`; ver `api/pagination.py`).
+
+    Leitura
+    -------
+    Listagem, `ativos` e `atrasados` usam `EmprestimoLeituraSerializer`
+    (`values()`, nomes calculados em SQL; ver `api/mixins.py`).
+
+    Campos
+    ------
+    `?fields=id,livro_titulo` / `?omit=...` reduzem a resposta e a consulta
+    (só os JOINs dos campos pedidos).
     """
 
     serializer_class = EmprestimoSerializer
+    leitura_serializer_class = EmprestimoLeituraSerializer
+    leitura_actions = ("list", "ativos", "atrasados")
+
+    campos_consulta = {
+        "associado_nome": colunas_nome_usuario("associado__user"),
+        "quem_emprestou_nome": colunas_nome_usuario("quem_emprestou__user"),
+        "quem_devolveu_nome": colunas_nome_usuario("quem_devolveu__user"),
+    }
+    pagination_class = PageNumberOrKeysetPagination
 
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ["livro", "associado"]
@@ -99,22 +117,23 @@ class EmprestimoViewSet(viewsets.ModelViewSet):
     @transaction.atomic
     def perform_create(self, serializer):
         """
-        Cria um empréstimo com lock otimista no livro.
+        Cria um empréstimo.
 
-        O SELECT FOR UPDATE garante que dois gerentes não emprestem o mesmo
-        exemplar simultaneamente.
+        Sem lock no livro: o índice parcial único `emprestimo_livro_ativo_unico`
+        impede que dois gerentes emprestem o mesmo exemplar simultaneamente
+        (ver `services.emprestimos.emprestar`).
         """
-        livro = _lock_livro(serializer.validated_data["livro"].pk)
+        livro = serializer.validated_data["livro"]
+        gerente = _get_associado(self.request)
 
-        if livro.status != Livro.Status.DISPONIVEL:
-            raise ValidationError({"livro": "Este livro não está disponível para empréstimo."})
+        try:
+            emprestimo = emprestar(
+                Emprestimo(**serializer.validated_data, quem_emprestou=gerente)
+            )
+        except DjangoValidationError as exc:
+            raise ValidationError({"livro": exc.messages})
 
-        gerente = _get_associado(self.request.user)
-
-        emprestimo = serializer.save(
-            data_emprestimo=timezone.now().date(),
-            quem_emprestou=gerente,
-        )
+        serializer.instance = emprestimo
 
         audit_log(
             action="EMPRESTIMO",
@@ -133,7 +152,7 @@ class EmprestimoViewSet(viewsets.ModelViewSet):
         Se `data_devolucao` for informada pela primeira vez, trata como
         devolução: atualiza quem_devolveu e libera o livro.
         """
-        instance = self.get_object()
+        instance = serializer.instance
 
         devolucao_antes = instance.data_devolucao
         devolucao_depois = serializer.validated_data.get("data_devolucao")
@@ -142,9 +161,18 @@ class EmprestimoViewSet(viewsets.ModelViewSet):
             raise ValidationError({"data_devolucao": "Este empréstimo já foi encerrado."})
 
         if devolucao_antes is None and devolucao_depois is not None:
-            serializer.validated_data["quem_devolveu"] = _get_associado(self.request.user)
+            # demais campos via serializer; a devolução em si passa pelo serviço
+            serializer.validated_data.pop("data_devolucao")
+            serializer.validated_data.pop("quem_devolveu", None)
             emprestimo = serializer.save()
-            Livro.objects.filter(pk=instance.livro.pk).update(status=Livro.Status.DISPONIVEL)
+            try:
+                devolver(
+                    emprestimo,
+                    quem_devolveu=_get_associado(self.request),
+                    data_devolucao=devolucao_depois,
+                )
+            except DjangoValidationError as exc:
+                raise ValidationError({"data_devolucao": exc.messages})
 
             audit_log(
                 action="DEVOLUCAO",
@@ -207,18 +235,16 @@ class EmprestimoViewSet(viewsets.ModelViewSet):
         POST /api/emprestimos/{id}/devolver/
         """
         emprestimo = self.get_object()
+        gerente = _get_associado(request)
 
-        if emprestimo.data_devolucao is not None:
+        try:
+            devolver(emprestimo, quem_devolveu=gerente)
+        except DjangoValidationError as exc:
             return Response(
-                {"detail": "Este empréstimo já foi devolvido."},
+                {"detail": exc.messages[0]},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        gerente = _get_associado(request.user)
-        emprestimo.data_devolucao = timezone.now().date()
-        emprestimo.quem_devolveu = gerente
-        emprestimo.save()  # save() do modelo atualiza o status do livro
-
         audit_log(
             action="DEVOLUCAO",
             resource_type="emprestimo",
@@ -240,16 +266,12 @@ class EmprestimoViewSet(viewsets.ModelViewSet):
         """
         emprestimo = self.get_object()
 
-        if emprestimo.data_devolucao is not None:
-            raise ValidationError(
-                {"emprestimo": "Este empréstimo já foi devolvido e não pode ser renovado."}
-            )
-
-        base = emprestimo.data_prevista or timezone.now().date()
-        nova_data = base + timedelta(days=DIAS_RENOVACAO)
+        try:
+            renovar(emprestimo)
+        except DjangoValidationError as exc:
+            raise ValidationError({"emprestimo": exc.messages})
 
-        emprestimo.data_prevista = nova_data
-        emprestimo.save()
+        nova_data = emprestimo.data_prevista
 
         audit_log(
             action="RENOVACAO",
@@ -262,13 +284,3 @@ class EmprestimoViewSet(viewsets.ModelViewSet):
         )
 
         return Response(self.get_serializer(emprestimo).data, status=status.HTTP_200_OK)
-
-    # ---------------------------------------------------------------------- #
-    #  Private helpers                                                         #
-    # ---------------------------------------------------------------------- #
-
-    def _paginated_response(self, queryset):
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            return self.get_paginated_response(self.get_serializer(page, many=True).data)
-        return Response(self.get_serializer(queryset, many=True).data)
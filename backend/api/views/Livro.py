@@ -3,7 +3,7 @@
 
     ViewSet para o modelo `Livro`.
 
-    @version: 3.0
+    @version: 3.1
 """
 
 from rest_framework import viewsets, filters, status
@@ -15,12 +15,16 @@ from django_filters.rest_framework import DjangoFilterBackend
 
 from ..models import Emprestimo, Livro
 from ..serializers import LivroSerializer
+from ..filters import UnaccentSearchFilter
+from ..mixins import CamposEsparsosMixin, LeituraRapidaMixin, LoteIdsMixin
+from ..pagination import PageNumberOrKeysetPagination
 from ..permissions import IsStaff
 from ..utils import generate_diff
 from ..services.audit_log import audit_log
+from .Diagnostico import responder_livros_por_titulo
 
 
-class LivroViewSet(viewsets.ModelViewSet):
+class LivroViewSet(CamposEsparsosMixin, LoteIdsMixin, LeituraRapidaMixin, viewsets.ModelViewSet):
     """
     ViewSet para entidade `Livro`.
 
@@ -29,17 +33,39 @@ class LivroViewSet(viewsets.ModelViewSet):
     Usuários autenticados           GET / list / retrieve / verificar / diagnostico
     Gerente / Administrador         POST / PATCH / PUT / DELETE
     Qualquer um (AllowAny)          GET diagnostico
+
+    Paginação
+    ---------
+    `?page=` por padrão; `?cursor=` ativa a paginação keyset (ver `api/pagination.py`).
+
+    Busca
+    -----
+    `?search=` ignora acentos e ordena por relevância (ver `api/filters.py`).
+
+    Campos
+    ------
+    `?fields=id,titulo` / `?omit=...` reduzem a resposta e a consulta; a
+    disponibilidade (subquery EXISTS) só é calculada quando
+    `pode_ser_emprestado` é pedido.
+
+    Lote
+    ----
+    `?ids=001,002,003-A` devolve vários livros em uma consulta, na ordem
+    pedida (ver `api/mixins.LoteIdsMixin`).
     """
 
-    queryset = Livro.objects.all().order_by("titulo")
+    queryset = Livro.objects.order_by("titulo")
     serializer_class = LivroSerializer
+    pagination_class = PageNumberOrKeysetPagination
 
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, filters.OrderingFilter, UnaccentSearchFilter]
     filterset_fields = ["status"]
     search_fields = ["titulo", "autor"]
     ordering_fields = ["titulo", "autor", "ano"]
     ordering = ["titulo"]
 
+    campos_consulta = {"pode_ser_emprestado": ("status",)}
+
     # ---------------------------------------------------------------------- #
     #  Permissions                                                             #
     # ---------------------------------------------------------------------- #
@@ -51,6 +77,16 @@ class LivroViewSet(viewsets.ModelViewSet):
             return [AllowAny()]
         return [IsAuthenticated()]
 
+    # ---------------------------------------------------------------------- #
+    #  Queryset                                                                #
+    # ---------------------------------------------------------------------- #
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.campo_pedido("pode_ser_emprestado"):
+            queryset = queryset.com_disponibilidade()
+        return queryset
+
     # ---------------------------------------------------------------------- #
     #  Perform overrides                                                       #
     # ---------------------------------------------------------------------- #
@@ -121,40 +157,12 @@ class LivroViewSet(viewsets.ModelViewSet):
     def diagnostico(self, request):
         """
         Agrupa todos os livros por título, mostrando cópias e status.
-        Público — não requer autenticação.
+        Público — não requer autenticação. Mesma resposta de
+        `/api/diagnostico/livros/` (aceita `?stream=1`).
 
         GET /api/livros/diagnostico/
         """
-        try:
-            livros = Livro.objects.all().order_by("titulo", "id")
-
-            result: dict = {}
-            for livro in livros:
-                entry = result.setdefault(livro.titulo, {
-                    "total_copias": 0,
-                    "copias_disponiveis": 0,
-                    "ides": [],
-                })
-                entry["ides"].append({"id": livro.id, "status": livro.status})
-                entry["total_copias"] += 1
-                if livro.status == Livro.Status.DISPONIVEL:
-                    entry["copias_disponiveis"] += 1
-
-            return Response(
-                {
-                    "status": "success",
-                    "total_titulos": len(result),
-                    "total_copias": livros.count(),
-                    "dados": result,
-                },
-                status=status.HTTP_200_OK,
-            )
-
-        except Exception as exc:  # noqa: BLE001
-            return Response(
-                {"status": "error", "message": str(exc)},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
+        return responder_livros_por_titulo(request)
 
     # ---------------------------------------------------------------------- #
     #  Custom actions — detail                                                 #
@@ -1,5 +1,7 @@
 from .Associado   import AssociadoViewSet
 from .Livro       import LivroViewSet
 from .Emprestimo  import EmprestimoViewSet
-from .Diagnostico import DiagnosticoView
+from .Auditoria   import AuditoriaViewSet
+from .Diagnostico import DiagnosticoView, LivrosDiagnosticoView, MetricasAutenticacaoView, ReconciliarStatusView
+from .Autocomplete import AutocompleteView
 from .Auth        import LoginView, LogoutView, RefreshView, MeView
\ No newline at end of file
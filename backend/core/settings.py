@@ -30,7 +30,7 @@ LOGGING = {
             "style": "{",
         },
         "json": {
-            "()": "pythonjsonlogger.jsonlogger.JsonFormatter",
+            "()": "api.log_handlers.ORJSONFormatter",
             "fmt": "%(asctime)s %(levelname)s %(name)s %(message)s",
         },
     },
@@ -41,12 +41,27 @@ LOGGING = {
             "formatter": "verbose",
         },
         "audit_file": {
-            "class": "logging.handlers.RotatingFileHandler",
+            # backups comprimidos e indexáveis (ver `manage.py audit_query`)
+            "class": "api.log_handlers.CompressingRotatingFileHandler",
             "filename": BASE_DIR / "logs" / "audit.log",
             "maxBytes": 10 * 1024 * 1024,  # 10 MB
             "backupCount": 5,
+            "encoding": "utf-8",
             "formatter": "json",
         },
+        # auditoria fora da thread da requisição (ver `api/log_handlers.py`)
+        "audit_queue": {
+            "class": "api.log_handlers.BoundedQueueHandler",
+            "target": "api.audit.sink",
+            "maxsize": 10000,
+            "overflow": "drop_oldest",
+        },
+        # tabela `AuditLog`, gravada em lotes (ver `api/log_handlers.py`)
+        "audit_db": {
+            "class": "api.log_handlers.DatabaseAuditHandler",
+            "capacity": 500,
+            "intervalo": 2.0,
+        },
     },
 
     "loggers": {
@@ -56,7 +71,13 @@ LOGGING = {
             "propagate": False,
         },
         "api.audit": {
-            "handlers": ["console", "audit_file"],
+            "handlers": ["audit_queue"],
+            "level": "INFO",
+            "propagate": False,
+        },
+        # destino da fila de auditoria; roda na thread do QueueListener
+        "api.audit.sink": {
+            "handlers": ["console", "audit_file", "audit_db"],
             "level": "INFO",
             "propagate": False,
         },
@@ -86,6 +107,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "corsheaders",
     "rest_framework",
     # ✅ Required for JWT token blacklisting (BLACKLIST_AFTER_ROTATION = True)
@@ -103,6 +125,16 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.IsAuthenticated",
     ),
+    # JSON via orjson, com o mesmo JSON do JSONRenderer (ver `api/renderers.py`)
+    "DEFAULT_RENDERER_CLASSES": (
+        "api.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "api.parsers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 10,
 }
@@ -119,8 +151,28 @@ SIMPLE_JWT = {
     "AUTH_COOKIE_SECURE": not DEBUG,    # HTTPS only in production
     "AUTH_COOKIE_HTTP_ONLY": True,      # JS cannot read the cookie
     "AUTH_COOKIE_SAMESITE": "Lax",
+    # opt-in: request.user montado das claims do access token, sem SELECT em auth_user
+    "AUTH_STATELESS_USER": os.environ.get("JWT_STATELESS_USER", "0") == "1",
 }
 
+#   cache (por processo) de `User.is_active` usado no modo AUTH_STATELESS_USER
+JWT_USUARIOS_ATIVOS_CACHE_TTL = 30
+JWT_USUARIOS_ATIVOS_CACHE_TAMANHO = 4096
+
+#   cabeçalho (chave de request.META) com o IP do cliente, preenchido por um
+#   proxy confiável; vazio = REMOTE_ADDR. Nunca X-Forwarded-For, que o
+#   cliente controla (ver `services.audit_log.get_client_ip`)
+CLIENT_IP_HEADER = os.environ.get("DJANGO_CLIENT_IP_HEADER", "")
+
+#   backoff de login por escopo (sobrepõe `services.tentativas_login.POLITICA_PADRAO`)
+LOGIN_BACKOFF = {
+    "usuario": {"livres": 5, "base": 2, "maximo": 15 * 60},
+    "ip": {"livres": 20, "base": 2, "maximo": 15 * 60},
+}
+
+#   janela (s) em que refreshes concorrentes do mesmo token recebem o mesmo sucessor
+JWT_REFRESH_COALESCENCIA = 30
+
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -129,6 +181,8 @@ MIDDLEWARE = [
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    # request.associado, resolvido no máximo uma vez por requisição
+    "api.middleware.AssociadoMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
 ]
 
@@ -192,6 +246,44 @@ else:
         }
     }
 
+#   cache: precisa ser compartilhado entre os workers do gunicorn (e entre as
+#   máquinas), pois guarda os contadores de geração dos snapshots de
+#   diagnóstico. Fora de DEBUG o padrão é a tabela `django_cache`
+#   (`python manage.py createcachetable`, no release_command do fly.toml);
+#   DJANGO_CACHE_DIR usa arquivos, compartilhados apenas dentro de uma máquina.
+#   Memória local só em DEBUG (ver `api/checks.py`).
+CACHE_DIR = os.environ.get("DJANGO_CACHE_DIR")
+
+if CACHE_DIR:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": CACHE_DIR,
+        }
+    }
+elif not DEBUG:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+            "LOCATION": "django_cache",
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "sala-de-leitura",
+        }
+    }
+
+#   validade máxima (s) de um snapshot de diagnóstico; a invalidação normal é
+#   feita pelos contadores de geração em `api/services/snapshots.py`
+DIAGNOSTICO_SNAPSHOT_TIMEOUT = 3600
+
+#   cache em memória (por processo) das sugestões de `/api/autocomplete/`
+AUTOCOMPLETE_CACHE_TTL = 15
+AUTOCOMPLETE_CACHE_TAMANHO = 2048
+
 LANGUAGE_CODE = "pt-br"
 TIME_ZONE = "America/Sao_Paulo"
 USE_I18N = True
@@ -7,6 +7,9 @@ chmod 755 /app/logs
 # Executa migrações do banco de dados
 python manage.py migrate --noinput
 
+# Tabela do cache compartilhado (sem efeito com cache em memória/arquivo)
+python manage.py createcachetable
+
 # Coleta arquivos estáticos (se estiver usando)
 python manage.py collectstatic --noinput --clear || true
 